@@ -0,0 +1,12 @@
+"""
+Offline benchmarks for DeepReader.
+
+Run from the repository root, e.g. ``python -m benchmarks.bench_pipeline --sizes 10000``.
+"""
+import sys
+from pathlib import Path
+
+# Make the package importable without an editable install (same trick as tests/manual_test_llm.py)
+_SRC = str(Path(__file__).resolve().parent.parent / "src")
+if _SRC not in sys.path:
+    sys.path.insert(0, _SRC)
@@ -0,0 +1,101 @@
+"""
+Digest delivery benchmark against a local SMTP sink.
+
+Renders one digest per subscriber and sends them either with a new SMTP
+session per message (the old behaviour) or through `SmtpOutbox`, which keeps
+one session open. `--latency` adds a delay to every SMTP command to mimic a
+remote server, which is where session reuse pays off.
+
+Examples:
+    python -m benchmarks.bench_mail --messages 500 --latency 0.002
+    python -m benchmarks.bench_mail --messages 200 --drop-after 50 --output mail.json
+"""
+import argparse
+import json
+import platform
+import smtplib
+import sys
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from benchmarks.smtp_sink import SmtpSink
+from benchmarks.synthetic import SyntheticCorpus
+from deep_reader.notifier.email_service import EmailNotifier
+from deep_reader.notifier.outbox import SmtpOutbox
+
+
+def build_messages(count: int, papers_per_digest: int) -> list:
+    notifier = EmailNotifier()
+    papers = list(SyntheticCorpus(papers_per_digest))
+    return [
+        notifier._build_message(f"reader{i}@example.com", "DeepReader Daily Digest", "Daily Research Papers", papers)
+        for i in range(count)
+    ]
+
+
+def send_per_session(sink: SmtpSink, messages: list):
+    for msg in messages:
+        with smtplib.SMTP("127.0.0.1", sink.port) as server:
+            server.send_message(msg, from_addr="bench@example.com")
+
+
+def send_outbox(sink: SmtpSink, messages: list, spool_dir: Optional[str] = None):
+    with SmtpOutbox("127.0.0.1", sink.port, starttls=False, spool_dir=spool_dir, backoff_seconds=0) as outbox:
+        outbox.send(messages)
+
+
+def run(args: argparse.Namespace) -> Dict[str, Dict[str, float]]:
+    t0 = time.perf_counter()
+    messages = build_messages(args.messages, args.papers)
+    for msg in messages:
+        msg.replace_header("From", "bench@example.com")
+    render_seconds = time.perf_counter() - t0
+
+    results = {"render": {"seconds": render_seconds, "per_sec": len(messages) / render_seconds}}
+    for name, send in (("per_session", send_per_session), ("outbox", send_outbox)):
+        with SmtpSink(drop_after=args.drop_after, latency=args.latency) as sink:
+            t0 = time.perf_counter()
+            send(sink, messages)
+            elapsed = time.perf_counter() - t0
+            results[name] = {
+                "seconds": elapsed,
+                "per_sec": len(messages) / elapsed,
+                "delivered": len(sink.messages),
+                "connections": sink.connections,
+            }
+    return results
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="DeepReader digest delivery benchmark")
+    parser.add_argument("--messages", type=int, default=200, help="Digests to send")
+    parser.add_argument("--papers", type=int, default=20, help="Papers per digest")
+    parser.add_argument("--latency", type=float, default=0.0, help="Seconds the sink waits before each reply")
+    parser.add_argument("--drop-after", type=int, default=None, help="Sink hangs up after this many messages per session")
+    parser.add_argument("--output", type=str, default=None, help="Write results JSON to this file")
+    args = parser.parse_args(argv)
+
+    results = run(args)
+    for name, r in results.items():
+        extra = f"  delivered {r['delivered']:5d}  connections {r['connections']:5d}" if "delivered" in r else ""
+        print(f"{name:12s} {r['seconds'] * 1000:9.1f} ms  {r['per_sec']:9.1f} msg/s{extra}", file=sys.stderr)
+
+    if args.output:
+        document = {
+            "meta": {
+                "created_at": datetime.now(timezone.utc).isoformat(),
+                "python": platform.python_version(),
+                "platform": platform.platform(),
+                "args": vars(args),
+            },
+            "results": results,
+        }
+        Path(args.output).write_text(json.dumps(document, indent=2))
+        print(f"Results written to {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
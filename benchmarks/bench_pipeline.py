@@ -0,0 +1,228 @@
+"""
+Storage and ingest pipeline benchmarks.
+
+Examples:
+    python -m benchmarks.bench_pipeline --sizes 10000 100000 --output bench.json
+    python -m benchmarks.bench_pipeline --sizes 10000 --baseline bench.json
+"""
+import argparse
+import contextlib
+import io
+import json
+import platform
+import random
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from benchmarks.synthetic import FakeArxivCollector, FakeLLMClient, FakeNotifier, SyntheticCorpus
+from deep_reader.core_loop import run_daily_cycle
+from deep_reader.storage.db_manager import DatabaseManager
+
+# Metrics where a larger number is better; everything else is a latency/duration.
+HIGHER_IS_BETTER = ("per_sec",)
+
+
+def percentiles(samples: List[float]) -> Dict[str, float]:
+    """Summarizes latency samples (seconds) as milliseconds."""
+    ordered = sorted(samples)
+
+    def pick(q: float) -> float:
+        return ordered[min(len(ordered) - 1, int(q * len(ordered)))] * 1000
+
+    return {
+        "count": len(ordered),
+        "mean_ms": statistics.fmean(ordered) * 1000,
+        "p50_ms": pick(0.50),
+        "p90_ms": pick(0.90),
+        "p99_ms": pick(0.99),
+        "max_ms": ordered[-1] * 1000,
+    }
+
+
+def time_calls(fn: Callable[[], object], repeat: int) -> Dict[str, float]:
+    samples = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - t0)
+    return percentiles(samples)
+
+
+def bench_bulk_ingest(db: DatabaseManager, corpus: SyntheticCorpus, batch_size: int) -> Dict[str, float]:
+    t0 = time.perf_counter()
+    written = db.save_papers(corpus.papers(), batch_size=batch_size)
+    elapsed = time.perf_counter() - t0
+    return {
+        "papers": written,
+        "seconds": elapsed,
+        "papers_per_sec": written / elapsed if elapsed else 0.0,
+        "db_bytes": Path(db.db_path).stat().st_size,
+    }
+
+
+def bench_get_paper(db: DatabaseManager, corpus: SyntheticCorpus, repeat: int, seed: int) -> Dict[str, float]:
+    rng = random.Random(seed)
+    ids = [corpus.arxiv_id(rng.randrange(corpus.size)) for _ in range(repeat)]
+    it = iter(ids)
+    hits = time_calls(lambda: db.get_paper(next(it)), repeat)
+    missing = time_calls(lambda: db.get_paper("0000.0000000"), max(1, repeat // 10))
+    return {"hit": hits, "miss": missing}
+
+
+def bench_queries(db: DatabaseManager, corpus: SyntheticCorpus, repeat: int) -> Dict[str, Dict[str, float]]:
+    mid = corpus.paper(corpus.size // 2).published_date.strftime("%Y-%m-%d")
+    late = corpus.paper(corpus.size * 9 // 10).published_date.strftime("%Y-%m-%d")
+    deep_offset = max(0, corpus.size - 20)
+
+    cases = {
+        "list_first_page": lambda: db.get_recent_papers(limit=20),
+        "list_deep_offset": lambda: db.get_recent_papers(limit=20, offset=deep_offset),
+        "list_topic": lambda: db.get_recent_papers(limit=20, topic="diffusion model"),
+        "list_category": lambda: db.get_recent_papers(limit=20, topic="cs.CL"),
+        "list_date_range": lambda: db.get_recent_papers(limit=20, start_date=mid, end_date=late),
+        "count_all": lambda: db.count_papers(),
+        "count_topic": lambda: db.count_papers_filtered(topic="diffusion model"),
+        "count_date_range": lambda: db.count_papers_filtered(start_date=mid, end_date=late),
+        "count_category": lambda: db.count_papers_filtered(category="cs.CL"),
+        "facets_all": lambda: db.get_facets(),
+        "facets_category": lambda: db.get_facets(category="cs.CL", start_date=mid),
+        "facets_topic": lambda: db.get_facets(topic="diffusion model"),
+    }
+    return {name: time_calls(fn, repeat) for name, fn in cases.items()}
+
+
+def bench_full_cycle(
+    db: DatabaseManager,
+    corpus: SyntheticCorpus,
+    fetch_size: int,
+    fetch_latency: float,
+    llm_latency: float,
+) -> Dict[str, float]:
+    # Half of the fetched window is already in the vault, half is new.
+    start = max(0, corpus.size - fetch_size // 2)
+    collector = FakeArxivCollector(corpus, start=start, limit=fetch_size, latency=fetch_latency)
+    llm = FakeLLMClient(latency=llm_latency)
+    notifier = FakeNotifier()
+
+    t0 = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        run_daily_cycle(query="cat:cs.AI", collector=collector, db=db, notifier=notifier, llm=llm)
+    elapsed = time.perf_counter() - t0
+
+    return {
+        "fetched": fetch_size,
+        "llm_calls": llm.calls,
+        "notified": sum(len(batch) for batch in notifier.sent),
+        "seconds": elapsed,
+        "papers_per_sec": fetch_size / elapsed if elapsed else 0.0,
+    }
+
+
+def run_suite(size: int, workdir: Path, args: argparse.Namespace) -> Dict[str, object]:
+    corpus = SyntheticCorpus(size, seed=args.seed)
+    db = DatabaseManager(db_path=str(workdir / f"bench_{size}.db"))
+
+    print(f"[{size}] bulk ingest...", file=sys.stderr)
+    result: Dict[str, object] = {"bulk_ingest": bench_bulk_ingest(db, corpus, args.batch_size)}
+    print(f"[{size}] get_paper...", file=sys.stderr)
+    result["get_paper"] = bench_get_paper(db, corpus, args.repeat * 10, args.seed)
+    print(f"[{size}] list/count queries...", file=sys.stderr)
+    result["queries"] = bench_queries(db, corpus, args.repeat)
+    print(f"[{size}] full cycle...", file=sys.stderr)
+    result["full_cycle"] = bench_full_cycle(db, corpus, args.fetch_size, args.fetch_latency, args.llm_latency)
+    return result
+
+
+def flatten(results: Dict[str, object], prefix: str = "") -> Dict[str, float]:
+    flat = {}
+    for key, value in results.items():
+        name = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            flat.update(flatten(value, name))
+        elif isinstance(value, (int, float)):
+            flat[name] = float(value)
+    return flat
+
+
+def compare(current: Dict[str, object], baseline: Dict[str, object], threshold: float) -> List[str]:
+    """
+    Compares two result documents and returns the metrics that regressed by more than `threshold`.
+
+    Only timing (`*_ms`, `seconds`) and throughput (`*_per_sec`) metrics are compared.
+    """
+    cur = flatten(current["results"])
+    base = flatten(baseline["results"])
+    regressions = []
+    for name, value in sorted(cur.items()):
+        if name not in base or not base[name]:
+            continue
+        leaf = name.rsplit(".", 1)[-1]
+        if leaf.endswith(HIGHER_IS_BETTER):
+            ratio = base[name] / value if value else float("inf")
+        elif leaf.endswith("_ms") or leaf == "seconds":
+            ratio = value / base[name]
+        else:
+            continue
+        marker = "REGRESSION" if ratio > threshold else ""
+        print(f"{name:70s} {base[name]:12.3f} -> {value:12.3f}  x{ratio:5.2f} {marker}")
+        if ratio > threshold:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="DeepReader storage/ingest benchmarks")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000], help="Corpus sizes to benchmark")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--batch-size", type=int, default=1000, help="Papers per transaction during bulk ingest")
+    parser.add_argument("--repeat", type=int, default=20, help="Repetitions per query benchmark")
+    parser.add_argument("--fetch-size", type=int, default=200, help="Papers returned by the fake collector")
+    parser.add_argument("--fetch-latency", type=float, default=0.0, help="Seconds per fake arXiv fetch")
+    parser.add_argument("--llm-latency", type=float, default=0.0, help="Seconds per fake LLM call")
+    parser.add_argument("--workdir", type=str, default=None, help="Directory for benchmark databases (default: temp)")
+    parser.add_argument("--output", type=str, default=None, help="Write results JSON to this file")
+    parser.add_argument("--baseline", type=str, default=None, help="Compare against a previous results JSON")
+    parser.add_argument("--threshold", type=float, default=1.2, help="Slowdown ratio reported as a regression")
+    args = parser.parse_args(argv)
+
+    document = {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "sqlite": sqlite3.sqlite_version,
+            "platform": platform.platform(),
+            "args": vars(args),
+        },
+        "results": {},
+    }
+
+    with tempfile.TemporaryDirectory() as tmp:
+        workdir = Path(args.workdir or tmp)
+        workdir.mkdir(parents=True, exist_ok=True)
+        for size in args.sizes:
+            document["results"][str(size)] = run_suite(size, workdir, args)
+
+    text = json.dumps(document, indent=2)
+    if args.output:
+        Path(args.output).write_text(text)
+        print(f"Results written to {args.output}", file=sys.stderr)
+    else:
+        print(text)
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        regressions = compare(document, baseline, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} metric(s) regressed beyond x{args.threshold}", file=sys.stderr)
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+"""
+Cold-start benchmark: import time and peak RSS of the CLI and the API server.
+
+Every sample runs in a fresh interpreter, so nothing is shared through
+`sys.modules` or the OS page cache of an already warm process.
+
+Examples:
+    python -m benchmarks.bench_startup --output startup.json
+    python -m benchmarks.bench_startup --baseline startup.json
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from benchmarks.bench_pipeline import compare
+
+SRC = str(Path(__file__).resolve().parent.parent / "src")
+
+# Modules a read-only API worker should not need to load
+HEAVY_MODULES = ["google.generativeai", "grpc", "openai", "arxiv", "smtplib", "apscheduler"]
+
+SCENARIOS = {
+    "interpreter": "pass",
+    "cli": "import deep_reader.main",
+    "server": "import deep_reader.server.app",
+    "ingest": "import deep_reader.core_loop",
+}
+
+# ru_maxrss survives exec() on Linux (it would report the benchmark driver's peak),
+# so prefer the per-address-space high-water mark from /proc when available.
+PROBE = """
+import json, resource, sys, time
+t0 = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - t0
+try:
+    with open("/proc/self/status") as f:
+        maxrss = next(int(line.split()[1]) for line in f if line.startswith("VmHWM:"))
+except (OSError, StopIteration):
+    maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{
+    "import_seconds": elapsed,
+    "maxrss_kb": maxrss,
+    "modules": len(sys.modules),
+    "heavy_loaded": [m for m in {heavy!r} if m in sys.modules],
+}}))
+"""
+
+
+def measure(statement: str, repeat: int) -> Dict[str, object]:
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, [SRC, os.environ.get("PYTHONPATH")]))}
+    code = PROBE.format(statement=statement, heavy=HEAVY_MODULES)
+    walls, imports, rss = [], [], []
+    probe = {}
+    # Importing the server opens its vault; keep that out of the working tree
+    with tempfile.TemporaryDirectory() as tmp:
+        env["DEEP_READER_DB"] = os.path.join(tmp, "startup.db")
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            out = subprocess.run([sys.executable, "-W", "ignore", "-c", code], env=env, cwd=tmp,
+                                 capture_output=True, text=True, check=True).stdout
+            walls.append(time.perf_counter() - t0)
+            probe = json.loads(out.strip().splitlines()[-1])
+            imports.append(probe["import_seconds"])
+            rss.append(probe["maxrss_kb"])
+    return {
+        "process_ms": statistics.median(walls) * 1000,
+        "import_ms": statistics.median(imports) * 1000,
+        "maxrss_kb": statistics.median(rss),
+        "modules": probe["modules"],
+        "heavy_loaded": probe["heavy_loaded"],
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="DeepReader cold-start benchmark")
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per scenario (median is reported)")
+    parser.add_argument("--output", type=str, default=None, help="Write results JSON to this file")
+    parser.add_argument("--baseline", type=str, default=None, help="Compare against a previous results JSON")
+    parser.add_argument("--threshold", type=float, default=1.2, help="Slowdown ratio reported as a regression")
+    args = parser.parse_args(argv)
+
+    results = {}
+    for name, statement in SCENARIOS.items():
+        results[name] = measure(statement, args.repeat)
+        r = results[name]
+        print(f"{name:12s} process {r['process_ms']:8.1f} ms  import {r['import_ms']:8.1f} ms  "
+              f"rss {r['maxrss_kb'] / 1024:6.1f} MiB  modules {r['modules']:5d}  heavy {r['heavy_loaded']}",
+              file=sys.stderr)
+
+    document = {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "args": vars(args),
+        },
+        "results": results,
+    }
+    if args.output:
+        Path(args.output).write_text(json.dumps(document, indent=2))
+        print(f"Results written to {args.output}", file=sys.stderr)
+
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text())
+        if compare(document, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
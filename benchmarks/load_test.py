@@ -0,0 +1,295 @@
+"""
+HTTP load-testing harness for the DeepReader API.
+
+Boots `deep_reader.server.app` with uvicorn on 127.0.0.1 against a seeded SQLite
+vault and drives a mixed workload at a fixed arrival rate (open loop). Latency is
+measured from each request's scheduled start, so queueing delay under overload is
+included in the percentiles instead of hidden by slower request issuing.
+
+Examples:
+    python -m benchmarks.load_test --papers 100000 --rate 200 --duration 30
+    python -m benchmarks.load_test --mix list=60,detail=40 --rate 500 --output load.json
+"""
+import argparse
+import contextlib
+import functools
+import http.client
+import io
+import json
+import os
+import random
+import socket
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlencode
+
+from benchmarks.bench_pipeline import percentiles
+from benchmarks.synthetic import TOPIC_WORDS, FakeArxivCollector, FakeLLMClient, FakeNotifier, SyntheticCorpus
+from deep_reader.storage.db_manager import DatabaseManager
+
+HOST = "127.0.0.1"
+
+DEFAULT_MIX = "list=45,deep=10,search=20,detail=20,trigger=5"
+
+# A request is (method, path, json body or None)
+Request = Tuple[str, str, Optional[dict]]
+
+
+class Workload:
+    """Builds randomized requests for each endpoint class of the mix."""
+
+    def __init__(self, corpus: SyntheticCorpus, seed: int = 0):
+        self.corpus = corpus
+        self.rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.builders: Dict[str, Callable[[], Request]] = {
+            "list": self.list_page,
+            "deep": self.deep_offset,
+            "search": self.topic_search,
+            "detail": self.detail,
+            "trigger": self.trigger,
+        }
+
+    def next(self, kind: str) -> Request:
+        with self._lock:
+            return self.builders[kind]()
+
+    def list_page(self) -> Request:
+        offset = 20 * self.rng.randrange(5)
+        return "GET", f"/api/papers?{urlencode({'limit': 20, 'offset': offset})}", None
+
+    def deep_offset(self) -> Request:
+        offset = self.rng.randrange(max(1, self.corpus.size - 20))
+        return "GET", f"/api/papers?{urlencode({'limit': 20, 'offset': offset})}", None
+
+    def topic_search(self) -> Request:
+        topic = " ".join(self.rng.sample(TOPIC_WORDS, self.rng.choice([1, 2])))
+        return "GET", f"/api/papers?{urlencode({'limit': 20, 'topic': topic})}", None
+
+    def detail(self) -> Request:
+        # ~10% misses exercise the 404 path
+        if self.rng.random() < 0.1:
+            return "GET", "/api/papers/0000.0000000", None
+        return "GET", f"/api/papers/{self.corpus.arxiv_id(self.rng.randrange(self.corpus.size))}", None
+
+    def trigger(self) -> Request:
+        return "POST", "/api/trigger", {"days": 1, "topic": self.rng.choice(TOPIC_WORDS)}
+
+
+def parse_mix(spec: str) -> Dict[str, float]:
+    mix = {}
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        mix[name.strip()] = float(weight or 1)
+    return mix
+
+
+def seed_vault(db_path: Path, corpus: SyntheticCorpus) -> DatabaseManager:
+    db = DatabaseManager(db_path=str(db_path))
+    existing = db.count_papers()
+    if existing < corpus.size:
+        print(f"Seeding {corpus.size - existing} papers into {db_path}...", file=sys.stderr)
+        db.save_papers(corpus.papers(start=existing))
+    return db
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind((HOST, 0))
+        return s.getsockname()[1]
+
+
+@contextlib.contextmanager
+def running_server(db: DatabaseManager, corpus: SyntheticCorpus, port: int, llm_latency: float):
+    """
+    Runs the API in a background thread for the duration of the `with` block.
+
+    The app module's globals and `DEEP_READER_DB` are pointed at the benchmark
+    vault while it runs and restored afterwards, so a harness started inside
+    another process (e.g. the test suite) leaves no trace behind.
+    """
+    import uvicorn
+
+    # The module-level DatabaseManager is created at import time, so point it at the vault first
+    saved_env = os.environ.get("DEEP_READER_DB")
+    os.environ["DEEP_READER_DB"] = db.db_path
+    from deep_reader.server import app as app_module
+    from deep_reader.core_loop import run_daily_cycle
+    from deep_reader.recommender.engine import RecommendationEngine
+
+    saved_globals = {"db_manager": app_module.db_manager, "run_cycle_job": app_module.run_cycle_job}
+    app_module.db_manager = db
+
+    # Triggers run the real cycle against in-process fakes so nothing leaves localhost
+    collector = FakeArxivCollector(corpus, start=max(0, corpus.size - 10), limit=20)
+
+    app_module.run_cycle_job = functools.partial(
+        run_daily_cycle, collector=collector, db=db, notifier=FakeNotifier(), llm=FakeLLMClient(latency=llm_latency),
+        recommender=RecommendationEngine(db),
+    )
+
+    server = thread = None
+    try:
+        config = uvicorn.Config(app_module.app, host=HOST, port=port, log_level="warning", access_log=False)
+        server = uvicorn.Server(config)
+        thread = threading.Thread(target=server.run, daemon=True)
+        thread.start()
+        deadline = time.monotonic() + 10
+        while not server.started:
+            if time.monotonic() > deadline:
+                raise RuntimeError("API server did not start within 10 seconds")
+            time.sleep(0.05)
+        yield server
+    finally:
+        if server is not None:
+            server.should_exit = True
+            thread.join(timeout=10)
+        for name, value in saved_globals.items():
+            setattr(app_module, name, value)
+        if saved_env is None:
+            os.environ.pop("DEEP_READER_DB", None)
+        else:
+            os.environ["DEEP_READER_DB"] = saved_env
+
+
+class LoadGenerator:
+    """Issues requests at a fixed arrival rate from a pool of keep-alive connections."""
+
+    def __init__(self, port: int, workload: Workload, mix: Dict[str, float], concurrency: int, seed: int = 0):
+        self.port = port
+        self.workload = workload
+        self.kinds = list(mix)
+        self.weights = list(mix.values())
+        self.concurrency = concurrency
+        self.rng = random.Random(seed)
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.samples: Dict[str, List[float]] = {kind: [] for kind in self.kinds}
+        self.errors: Dict[str, int] = {kind: 0 for kind in self.kinds}
+
+    def _connection(self) -> http.client.HTTPConnection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = http.client.HTTPConnection(HOST, self.port, timeout=30)
+            self._local.conn = conn
+        return conn
+
+    def _send(self, kind: str, scheduled: float):
+        method, path, body = self.workload.next(kind)
+        payload = json.dumps(body).encode() if body is not None else None
+        headers = {"Content-Type": "application/json"} if payload else {}
+        ok = False
+        for _ in range(2):
+            conn = self._connection()
+            try:
+                conn.request(method, path, body=payload, headers=headers)
+                response = conn.getresponse()
+                response.read()
+                ok = response.status < 500 and (response.status != 404 or kind == "detail")
+                break
+            except (http.client.HTTPException, OSError):
+                # Stale keep-alive connection; reconnect once
+                conn.close()
+                self._local.conn = None
+        latency = time.perf_counter() - scheduled
+        with self._lock:
+            self.samples[kind].append(latency)
+            if not ok:
+                self.errors[kind] += 1
+
+    def run(self, rate: float, duration: float) -> float:
+        """Runs the open-loop schedule and returns the wall-clock seconds taken."""
+        total = int(rate * duration)
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            for i in range(total):
+                scheduled = start + i / rate
+                delay = scheduled - time.perf_counter()
+                if delay > 0:
+                    time.sleep(delay)
+                kind = self.rng.choices(self.kinds, weights=self.weights)[0]
+                pool.submit(self._send, kind, scheduled)
+        return time.perf_counter() - start
+
+    def report(self, elapsed: float) -> Dict[str, dict]:
+        endpoints = {}
+        for kind in self.kinds:
+            samples = self.samples[kind]
+            if not samples:
+                continue
+            endpoints[kind] = {
+                **percentiles(samples),
+                "errors": self.errors[kind],
+                "throughput_per_sec": len(samples) / elapsed,
+            }
+        all_samples = [s for samples in self.samples.values() for s in samples]
+        overall = {
+            **(percentiles(all_samples) if all_samples else {"count": 0}),
+            "errors": sum(self.errors.values()),
+            "throughput_per_sec": len(all_samples) / elapsed if elapsed else 0.0,
+        }
+        return {"overall": overall, "endpoints": endpoints}
+
+
+def print_table(report: Dict[str, dict]):
+    print(f"{'endpoint':10s} {'count':>7s} {'err':>5s} {'rps':>8s} {'p50 ms':>9s} {'p90 ms':>9s} {'p99 ms':>9s} {'max ms':>9s}",
+          file=sys.stderr)
+    rows = list(report["endpoints"].items()) + [("overall", report["overall"])]
+    for name, r in rows:
+        if not r.get("count"):
+            continue
+        print(f"{name:10s} {r['count']:7d} {r['errors']:5d} {r['throughput_per_sec']:8.1f} "
+              f"{r['p50_ms']:9.2f} {r['p90_ms']:9.2f} {r['p99_ms']:9.2f} {r['max_ms']:9.2f}", file=sys.stderr)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="DeepReader API load test (localhost only)")
+    parser.add_argument("--papers", type=int, default=10_000, help="Size of the seeded vault")
+    parser.add_argument("--db", type=str, default=None, help="Vault path (seeded if smaller than --papers; default: temp)")
+    parser.add_argument("--rate", type=float, default=50.0, help="Target requests per second")
+    parser.add_argument("--duration", type=float, default=10.0, help="Seconds of load")
+    parser.add_argument("--concurrency", type=int, default=32, help="Client worker threads / connections")
+    parser.add_argument("--mix", type=str, default=DEFAULT_MIX, help="Weighted endpoint mix, e.g. list=50,detail=50")
+    parser.add_argument("--llm-latency", type=float, default=0.05, help="Seconds per fake LLM call during triggers")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", type=str, default=None, help="Write results JSON to this file")
+    args = parser.parse_args(argv)
+
+    mix = parse_mix(args.mix)
+    corpus = SyntheticCorpus(args.papers, seed=args.seed)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = Path(args.db) if args.db else Path(tmp) / "load_vault.db"
+        db = seed_vault(db_path, corpus)
+        port = free_port()
+        # Cycle progress is printed to stdout by the triggered jobs; keep it out of the report
+        with contextlib.redirect_stdout(io.StringIO()):
+            with running_server(db, corpus, port, args.llm_latency):
+                generator = LoadGenerator(port, Workload(corpus, args.seed), mix, args.concurrency, args.seed)
+                print(f"Driving {args.rate:g} req/s for {args.duration:g}s against http://{HOST}:{port}...", file=sys.stderr)
+                elapsed = generator.run(args.rate, args.duration)
+
+    report = generator.report(elapsed)
+    print_table(report)
+    document = {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "args": vars(args),
+            "target_rate": args.rate,
+        },
+        "results": report,
+    }
+    if args.output:
+        Path(args.output).write_text(json.dumps(document, indent=2))
+        print(f"Results written to {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
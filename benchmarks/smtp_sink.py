@@ -0,0 +1,148 @@
+"""
+A local SMTP server that accepts and keeps every message, for tests and benchmarks.
+
+Supports the commands `smtplib` uses for plain sessions (no STARTTLS or AUTH),
+plus fault injection: dropping connections after a number of messages,
+answering with transient errors, and per-command latency to mimic a remote server.
+"""
+import socketserver
+import threading
+import time
+from typing import List, Optional, Tuple
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    server: "_Server"
+
+    def reply(self, line: str):
+        self.wfile.write(line.encode("ascii") + b"\r\n")
+
+    def handle(self):
+        sink = self.server.sink
+        with sink.lock:
+            sink.connections += 1
+        self.reply("220 sink ESMTP ready")
+        sender, recipients, accepted = None, [], 0
+
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            if sink.latency:
+                time.sleep(sink.latency)
+            command = line.decode("ascii", "replace").strip()
+            verb = command[:4].upper()
+
+            if verb == "EHLO":
+                self.reply("250-sink")
+                self.reply("250 8BITMIME")
+            elif verb == "HELO":
+                self.reply("250 sink")
+            elif verb == "MAIL":
+                sender, recipients = command[10:].strip(), []
+                self.reply("250 OK")
+            elif verb == "RCPT":
+                address = command[8:].strip()
+                if address.strip("<>") in sink.refuse:
+                    self.reply("550 No such user")
+                elif address.strip("<>") in sink.defer:
+                    self.reply("450 Mailbox busy")
+                else:
+                    recipients.append(address)
+                    self.reply("250 OK")
+            elif verb == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                data = self.read_data()
+                if data is None:
+                    return
+                with sink.lock:
+                    drop = sink.drop_after is not None and accepted >= sink.drop_after
+                    fail = sink.fail_next > 0
+                    if fail:
+                        sink.fail_next -= 1
+                    elif not drop:
+                        sink.messages.append((sender, recipients, data))
+                if drop:
+                    # Hang up before acknowledging, like a server that went away mid-transaction
+                    return
+                if fail:
+                    self.reply("451 Try again later")
+                else:
+                    accepted += 1
+                    self.reply("250 OK: queued")
+            elif verb in ("RSET", "NOOP"):
+                self.reply("250 OK")
+            elif verb == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("502 Command not implemented")
+
+    def read_data(self) -> Optional[bytes]:
+        lines = []
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return None
+            if line == b".\r\n":
+                return b"".join(lines)
+            # Undo dot-stuffing
+            lines.append(line[1:] if line.startswith(b"..") else line)
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address, sink: "SmtpSink"):
+        self.sink = sink
+        super().__init__(address, _Handler)
+
+
+class SmtpSink:
+    """
+    Threaded SMTP server on localhost; use as a context manager.
+
+    Attributes:
+        messages: `(sender, recipients, raw_data)` for every accepted message.
+        connections: Number of SMTP sessions opened so far.
+        drop_after: Hang up each session after it has accepted this many messages.
+        fail_next: Answer the next N messages with `451` (transient failure).
+        refuse: Recipient addresses rejected with `550`.
+        defer: Recipient addresses refused with `450` (transient).
+        latency: Seconds slept before answering each command.
+    """
+
+    def __init__(self, port: int = 0, drop_after: Optional[int] = None, latency: float = 0.0):
+        self.port = port
+        self.drop_after = drop_after
+        self.latency = latency
+        self.fail_next = 0
+        self.refuse: set = set()
+        self.defer: set = set()
+        self.messages: List[Tuple[str, List[str], bytes]] = []
+        self.connections = 0
+        self.lock = threading.Lock()
+        self._server: Optional[_Server] = None
+
+    def start(self) -> "SmtpSink":
+        self._server = _Server(("127.0.0.1", self.port), self)
+        self.port = self._server.server_address[1]
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+
+    def recipients(self) -> List[str]:
+        with self.lock:
+            return [r.strip("<>") for _, rcpts, _ in self.messages for r in rcpts]
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
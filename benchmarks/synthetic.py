@@ -0,0 +1,223 @@
+"""
+Synthetic corpora and in-process stand-ins for the ingest pipeline.
+
+Everything here is deterministic for a given seed so that two benchmark runs
+see exactly the same data.
+"""
+import bisect
+import itertools
+import random
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Iterator, List, Optional, Tuple
+
+from deep_reader.models import Paper
+
+# Rough share of new submissions per primary category in the AI-heavy slice of arXiv.
+CATEGORY_WEIGHTS = {
+    "cs.LG": 0.24,
+    "cs.CV": 0.20,
+    "cs.CL": 0.16,
+    "cs.AI": 0.12,
+    "stat.ML": 0.06,
+    "cs.RO": 0.05,
+    "cs.IR": 0.04,
+    "cs.CR": 0.03,
+    "cs.NE": 0.02,
+    "cs.HC": 0.02,
+    "cs.SE": 0.02,
+    "eess.IV": 0.02,
+    "eess.AS": 0.01,
+    "math.OC": 0.01,
+}
+
+TOPIC_WORDS = [
+    "language", "model", "diffusion", "transformer", "retrieval", "agent", "reasoning",
+    "multimodal", "alignment", "benchmark", "synthesis", "selection", "vision", "graph",
+    "reinforcement", "learning", "robust", "efficient", "sparse", "attention", "token",
+    "instruction", "tuning", "preference", "evaluation", "dataset", "scaling", "video",
+    "speech", "memory", "planning", "compression", "distillation", "federated", "privacy",
+]
+
+FILLER_WORDS = [
+    "we", "propose", "a", "novel", "method", "for", "the", "of", "and", "results", "show",
+    "that", "our", "approach", "outperforms", "baselines", "on", "several", "tasks", "with",
+    "improvements", "in", "accuracy", "while", "reducing", "cost", "experiments", "across",
+]
+
+FIRST_NAMES = ["Wei", "Anna", "Jun", "Maria", "David", "Yuki", "Omar", "Li", "Sara", "Ivan",
+               "Chen", "Priya", "Lucas", "Emma", "Hao", "Noah", "Mei", "Ali", "Eva", "Tom"]
+LAST_NAMES = ["Zhang", "Smith", "Wang", "Garcia", "Kim", "Liu", "Müller", "Chen", "Singh",
+              "Rossi", "Tanaka", "Nguyen", "Ivanova", "Brown", "Li", "Yang", "Silva", "Khan"]
+
+
+class SyntheticCorpus:
+    """
+    Generates arXiv-like `Paper` records.
+
+    Author productivity follows a Zipf law over a fixed author pool (a few authors
+    appear on many papers, most appear once or twice), author list lengths are
+    skewed towards 2-5 names, and categories follow `CATEGORY_WEIGHTS` with 0-3
+    cross-lists.
+    """
+
+    def __init__(
+        self,
+        size: int,
+        seed: int = 42,
+        author_pool: Optional[int] = None,
+        start_date: datetime = datetime(2020, 1, 1, tzinfo=timezone.utc),
+        end_date: datetime = datetime(2025, 12, 31, tzinfo=timezone.utc),
+        with_llm_summary: float = 0.8,
+    ):
+        """
+        Args:
+            size: Number of papers to generate.
+            seed: Random seed; the same seed always yields the same corpus.
+            author_pool: Number of distinct authors (defaults to ~40% of size).
+            start_date: Earliest published date.
+            end_date: Latest published date.
+            with_llm_summary: Fraction of papers that already carry an LLM summary.
+        """
+        self.size = size
+        self.seed = seed
+        self.author_pool = author_pool or max(50, int(size * 0.4))
+        self.start_date = start_date
+        self.end_date = end_date
+        self.with_llm_summary = with_llm_summary
+
+        self._categories = list(CATEGORY_WEIGHTS)
+        self._category_cum = list(itertools.accumulate(CATEGORY_WEIGHTS.values()))
+        # Zipf(s=1.1) cumulative weights over author ranks
+        self._author_cum = list(itertools.accumulate(1.0 / (rank ** 1.1) for rank in range(1, self.author_pool + 1)))
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __iter__(self) -> Iterator[Paper]:
+        return self.papers()
+
+    def arxiv_id(self, index: int) -> str:
+        """Returns the arXiv-style id of the paper at `index` (ids are sorted by date)."""
+        published = self._published_date(index)
+        return f"{published:%y%m}.{index:07d}"
+
+    def papers(self, start: int = 0, stop: Optional[int] = None) -> Iterator[Paper]:
+        """Lazily yields papers `start..stop` so million-row corpora never sit in memory."""
+        stop = self.size if stop is None else min(stop, self.size)
+        for index in range(start, stop):
+            yield self.paper(index)
+
+    def paper(self, index: int) -> Paper:
+        rng = random.Random(self.seed * 1_000_003 + index)
+        published = self._published_date(index)
+        primary = self._pick_category(rng)
+        cross_lists = {self._pick_category(rng) for _ in range(self._cross_list_count(rng))}
+        cross_lists.discard(primary)
+        categories = [primary, *sorted(cross_lists)]
+
+        topic = rng.sample(TOPIC_WORDS, 3)
+        title = " ".join(w.capitalize() for w in (topic[0], "for", topic[1], topic[2]))
+        summary = " ".join(rng.choice(TOPIC_WORDS if rng.random() < 0.3 else FILLER_WORDS) for _ in range(150))
+
+        return Paper(
+            arxiv_id=self.arxiv_id(index),
+            title=title,
+            authors=self._pick_authors(rng),
+            summary=summary,
+            published_date=published,
+            updated_date=published + timedelta(days=rng.choice([0, 0, 0, 3, 14])),
+            primary_category=primary,
+            categories=categories,
+            pdf_url=f"https://arxiv.org/pdf/{self.arxiv_id(index)}",
+            llm_summary=f"Synthetic summary {index}" if rng.random() < self.with_llm_summary else None,
+        )
+
+    def _published_date(self, index: int) -> datetime:
+        span = (self.end_date - self.start_date).total_seconds()
+        return self.start_date + timedelta(seconds=span * index / max(1, self.size))
+
+    def _pick_category(self, rng: random.Random) -> str:
+        r = rng.random() * self._category_cum[-1]
+        return self._categories[bisect.bisect_left(self._category_cum, r)]
+
+    def _cross_list_count(self, rng: random.Random) -> int:
+        return rng.choices([0, 1, 2, 3], weights=[0.35, 0.35, 0.2, 0.1])[0]
+
+    def _pick_authors(self, rng: random.Random) -> List[str]:
+        count = min(15, max(1, int(rng.lognormvariate(1.2, 0.5))))
+        ranks = set()
+        while len(ranks) < count:
+            r = rng.random() * self._author_cum[-1]
+            ranks.add(bisect.bisect_left(self._author_cum, r))
+        return [self._author_name(rank) for rank in sorted(ranks)]
+
+    def _author_name(self, rank: int) -> str:
+        first = FIRST_NAMES[rank % len(FIRST_NAMES)]
+        last = LAST_NAMES[(rank // len(FIRST_NAMES)) % len(LAST_NAMES)]
+        return f"{first} {last} {rank}"
+
+
+class FakeArxivCollector:
+    """Stands in for `ArxivCollector`, serving papers from a `SyntheticCorpus`."""
+
+    def __init__(self, corpus: SyntheticCorpus, start: int = 0, limit: Optional[int] = None, latency: float = 0.0):
+        """
+        Args:
+            corpus: Source of papers.
+            start: Index of the first paper returned by `fetch_papers`.
+                Pointing it near the end of an ingested corpus mixes existing and new papers.
+            limit: Caps the papers returned per call (arXiv may return fewer than `max_results`).
+            latency: Seconds to sleep per call (simulates the arXiv round-trip).
+        """
+        self.corpus = corpus
+        self.start = start
+        self.limit = limit
+        self.latency = latency
+        self.calls = 0
+
+    def fetch_papers(self, query: str, max_results: int = 10) -> List[Paper]:
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        count = max_results if self.limit is None else min(max_results, self.limit)
+        # Indices past the end of the corpus are valid and yield papers that are not in the vault yet.
+        return [self.corpus.paper(i) for i in range(self.start, self.start + count)]
+
+
+class FakeLLMClient:
+    """Stands in for `LLMClient` with a configurable per-call latency."""
+
+    provider = "fake"
+
+    def __init__(self, latency: float = 0.0):
+        self.latency = latency
+        self.calls = 0
+
+    def generate_summary(self, text: str) -> str:
+        self.calls += 1
+        if self.latency:
+            time.sleep(self.latency)
+        return f"Fake summary of {len(text)} characters."
+
+
+class FakeNotifier:
+    """Stands in for `EmailNotifier`; records digests instead of sending them."""
+
+    def __init__(self):
+        self.sent: List[List[Paper]] = []
+        self.recommended: List[List[Paper]] = []
+        self.digests: List[Tuple[str, List[Paper]]] = []
+
+    def send_daily_digest(self, papers: List[Paper]):
+        self.sent.append(list(papers))
+
+    def send_digests(self, digests):
+        self.digests.extend((subscriber.email, list(papers)) for subscriber, papers in digests)
+        return len(digests)
+
+    def send_recommendations(self, recommendations):
+        self.recommended.append([paper for paper, _ in recommendations])
+
+    def close(self):
+        pass
@@ -0,0 +1,131 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence, Tuple
+
+from deep_reader.intelligence.llm_client import LLMClient
+from deep_reader.models import is_failed_output
+from deep_reader.storage.db_manager import DatabaseManager
+from deep_reader.storage.partitioned import open_vault
+from deep_reader.utils.checkpoint import load_checkpoint, save_checkpoint
+
+BACKFILL_FIELDS = ("summary", "insights")
+
+
+def _process_row(
+    llm: LLMClient, row: Dict[str, Any], fields: Sequence[str]
+) -> Tuple[str, Optional[str], Optional[str], bool]:
+    """
+    Generates whatever the row is missing.
+
+    Returns:
+        (arxiv_id, llm_summary, key_insights, failed). Fields that were not
+        (successfully) generated are None so the stored value is left alone.
+    """
+    summary = insights = None
+    failed = False
+
+    if "summary" in fields and is_failed_output(row["llm_summary"]):
+        result = llm.generate_summary(row["summary"])
+        if is_failed_output(result):
+            failed = True
+        else:
+            summary = result
+
+    if "insights" in fields and is_failed_output(row["key_insights"]):
+        result = llm.generate_key_insights(row["summary"])
+        if is_failed_output(result):
+            failed = True
+        else:
+            insights = result
+
+    return row["arxiv_id"], summary, insights, failed
+
+
+def run_backfill(
+    db: Optional[DatabaseManager] = None,
+    llm: Optional[LLMClient] = None,
+    concurrency: int = 4,
+    batch_size: int = 50,
+    checkpoint_path: str = "backfill.checkpoint.json",
+    restart: bool = False,
+    limit: Optional[int] = None,
+    fields: Sequence[str] = BACKFILL_FIELDS,
+) -> dict:
+    """
+    Fills in `llm_summary` and `key_insights` for papers already in the vault.
+
+    Candidates are read in arxiv_id order from an indexed keyset cursor, processed
+    by at most `concurrency` LLM calls at a time, and written back one batch per
+    transaction. The last committed arxiv_id is checkpointed after every batch, so
+    an interrupted run resumes without redoing work. Papers that fail again are
+    left as they are and picked up by the next full run.
+
+    Args:
+        db: Vault to backfill (defaults to the configured one).
+        llm: LLM client (defaults to the configured provider).
+        concurrency: Maximum number of concurrent LLM requests.
+        batch_size: Papers per committed batch.
+        checkpoint_path: Where progress is recorded. Removed once the run completes.
+        restart: Ignore an existing checkpoint.
+        limit: Stop after this many papers (useful for trial runs).
+        fields: Which of "summary" and "insights" to generate.
+
+    Returns:
+        dict: Run statistics (processed, updated, failed, last_id, complete).
+    """
+    unknown = set(fields) - set(BACKFILL_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown backfill fields: {', '.join(sorted(unknown))}")
+
+    db = db or open_vault()
+    llm = llm or LLMClient()
+    if not llm.is_configured:
+        print("LLM is not configured (set LLM_API_KEY). Nothing to backfill with.")
+        return {"processed": 0, "updated": 0, "failed": 0, "last_id": "", "complete": False}
+
+    checkpoint_file = Path(checkpoint_path)
+    state = {} if restart else load_checkpoint(checkpoint_file)
+    state = {
+        "last_id": state.get("last_id", ""),
+        "processed": state.get("processed", 0),
+        "updated": state.get("updated", 0),
+        "failed": state.get("failed", 0),
+        "complete": False,
+    }
+    if state["last_id"]:
+        print(f"Resuming backfill after {state['last_id']} ({state['processed']} papers already processed).")
+
+    session_processed = 0
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        while True:
+            page = batch_size if limit is None else min(batch_size, limit - session_processed)
+            if page <= 0:
+                break
+            rows = db.get_backfill_candidates(after_id=state["last_id"], limit=page)
+            if not rows:
+                state["complete"] = True
+                break
+
+            results = list(pool.map(lambda row: _process_row(llm, row, fields), rows))
+            updates = [(pid, summary, insights) for pid, summary, insights, _ in results
+                       if summary is not None or insights is not None]
+            if updates:
+                db.update_intelligence(updates)
+
+            session_processed += len(rows)
+            state.update(
+                last_id=rows[-1]["arxiv_id"],
+                processed=state["processed"] + len(rows),
+                updated=state["updated"] + len(updates),
+                failed=state["failed"] + sum(1 for *_, failed in results if failed),
+            )
+            save_checkpoint(checkpoint_file, state)
+            print(f"Backfilled {state['processed']} papers ({state['failed']} failed), last id {state['last_id']}.")
+
+    if state["complete"] and checkpoint_file.exists():
+        # The next run should start over so it retries this run's failures and picks up new papers
+        checkpoint_file.unlink()
+
+    print(f"Backfill {'complete' if state['complete'] else 'paused'}: "
+          f"{state['processed']} processed, {state['updated']} updated, {state['failed']} failed.")
+    return state
@@ -1,5 +1,7 @@
+import os
 import arxiv
-from typing import List
+from typing import List, Optional
+from deep_reader.collector.transport import ArxivTransport, FeedCache
 from deep_reader.models import Paper
 
 class ArxivCollector:
@@ -7,11 +9,23 @@ class ArxivCollector:
     Collector for fetching papers from ArXiv API.
     """
     
-    def __init__(self, page_size: int = 100, delay_seconds: float = 3.0):
+    def __init__(
+        self,
+        page_size: int = 100,
+        delay_seconds: float = 3.0,
+        cache_mode: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        cache_ttl: Optional[float] = None,
+        transport: Optional[ArxivTransport] = None,
+    ):
         """
         Args:
             page_size: Number of results to fetch per page (though python lib handles pagination).
             delay_seconds: Delay between requests (handled by lib, but good to note).
+            cache_mode: "off", "cache", "record" or "replay" (defaults to `DEEP_READER_ARXIV_CACHE` or "off").
+            cache_dir: Page cache directory (defaults to `DEEP_READER_ARXIV_CACHE_DIR` or `./arxiv_cache`).
+            cache_ttl: Seconds a cached page stays fresh in "cache" mode (defaults to `DEEP_READER_ARXIV_CACHE_TTL` or 3600).
+            transport: Ready-made transport; overrides the cache arguments.
         """
         self.client = arxiv.Client(
             page_size=page_size,
@@ -19,6 +33,20 @@ class ArxivCollector:
             num_retries=3
         )
 
+        mode = cache_mode or os.getenv("DEEP_READER_ARXIV_CACHE", "off")
+        if transport is None and mode != "off":
+            cache = FeedCache(
+                cache_dir or os.getenv("DEEP_READER_ARXIV_CACHE_DIR", "arxiv_cache"),
+                ttl_seconds=cache_ttl if cache_ttl is not None else float(os.getenv("DEEP_READER_ARXIV_CACHE_TTL", "3600")),
+            )
+            transport = ArxivTransport(cache, mode=mode, delay_seconds=delay_seconds)
+        self.transport = transport
+        if transport is not None:
+            # The transport throttles real requests only, so cached pages skip the delay
+            self.client.delay_seconds = 0
+            self.client._session.mount("https://", transport)
+            self.client._session.mount("http://", transport)
+
     def fetch_papers(self, query: str, max_results: int = 10) -> List[Paper]:
         """
         Fetch papers based on a search query.
@@ -0,0 +1,98 @@
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+import requests
+
+
+class PdfDownloader:
+    """
+    Downloads PDFs with bounded concurrency and resumable retries.
+
+    Each download goes to `<dest>/<id>.pdf.part` and is renamed once complete.
+    A retry (or a later run) continues a partial file with an HTTP Range request
+    when the server supports it, and starts over when it does not.
+    """
+
+    def __init__(
+        self,
+        dest_dir: str,
+        concurrency: int = 2,
+        retries: int = 3,
+        backoff_seconds: float = 2.0,
+        timeout: float = 60.0,
+        session: Optional[requests.Session] = None,
+    ):
+        """
+        Args:
+            dest_dir: Directory the PDFs are written to.
+            concurrency: Maximum simultaneous downloads (keep this low for arxiv.org).
+            retries: Extra attempts per PDF after the first failure.
+            backoff_seconds: Base of the exponential wait between attempts.
+            timeout: Per-request connect/read timeout.
+            session: HTTP session to use (defaults to a new one).
+        """
+        self.dest_dir = Path(dest_dir)
+        self.dest_dir.mkdir(parents=True, exist_ok=True)
+        self.concurrency = concurrency
+        self.retries = retries
+        self.backoff_seconds = backoff_seconds
+        self.timeout = timeout
+        self.session = session or requests.Session()
+        self.session.headers.setdefault("User-Agent", "DeepReader (full-text indexer)")
+
+    def path_for(self, paper_id: str) -> Path:
+        # Old-style ids contain a slash (e.g. hep-th/9901001v1)
+        return self.dest_dir / f"{paper_id.replace('/', '_')}.pdf"
+
+    def download(self, paper_id: str, url: str) -> Path:
+        """Downloads one PDF, retrying with backoff. Raises the last error if every attempt fails."""
+        target = self.path_for(paper_id)
+        if target.exists():
+            return target
+        part = target.with_name(target.name + ".part")
+
+        for attempt in range(self.retries + 1):
+            try:
+                self._fetch(url, part)
+                os.replace(part, target)
+                return target
+            except (requests.RequestException, OSError) as e:
+                if attempt == self.retries:
+                    raise
+                wait = self.backoff_seconds * (2 ** attempt)
+                print(f"Download of {paper_id} failed ({e}); retrying in {wait:.1f}s...")
+                time.sleep(wait)
+
+    def _fetch(self, url: str, part: Path):
+        have = part.stat().st_size if part.exists() else 0
+        headers = {"Range": f"bytes={have}-"} if have else {}
+        with self.session.get(url, headers=headers, stream=True, timeout=self.timeout) as response:
+            if response.status_code == 416:
+                # Nothing left to fetch: the partial file is already complete
+                return
+            response.raise_for_status()
+            # 206 continues the partial file; a plain 200 means the server ignored the range
+            mode = "ab" if response.status_code == 206 else "wb"
+            with open(part, mode) as f:
+                for block in response.iter_content(chunk_size=64 * 1024):
+                    f.write(block)
+
+    def download_many(self, items: List[Tuple[str, str]]) -> Iterator[Tuple[str, Optional[Path], Optional[str]]]:
+        """
+        Downloads `(paper_id, url)` pairs, at most `concurrency` at a time.
+
+        Yields:
+            (paper_id, path, error) in input order; `path` is None when the download failed.
+        """
+        def run(item):
+            paper_id, url = item
+            try:
+                return paper_id, self.download(paper_id, url), None
+            except Exception as e:
+                return paper_id, None, str(e)
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            yield from pool.map(run, items)
@@ -0,0 +1,216 @@
+import json
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Iterator, List, Optional, Tuple
+
+from deep_reader.models import Paper
+from deep_reader.storage.db_manager import DatabaseManager
+from deep_reader.storage.partitioned import open_vault
+from deep_reader.utils.checkpoint import load_checkpoint, save_checkpoint
+
+
+def parse_snapshot_record(record: dict) -> Paper:
+    """
+    Converts one record of the arXiv metadata snapshot (the JSON-lines dump
+    published on Kaggle / arXiv's S3 bucket) to our Paper model.
+
+    The snapshot has no LLM data, so `llm_summary`/`key_insights` stay empty for a later backfill.
+    """
+    versions = record.get("versions") or []
+    if versions:
+        published = parsedate_to_datetime(versions[0]["created"])
+        updated = parsedate_to_datetime(versions[-1]["created"])
+        # Match ArxivCollector, whose ids come from Result.get_short_id() and carry the version
+        arxiv_id = f"{record['id']}{versions[-1]['version']}"
+    else:
+        published = updated = datetime.strptime(record["update_date"], "%Y-%m-%d").replace(tzinfo=timezone.utc)
+        arxiv_id = record["id"]
+
+    categories = record.get("categories", "").split()
+    if not categories:
+        raise ValueError("record has no categories")
+
+    return Paper(
+        arxiv_id=arxiv_id,
+        title=" ".join(record["title"].split()),
+        authors=_parse_authors(record),
+        summary=" ".join(record.get("abstract", "").split()),
+        published_date=published,
+        updated_date=updated,
+        primary_category=categories[0],
+        categories=categories,
+        pdf_url=f"https://arxiv.org/pdf/{arxiv_id}",
+    )
+
+
+def _parse_authors(record: dict) -> List[str]:
+    parsed = record.get("authors_parsed")
+    if parsed:
+        # Entries are [last, first, suffix]
+        return [" ".join(part for part in (first, last, suffix) if part)
+                for last, first, suffix, *_ in (entry + ["", ""] for entry in parsed)]
+    raw = record.get("authors", "").replace(" and ", ", ")
+    return [name.strip() for name in raw.split(",") if name.strip()]
+
+
+class SnapshotReader:
+    """
+    Streams a snapshot file line by line, yielding each paper with the byte
+    offset just past its line so callers can checkpoint and resume.
+    """
+
+    def __init__(self, path: str, start_offset: int = 0, category_prefixes: Optional[List[str]] = None):
+        """
+        Args:
+            path: Path to the JSON-lines snapshot.
+            start_offset: Byte offset to resume from (must be at a line boundary).
+            category_prefixes: Only yield papers with a category starting with one of these (e.g. ["cs."]).
+        """
+        self.path = path
+        self.start_offset = start_offset
+        self.category_prefixes = tuple(category_prefixes or ())
+        self.skipped = 0
+        self.filtered = 0
+
+    def __iter__(self) -> Iterator[Tuple[Optional[Paper], int]]:
+        """Yields (paper, offset). `paper` is None for lines that were skipped or filtered out."""
+        with open(self.path, "rb") as f:
+            f.seek(self.start_offset)
+            offset = self.start_offset
+            for line in f:
+                offset += len(line)
+                if not line.strip():
+                    yield None, offset
+                    continue
+                try:
+                    paper = parse_snapshot_record(json.loads(line))
+                except Exception as e:
+                    # Log error but continue processing other records
+                    print(f"Error processing snapshot record at byte {offset - len(line)}: {e}")
+                    self.skipped += 1
+                    yield None, offset
+                    continue
+                if self.category_prefixes and not any(
+                    c.startswith(self.category_prefixes) for c in paper.categories
+                ):
+                    self.filtered += 1
+                    yield None, offset
+                    continue
+                yield paper, offset
+
+
+def _load_checkpoint(checkpoint_path: Path, source: str) -> dict:
+    checkpoint = load_checkpoint(checkpoint_path)
+    if checkpoint and checkpoint.get("source") != source:
+        raise ValueError(
+            f"Checkpoint {checkpoint_path} belongs to {checkpoint.get('source')}, not {source}. "
+            "Pass --restart or a different --checkpoint."
+        )
+    return checkpoint
+
+
+def _index_vectors(db: DatabaseManager):
+    """Embeds the papers that have no recommendation vector yet."""
+    # numpy is only needed here, not to parse or load the snapshot
+    from deep_reader.recommender.engine import RecommendationEngine
+
+    print("Embedding papers for recommendations...")
+    print(f"Embedded {RecommendationEngine(db).index_new_papers()} papers.")
+
+
+def import_snapshot(
+    path: str,
+    db: Optional[DatabaseManager] = None,
+    batch_size: int = 5000,
+    checkpoint_path: Optional[str] = None,
+    restart: bool = False,
+    limit: Optional[int] = None,
+    category_prefixes: Optional[List[str]] = None,
+) -> dict:
+    """
+    Streams an arXiv metadata snapshot into the vault.
+
+    Memory stays constant: records are parsed one line at a time and written in
+    transactions of `batch_size` papers. After each committed batch, the byte
+    offset is written to the checkpoint file, so an interrupted import picks up
+    where it left off. Imported papers are then embedded for recommendations;
+    the fetch cycle only embeds the papers it fetches itself.
+
+    Args:
+        path: JSON-lines snapshot file.
+        db: Target database (defaults to the configured vault).
+        batch_size: Papers per transaction.
+        checkpoint_path: Checkpoint file (defaults to `<path>.checkpoint.json`).
+        restart: Ignore an existing checkpoint and start from the beginning.
+        limit: Stop after importing this many papers (useful for sampling).
+        category_prefixes: Only import papers with a category starting with one of these.
+
+    Returns:
+        dict: The final checkpoint state (offset, imported, skipped, filtered, complete).
+    """
+    db = db or open_vault()
+    source = str(Path(path).resolve())
+    checkpoint_file = Path(checkpoint_path or f"{path}.checkpoint.json")
+
+    state = {} if restart else _load_checkpoint(checkpoint_file, source)
+    if state.get("complete"):
+        print(f"Snapshot {path} already imported ({state['imported']} papers). Use --restart to import again.")
+        # Catches up if the embedding step of the previous run was interrupted
+        _index_vectors(db)
+        return state
+
+    state = {
+        "source": source,
+        "offset": state.get("offset", 0),
+        "imported": state.get("imported", 0),
+        "skipped": state.get("skipped", 0),
+        "filtered": state.get("filtered", 0),
+        "complete": False,
+    }
+    if state["offset"]:
+        print(f"Resuming {path} from byte {state['offset']} ({state['imported']} papers already imported).")
+
+    reader = SnapshotReader(path, start_offset=state["offset"], category_prefixes=category_prefixes)
+    base_skipped, base_filtered = state["skipped"], state["filtered"]
+    batch: List[Paper] = []
+    offset = state["offset"]
+    session_imported = 0
+
+    def commit(session):
+        nonlocal batch
+        session.write(batch)
+        state.update(
+            offset=offset,
+            imported=state["imported"] + len(batch),
+            skipped=base_skipped + reader.skipped,
+            filtered=base_filtered + reader.filtered,
+        )
+        save_checkpoint(checkpoint_file, state)
+        batch = []
+
+    complete = False
+    with db.bulk_load() as session:
+        for paper, offset in reader:
+            if paper is not None:
+                batch.append(paper)
+                session_imported += 1
+            if len(batch) >= batch_size:
+                commit(session)
+                print(f"Imported {state['imported']} papers (byte {offset}).")
+            if limit is not None and session_imported >= limit:
+                break
+        else:
+            complete = True
+        commit(session)
+        print("Rebuilding indexes...")
+
+    if complete:
+        # Only once bulk_load has rebuilt the indexes and facets: a crash during the
+        # rebuild leaves the import incomplete, so the next run repeats it
+        state["complete"] = True
+        save_checkpoint(checkpoint_file, state)
+
+    _index_vectors(db)
+    print(f"Import finished: {state['imported']} papers, {state['skipped']} skipped, {state['filtered']} filtered out.")
+    return state
@@ -0,0 +1,179 @@
+import gzip
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+MODES = ("off", "cache", "record", "replay")
+
+_TOTAL_RESULTS = re.compile(rb"<opensearch:totalResults[^>]*>\s*(\d+)\s*<")
+
+
+class ReplayMissError(requests.RequestException):
+    """Raised in replay mode when a page was never recorded (no network fallback)."""
+
+
+def cache_key(url: str) -> str:
+    """
+    Normalizes an arXiv API URL into a cache key.
+
+    Parameters are sorted and whitespace in the search query is collapsed, so
+    equivalent requests share an entry. The page offset (`start`) and size
+    (`max_results`) are part of the key: every page is its own entry.
+    """
+    parts = urlsplit(url)
+    params = []
+    for name, value in parse_qsl(parts.query, keep_blank_values=True):
+        if name == "search_query":
+            value = " ".join(value.split())
+        params.append((name, value))
+    return f"{parts.netloc}{parts.path}?{urlencode(sorted(params))}"
+
+
+class FeedCache:
+    """
+    Content-addressed on-disk store of raw Atom pages.
+
+    Page bodies are gzipped under `pages/` and named by their SHA-256, so
+    identical pages (e.g. an empty result page) are stored once. Each cache
+    key has a small JSON record under `keys/` pointing at its page and noting
+    when it was fetched. Both are written through a temporary file and
+    `os.replace`, so a crashed run never leaves a half-written entry.
+    """
+
+    def __init__(self, root: str, ttl_seconds: Optional[float] = 3600.0):
+        """
+        Args:
+            root: Cache directory.
+            ttl_seconds: Age after which an entry is stale (None keeps entries forever).
+        """
+        self.root = Path(root)
+        self.ttl_seconds = ttl_seconds
+        (self.root / "pages").mkdir(parents=True, exist_ok=True)
+        (self.root / "keys").mkdir(parents=True, exist_ok=True)
+
+    def _key_path(self, key: str) -> Path:
+        return self.root / "keys" / f"{hashlib.sha256(key.encode('utf-8')).hexdigest()}.json"
+
+    def _page_path(self, digest: str) -> Path:
+        return self.root / "pages" / digest[:2] / f"{digest}.xml.gz"
+
+    @staticmethod
+    def _write(path: Path, data: bytes):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        tmp.write_bytes(data)
+        os.replace(tmp, path)
+
+    def get(self, key: str, ignore_ttl: bool = False) -> Optional[bytes]:
+        """Returns the stored page for `key`, or None if it is missing or stale."""
+        try:
+            record = json.loads(self._key_path(key).read_text())
+            if not ignore_ttl and self.ttl_seconds is not None:
+                if time.time() - record["fetched_at"] > self.ttl_seconds:
+                    return None
+            return gzip.decompress(self._page_path(record["sha256"]).read_bytes())
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def put(self, key: str, content: bytes):
+        digest = hashlib.sha256(content).hexdigest()
+        page = self._page_path(digest)
+        if not page.exists():
+            # mtime=0 keeps the gzip bytes a pure function of the content
+            self._write(page, gzip.compress(content, mtime=0))
+        record = {"key": key, "sha256": digest, "fetched_at": time.time()}
+        self._write(self._key_path(key), json.dumps(record).encode("utf-8"))
+
+
+class ArxivTransport(HTTPAdapter):
+    """
+    requests transport for the arXiv API with an optional page cache.
+
+    Modes:
+        off: always fetch from arXiv.
+        cache: serve fresh cached pages, fetch (and store) the rest.
+        record: always fetch, and store every page (refreshes the cache).
+        replay: serve recorded pages regardless of age and never touch the
+            network; a missing page raises `ReplayMissError`.
+
+    The transport also enforces arXiv's minimum delay between requests, but
+    only for requests that actually go out, so cached pages are served at
+    local-disk speed. Only complete pages are cached: a page with no entries
+    is stored only if the feed reports zero results, because arXiv
+    occasionally returns spurious empty pages that the client retries.
+    """
+
+    def __init__(self, cache: Optional[FeedCache] = None, mode: str = "cache", delay_seconds: float = 3.0, **kwargs):
+        """
+        Args:
+            cache: Page store (required unless `mode` is "off").
+            mode: One of "off", "cache", "record" or "replay".
+            delay_seconds: Minimum interval between requests sent to arXiv.
+        """
+        if mode not in MODES:
+            raise ValueError(f"Unknown arXiv cache mode {mode!r} (expected one of {', '.join(MODES)})")
+        if mode != "off" and cache is None:
+            raise ValueError(f"arXiv cache mode {mode!r} needs a cache directory")
+        super().__init__(**kwargs)
+        self.cache = cache
+        self.mode = mode
+        self.delay_seconds = delay_seconds
+        self.hits = 0
+        self.misses = 0
+        self._last_request = 0.0
+        self._lock = threading.Lock()
+
+    def send(self, request, **kwargs):
+        key = cache_key(request.url)
+        if request.method == "GET" and self.mode in ("cache", "replay"):
+            content = self.cache.get(key, ignore_ttl=self.mode == "replay")
+            if content is not None:
+                self.hits += 1
+                return self._cached_response(request, content)
+            if self.mode == "replay":
+                raise ReplayMissError(f"No recorded arXiv page for {key}", request=request)
+        self.misses += 1
+
+        self._throttle()
+        response = super().send(request, **kwargs)
+        if request.method == "GET" and self.mode in ("cache", "record") and self._cacheable(response):
+            self.cache.put(key, response.content)
+        return response
+
+    def _throttle(self):
+        with self._lock:
+            wait = self._last_request + self.delay_seconds - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self._last_request = time.monotonic()
+
+    @staticmethod
+    def _cacheable(response: requests.Response) -> bool:
+        if response.status_code != 200:
+            return False
+        content = response.content
+        if b"<entry" in content:
+            return True
+        total = _TOTAL_RESULTS.search(content)
+        return total is not None and int(total.group(1)) == 0
+
+    @staticmethod
+    def _cached_response(request, content: bytes) -> requests.Response:
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.url = request.url
+        response.request = request
+        response.headers["Content-Type"] = "application/atom+xml; charset=UTF-8"
+        response.headers["X-Deep-Reader-Cache"] = "hit"
+        response._content = content
+        return response
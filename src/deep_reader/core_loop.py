@@ -1,9 +1,21 @@
 from deep_reader.collector.arxiv_client import ArxivCollector
 from deep_reader.storage.db_manager import DatabaseManager
+from deep_reader.storage.partitioned import open_vault
 from deep_reader.notifier.email_service import EmailNotifier
+from deep_reader.notifier.matching import DigestRouter
 from deep_reader.intelligence.llm_client import LLMClient
+from deep_reader.recommender.engine import DEFAULT_READER, RecommendationEngine
 from datetime import datetime, timedelta, timezone
-from typing import Optional # Import Optional
+from typing import Any, Callable, Dict, Optional # Import Optional
+
+def _save(db: DatabaseManager, paper) -> bool:
+    try:
+        db.save_paper(paper)
+        return True
+    except PermissionError as e:
+        # A frozen partition accepts unchanged re-saves only; skip the paper rather than the cycle
+        print(f"Skipping {paper.arxiv_id}: {e}")
+        return False
 
 def run_daily_cycle(
     query: Optional[str] = None, 
@@ -11,15 +23,26 @@ def run_daily_cycle(
     days: Optional[int] = None, 
     topic: Optional[str] = None,
     start_date_str: Optional[str] = None,
-    end_date_str: Optional[str] = None
+    end_date_str: Optional[str] = None,
+    collector: Optional[ArxivCollector] = None,
+    db: Optional[DatabaseManager] = None,
+    notifier: Optional[EmailNotifier] = None,
+    llm: Optional[LLMClient] = None,
+    recommender: Optional[RecommendationEngine] = None,
+    progress: Optional[Callable[[str, Dict[str, Any]], None]] = None,
 ):
     print("Starting fetch cycle...")
     
     # ... (components init)
-    collector = ArxivCollector()
-    db = DatabaseManager()
-    notifier = EmailNotifier()
-    llm = LLMClient()
+    # Components can be injected (e.g. by benchmarks); default to the real ones.
+    collector = collector or ArxivCollector()
+    db = db or open_vault()
+    notifier = notifier or EmailNotifier()
+    llm = llm or LLMClient()
+    recommender = recommender or RecommendationEngine(db)
+    # progress(stage, data) is how the API reports a triggered job to SSE subscribers
+    report = progress or (lambda stage, data=None: None)
+    report("started", {})
     
     # 2. Fetch Papers
     print("Fetching papers...")
@@ -53,14 +76,15 @@ def run_daily_cycle(
         
     papers = collector.fetch_papers(query=actual_query, max_results=200) 
     print(f"Fetched {len(papers)} papers using query: '{actual_query}'.")
+    report("fetched", {"papers": len(papers)})
     
     if not papers:
+        # Nothing new today: skip straight to notifying, which falls back to recommendations
         print("No papers found.")
-        return
 
     # 3. Save to DB and Filter new ones
     new_papers = []
-    for paper in papers:
+    for done, paper in enumerate(papers, 1):
         existing = db.get_paper(paper.arxiv_id)
         
         if not existing:
@@ -73,8 +97,8 @@ def run_daily_cycle(
                 print(f"Failed to generate summary for {paper.arxiv_id}: {e}")
                 paper_to_save = paper
                 
-            new_papers.append(paper_to_save)
-            db.save_paper(paper_to_save)
+            if _save(db, paper_to_save):
+                new_papers.append(paper_to_save)
             
         else:
             # Existing Paper
@@ -86,6 +110,7 @@ def run_daily_cycle(
                 "key_insights": existing.key_insights
             }
             
+            # Stored failure placeholders are retried by the `backfill` command, not on every cycle
             if not existing.llm_summary:
                 print(f"Backfilling summary for existing paper: {paper.arxiv_id}")
                 try:
@@ -95,15 +120,41 @@ def run_daily_cycle(
                     print(f"Failed to backfill summary: {e}")
 
             paper_to_save = paper.model_copy(update=updates)
-            db.save_paper(paper_to_save)
+            _save(db, paper_to_save)
+
+        report("saved", {"done": done, "total": len(papers), "new": len(new_papers)})
             
     print(f"Saved {len(papers)} papers ({len(new_papers)} new).")
+
+    # Keep paper vectors current so recommendations can include this cycle's papers
+    # (snapshot imports embed the papers they load themselves)
+    recommender.index_papers(papers)
+    if new_papers:
+        recommender.refresh_all()
     
     # 4. Notify
-    if new_papers:
-        print("Sending notification...")
-        notifier.send_daily_digest(new_papers)
-    else:
-        print("No new papers to notify.")
+    try:
+        if new_papers:
+            print("Sending notification...")
+            notifier.send_daily_digest(new_papers)
+
+            # Personal digests: one scan of the batch routes every paper to all matching subscribers
+            subscribers = db.list_subscribers()
+            if subscribers:
+                digests = DigestRouter(subscribers).route(new_papers)
+                print(f"Routing {len(new_papers)} new papers to {len(digests)} of {len(subscribers)} subscribers...")
+                notifier.send_digests(digests)
+        else:
+            # Fallback: recommend vault papers from the reader's interest profile
+            recommendations = recommender.recommend(DEFAULT_READER)
+            if recommendations:
+                print(f"No new papers. Sending {len(recommendations)} recommendations from the vault...")
+                notifier.send_recommendations(recommendations)
+            else:
+                print("No new papers to notify.")
+    finally:
+        # The notifier keeps its SMTP session open between sends
+        notifier.close()
         
+    report("complete", {"saved": len(papers), "new": len(new_papers)})
     print("Cycle complete.")
@@ -0,0 +1,106 @@
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import List, Optional
+
+from deep_reader.collector.pdf_fetcher import PdfDownloader
+from deep_reader.storage.db_manager import DatabaseManager
+from deep_reader.storage.partitioned import open_vault
+from deep_reader.storage.fulltext import FullTextStore, chunk_text
+
+
+def extract_chunks(path: str, chunk_chars: int = 2000) -> List[str]:
+    """
+    Extracts the text of a PDF and splits it into chunks. Runs in a worker process.
+
+    Requires the optional `pypdf` package.
+    """
+    try:
+        from pypdf import PdfReader
+    except ImportError:
+        raise ImportError("pypdf package is required for full-text indexing. Install it with `pip install pypdf`.")
+
+    reader = PdfReader(path)
+    text = "\n".join(page.extract_text() or "" for page in reader.pages)
+    return chunk_text(text, chunk_chars=chunk_chars)
+
+
+def run_fulltext(
+    db: Optional[DatabaseManager] = None,
+    store: Optional[FullTextStore] = None,
+    downloader: Optional[PdfDownloader] = None,
+    workers: int = 2,
+    batch_size: int = 50,
+    limit: Optional[int] = None,
+    max_attempts: int = 3,
+    keep_pdfs: bool = False,
+) -> dict:
+    """
+    Downloads, extracts and indexes the full text of papers in the vault.
+
+    Papers are walked in arxiv_id order. Each batch is downloaded by the
+    downloader's thread pool, text is extracted by a pool of `workers`
+    processes (PDF parsing is CPU-bound), and the chunks are appended to the
+    full-text store. The store records every indexed or failed paper, so a
+    rerun skips finished work and retries failures until `max_attempts`.
+
+    Args:
+        db: Vault to read paper links from.
+        store: Full-text store to write to.
+        downloader: PDF downloader (defaults to `<store>/pdfs` with bounded concurrency).
+        workers: Text extraction processes.
+        batch_size: Papers per download/extract round.
+        limit: Stop after this many papers were attempted.
+        max_attempts: Give up on a paper after this many failed runs.
+        keep_pdfs: Keep downloaded PDFs instead of deleting them once indexed.
+
+    Returns:
+        dict: Run statistics (attempted, indexed, failed, chunks).
+    """
+    db = db or open_vault()
+    store = store or FullTextStore()
+    downloader = downloader or PdfDownloader(str(store.root / "pdfs"))
+    stats = {"attempted": 0, "indexed": 0, "failed": 0, "chunks": 0}
+
+    after_id = ""
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        while limit is None or stats["attempted"] < limit:
+            rows = db.get_pdf_candidates(after_id=after_id, limit=batch_size)
+            if not rows:
+                break
+            after_id = rows[-1][0]
+            done = store.done_ids([pid for pid, _ in rows], max_attempts=max_attempts)
+            pending = [(pid, url) for pid, url in rows if pid not in done]
+            if limit is not None:
+                pending = pending[:limit - stats["attempted"]]
+            if not pending:
+                continue
+            stats["attempted"] += len(pending)
+
+            extractions = []
+            for paper_id, path, error in downloader.download_many(pending):
+                if path is None:
+                    store.mark_failed(paper_id, f"download: {error}")
+                    stats["failed"] += 1
+                else:
+                    extractions.append((paper_id, path, pool.submit(extract_chunks, str(path))))
+
+            for paper_id, path, future in extractions:
+                try:
+                    chunks = future.result()
+                    if not chunks:
+                        raise ValueError("no text extracted")
+                except Exception as e:
+                    print(f"Failed to extract {paper_id}: {e}")
+                    store.mark_failed(paper_id, f"extract: {e}")
+                    stats["failed"] += 1
+                    continue
+                stats["chunks"] += store.add_document(paper_id, chunks)
+                stats["indexed"] += 1
+                if not keep_pdfs:
+                    Path(path).unlink(missing_ok=True)
+
+            print(f"Full text: {stats['indexed']} indexed, {stats['failed']} failed (last id {after_id}).")
+
+    print(f"Full-text run finished: {stats['attempted']} attempted, {stats['indexed']} indexed, "
+          f"{stats['failed']} failed, {stats['chunks']} chunks.")
+    return stats
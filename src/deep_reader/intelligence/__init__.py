@@ -0,0 +1,3 @@
+from deep_reader.intelligence.providers import Provider, available_providers, get_provider, register_provider
+
+__all__ = ["Provider", "available_providers", "get_provider", "register_provider"]
@@ -1,10 +1,16 @@
+import json
 import os
-import google.generativeai as genai
+import re
+import threading
 from typing import Optional
-try:
-    from openai import OpenAI
-except ImportError:
-    OpenAI = None
+
+from deep_reader.intelligence.providers import Provider, get_provider
+from deep_reader.models import (
+    INSIGHTS_FAILED_PREFIX,
+    INSIGHTS_UNAVAILABLE,
+    SUMMARY_FAILED_PREFIX,
+    SUMMARY_UNAVAILABLE,
+)
 
 class LLMClient:
     def __init__(self, provider: Optional[str] = None, api_key: Optional[str] = None, base_url: Optional[str] = None, model_name: Optional[str] = None):
@@ -12,32 +18,44 @@ class LLMClient:
         self.api_key = api_key or os.getenv("LLM_API_KEY") or os.getenv("GEMINI_API_KEY")
         self.base_url = base_url or os.getenv("LLM_BASE_URL")
         self.model_name = model_name or os.getenv("LLM_MODEL")
-        
-        self.client = None
-        self.model = None
-
-        if self.provider == "google":
-            if not self.api_key:
-                print("Warning: LLM_API_KEY (or GEMINI_API_KEY) not found. LLM features will be disabled.")
-            else:
-                genai.configure(api_key=self.api_key)
-                self.model = genai.GenerativeModel('gemini-pro')
-        
-        elif self.provider in ["custom", "openai"]:
-            if not OpenAI:
-                raise ImportError("openai package is required for custom provider. Install it with `pip install openai`.")
-            
-            if not self.api_key:
-                print("Warning: LLM_API_KEY not found. LLM features will be disabled.")
-            else:
-                self.client = OpenAI(
-                    api_key=self.api_key,
-                    base_url=self.base_url  # Optional for OpenAI, required for some custom providers
-                )
-                self.model_name = self.model_name or "gpt-3.5-turbo" # Default fallback
-                
-        else:
-            raise NotImplementedError(f"Provider {self.provider} not supported yet.")
+
+        # Validates the provider name; the SDK itself is imported on first use (see `backend`)
+        self._factory = get_provider(self.provider)
+        self._backend: Optional[Provider] = None
+        self._backend_error: Optional[Exception] = None
+        self._backend_lock = threading.Lock()
+
+        if not self.api_key:
+            print("Warning: LLM_API_KEY (or GEMINI_API_KEY) not found. LLM features will be disabled.")
+
+    @property
+    def is_configured(self) -> bool:
+        return bool(self.api_key)
+
+    @property
+    def backend(self) -> Optional[Provider]:
+        """
+        The provider instance, created (and its SDK imported) on first access.
+
+        Raises:
+            Exception: The provider could not be created (e.g. its SDK is not installed).
+                The error is kept and raised again on later accesses, without another attempt.
+        """
+        if self._backend is None and self.api_key:
+            with self._backend_lock:
+                if self._backend_error is not None:
+                    raise self._backend_error
+                if self._backend is None:
+                    try:
+                        self._backend = self._factory(
+                            api_key=self.api_key,
+                            base_url=self.base_url,
+                            model_name=self.model_name,
+                        )
+                    except Exception as e:
+                        self._backend_error = e
+                        raise
+        return self._backend
 
     def generate_summary(self, text: str) -> str:
         prompt = f"""
@@ -53,26 +71,46 @@ class LLMClient:
         {text}
         """
 
+        # Configuration errors (e.g. a missing SDK) are raised, not stored as the summary
+        backend = self.backend
+        if not backend:
+            return SUMMARY_UNAVAILABLE
         try:
-            if self.provider == "google":
-                if not self.model:
-                    return "Summary unavailable (LLM not configured)."
-                response = self.model.generate_content(prompt)
-                return response.text
-            
-            elif self.provider in ["custom", "openai"]:
-                if not self.client:
-                    return "Summary unavailable (LLM not configured)."
-                
-                response = self.client.chat.completions.create(
-                    model=self.model_name,
-                    messages=[
-                        {"role": "system", "content": "You are a helpful research assistant."},
-                        {"role": "user", "content": prompt}
-                    ]
-                )
-                return response.choices[0].message.content
+            return backend.complete(prompt)
                 
         except Exception as e:
             print(f"Error generating summary: {e}")
-            return f"Summary generation failed: {e}"
+            return f"{SUMMARY_FAILED_PREFIX} {e}"
+
+    def generate_key_insights(self, text: str) -> str:
+        """
+        Extracts 3-5 key insights from an abstract.
+
+        Returns:
+            str: A JSON list of strings, or a failure placeholder (see `is_failed_output`).
+        """
+        prompt = f"""
+        You are an expert academic researcher. Extract the 3 to 5 most important insights
+        of the following research paper abstract, each as one short sentence in Chinese.
+
+        Respond with a JSON array of strings only, without any other text.
+
+        Abstract:
+        {text}
+        """
+
+        backend = self.backend
+        if not backend:
+            return INSIGHTS_UNAVAILABLE
+        try:
+            raw = backend.complete(prompt)
+            # Models often wrap JSON in a markdown code fence
+            match = re.search(r"\[.*\]", raw, re.DOTALL)
+            insights = json.loads(match.group(0) if match else raw)
+            if not isinstance(insights, list) or not insights:
+                raise ValueError("expected a non-empty JSON array")
+            return json.dumps([str(item).strip() for item in insights], ensure_ascii=False)
+
+        except Exception as e:
+            print(f"Error generating key insights: {e}")
+            return f"{INSIGHTS_FAILED_PREFIX} {e}"
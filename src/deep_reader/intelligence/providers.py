@@ -0,0 +1,81 @@
+"""
+Registry of LLM providers.
+
+Provider SDKs are heavy (`google.generativeai` alone pulls in grpc and protobuf),
+so a provider module only imports its SDK when the provider is constructed,
+which `LLMClient` defers until the first generation request.
+"""
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, List, Optional
+
+
+class Provider(ABC):
+    """Interface for a configured LLM backend."""
+
+    @abstractmethod
+    def complete(self, prompt: str) -> str:
+        """Returns the model's reply to `prompt`."""
+
+
+class GoogleProvider(Provider):
+    def __init__(self, api_key: str, base_url: Optional[str] = None, model_name: Optional[str] = None):
+        import google.generativeai as genai
+
+        genai.configure(api_key=api_key)
+        self.model = genai.GenerativeModel('gemini-pro')
+
+    def complete(self, prompt: str) -> str:
+        response = self.model.generate_content(prompt)
+        return response.text
+
+
+class OpenAIProvider(Provider):
+    def __init__(self, api_key: str, base_url: Optional[str] = None, model_name: Optional[str] = None):
+        try:
+            from openai import OpenAI
+        except ImportError:
+            raise ImportError("openai package is required for custom provider. Install it with `pip install openai`.")
+
+        self.client = OpenAI(
+            api_key=api_key,
+            base_url=base_url  # Optional for OpenAI, required for some custom providers
+        )
+        self.model_name = model_name or "gpt-3.5-turbo" # Default fallback
+
+    def complete(self, prompt: str) -> str:
+        response = self.client.chat.completions.create(
+            model=self.model_name,
+            messages=[
+                {"role": "system", "content": "You are a helpful research assistant."},
+                {"role": "user", "content": prompt}
+            ]
+        )
+        return response.choices[0].message.content
+
+
+# Factories take (api_key, base_url, model_name) and return a Provider
+ProviderFactory = Callable[..., Provider]
+
+_PROVIDERS: Dict[str, ProviderFactory] = {}
+
+
+def register_provider(name: str, factory: ProviderFactory):
+    """Registers (or replaces) the factory used for `LLM_PROVIDER=<name>`."""
+    _PROVIDERS[name] = factory
+
+
+def available_providers() -> List[str]:
+    return sorted(_PROVIDERS)
+
+
+def get_provider(name: str) -> ProviderFactory:
+    """Returns the factory for `name` without constructing it (no SDK import happens here)."""
+    try:
+        return _PROVIDERS[name]
+    except KeyError:
+        raise NotImplementedError(f"Provider {name} not supported yet.")
+
+
+register_provider("google", GoogleProvider)
+register_provider("openai", OpenAIProvider)
+register_provider("custom", OpenAIProvider)
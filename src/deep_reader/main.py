@@ -1,10 +1,107 @@
 import argparse
+import os
+import sys
 import time
-from apscheduler.schedulers.background import BackgroundScheduler
-from apscheduler.triggers.cron import CronTrigger
 from dotenv import load_dotenv
 
-from deep_reader.core_loop import run_daily_cycle
+def run_import(args):
+    # Imported lazily so the scheduler path doesn't pay for it
+    from deep_reader.collector.snapshot import import_snapshot
+
+    import_snapshot(
+        args.path,
+        batch_size=args.batch_size,
+        checkpoint_path=args.checkpoint,
+        restart=args.restart,
+        limit=args.limit,
+        category_prefixes=args.category_prefix,
+    )
+
+def run_export(args):
+    from deep_reader.storage.export import write_export
+    from deep_reader.storage.partitioned import open_vault
+
+    chunks = open_vault().iter_paper_rows(
+        topic=args.topic,
+        start_date=args.start_date,
+        end_date=args.end_date,
+        chunk_size=args.chunk_size,
+        category=args.category,
+    )
+    if args.format == "parquet":
+        if args.output == "-":
+            raise SystemExit("Parquet export needs --output <file>.")
+        rows = write_export(chunks, args.format, args.output)
+    elif args.output == "-":
+        rows = write_export(chunks, args.format, sys.stdout.buffer)
+    else:
+        with open(args.output, "wb") as f:
+            rows = write_export(chunks, args.format, f)
+    print(f"Exported {rows} papers.", file=sys.stderr)
+
+def run_backfill_command(args):
+    from deep_reader.backfill import run_backfill
+
+    run_backfill(
+        concurrency=args.concurrency,
+        batch_size=args.batch_size,
+        checkpoint_path=args.checkpoint,
+        restart=args.restart,
+        limit=args.limit,
+        fields=args.only or ("summary", "insights"),
+    )
+
+def run_fulltext_command(args):
+    from deep_reader.collector.pdf_fetcher import PdfDownloader
+    from deep_reader.fulltext import run_fulltext
+    from deep_reader.storage.fulltext import FullTextStore
+
+    store = FullTextStore(args.store)
+    downloader = PdfDownloader(str(store.root / "pdfs"), concurrency=args.concurrency, retries=args.retries)
+    run_fulltext(
+        store=store,
+        downloader=downloader,
+        workers=args.workers,
+        batch_size=args.batch_size,
+        limit=args.limit,
+        max_attempts=args.max_attempts,
+        keep_pdfs=args.keep_pdfs,
+    )
+
+def run_partition_command(args):
+    from deep_reader.storage.db_manager import DatabaseManager
+    from deep_reader.storage.partitioned import PartitionedDatabaseManager, migrate_to_partitions
+
+    vault = PartitionedDatabaseManager(args.root, granularity=args.granularity)
+    if args.migrate_from:
+        copied = migrate_to_partitions(DatabaseManager(args.migrate_from), vault)
+        print(f"Migrated {copied} papers into {vault.root}.")
+    if args.freeze_before:
+        frozen = vault.freeze_before(args.freeze_before)
+        print(f"Frozen partitions: {', '.join(frozen) or 'none'}.")
+    for key, path, read_only in vault.list_partitions():
+        print(f"{key:8s} {'read-only' if read_only else 'writable':10s} {path}")
+
+def run_subscriber_command(args):
+    from deep_reader.models import Subscriber
+    from deep_reader.storage.partitioned import open_vault
+
+    db = open_vault()
+    if args.action == "list":
+        for subscriber in db.list_subscribers(active_only=False):
+            state = "" if subscriber.active else " (inactive)"
+            print(f"{subscriber.email}{state}: keywords={subscriber.keywords} categories={subscriber.categories}")
+        return
+    if not args.email:
+        raise SystemExit(f"subscriber {args.action} needs an email address.")
+    if args.action == "add":
+        db.save_subscriber(Subscriber(email=args.email, name=args.name,
+                                      keywords=args.keyword or [], categories=args.category or []))
+        print(f"Saved subscriber {args.email}.")
+    elif db.delete_subscriber(args.email):
+        print(f"Removed subscriber {args.email}.")
+    else:
+        print(f"No subscriber {args.email}.")
 
 def main():
     load_dotenv()
@@ -12,20 +109,107 @@ def main():
     parser.add_argument("--run-once", action="store_true", help="Run the cycle once and exit")
     parser.add_argument("--schedule", action="store_true", help="Run in scheduled mode (daily)")
     parser.add_argument("--category", type=str, default="cs.AI", help="ArXiv category to fetch")
+    parser.add_argument("--arxiv-cache", choices=["off", "cache", "record", "replay"], default=None,
+                        help="arXiv page cache mode (default: $DEEP_READER_ARXIV_CACHE or off); "
+                             "'replay' re-runs a cycle from recorded pages without network access")
+
+    subparsers = parser.add_subparsers(dest="command")
+
+    import_parser = subparsers.add_parser("import", help="Bulk import an arXiv metadata snapshot (JSON lines)")
+    import_parser.add_argument("path", type=str, help="Path to the snapshot, e.g. arxiv-metadata-oai-snapshot.json")
+    import_parser.add_argument("--batch-size", type=int, default=5000, help="Papers per transaction")
+    import_parser.add_argument("--checkpoint", type=str, default=None, help="Checkpoint file (default: <path>.checkpoint.json)")
+    import_parser.add_argument("--restart", action="store_true", help="Ignore the checkpoint and start from the beginning")
+    import_parser.add_argument("--limit", type=int, default=None, help="Stop after importing this many papers")
+    import_parser.add_argument("--category-prefix", type=str, action="append", default=None,
+                               help="Only import papers in matching categories, e.g. cs. (repeatable)")
+    import_parser.set_defaults(handler=run_import)
+
+    export_parser = subparsers.add_parser("export", help="Stream papers to NDJSON, CSV or Parquet")
+    export_parser.add_argument("--format", choices=["ndjson", "csv", "parquet"], default="ndjson")
+    export_parser.add_argument("--output", type=str, default="-", help="Output file ('-' for stdout)")
+    export_parser.add_argument("--topic", type=str, default=None)
+    export_parser.add_argument("--category", type=str, default=None, help="Only papers listed under this category")
+    export_parser.add_argument("--start-date", type=str, default=None, help="YYYY-MM-DD")
+    export_parser.add_argument("--end-date", type=str, default=None, help="YYYY-MM-DD")
+    export_parser.add_argument("--chunk-size", type=int, default=1000, help="Rows fetched per cursor round-trip")
+    export_parser.set_defaults(handler=run_export)
+
+    backfill_parser = subparsers.add_parser("backfill", help="Generate missing summaries and key insights for stored papers")
+    backfill_parser.add_argument("--concurrency", type=int, default=4, help="Maximum concurrent LLM requests")
+    backfill_parser.add_argument("--batch-size", type=int, default=50, help="Papers per committed batch")
+    backfill_parser.add_argument("--checkpoint", type=str, default="backfill.checkpoint.json", help="Progress file for resuming")
+    backfill_parser.add_argument("--restart", action="store_true", help="Ignore the checkpoint and start from the beginning")
+    backfill_parser.add_argument("--limit", type=int, default=None, help="Stop after this many papers")
+    backfill_parser.add_argument("--only", choices=["summary", "insights"], action="append", default=None,
+                                 help="Only generate this field (repeatable)")
+    backfill_parser.set_defaults(handler=run_backfill_command)
+
+    fulltext_parser = subparsers.add_parser("fulltext", help="Download PDFs and index their full text")
+    fulltext_parser.add_argument("--store", type=str, default=None, help="Full-text directory (default: $DEEP_READER_FULLTEXT_DIR or ./fulltext)")
+    fulltext_parser.add_argument("--concurrency", type=int, default=2, help="Simultaneous downloads")
+    fulltext_parser.add_argument("--retries", type=int, default=3, help="Retries per download")
+    fulltext_parser.add_argument("--workers", type=int, default=2, help="Text extraction processes")
+    fulltext_parser.add_argument("--batch-size", type=int, default=50, help="Papers per round")
+    fulltext_parser.add_argument("--limit", type=int, default=None, help="Stop after this many papers")
+    fulltext_parser.add_argument("--max-attempts", type=int, default=3, help="Give up on a paper after this many failed runs")
+    fulltext_parser.add_argument("--keep-pdfs", action="store_true", help="Keep PDFs after indexing")
+    fulltext_parser.set_defaults(handler=run_fulltext_command)
+
+    partition_parser = subparsers.add_parser("partition", help="Manage the time-partitioned vault layout")
+    partition_parser.add_argument("--root", type=str, default=None, help="Partition directory (default: $DEEP_READER_PARTITION_DIR or ./vault)")
+    partition_parser.add_argument("--granularity", choices=["year", "month"], default="year")
+    partition_parser.add_argument("--migrate-from", type=str, default=None, help="Copy this single-file vault into the partitions")
+    partition_parser.add_argument("--freeze-before", type=str, default=None,
+                                  help="Make partitions older than this key (e.g. 2024) read-only")
+    partition_parser.set_defaults(handler=run_partition_command)
+
+    subscriber_parser = subparsers.add_parser("subscriber", help="Manage digest subscribers and their topic rules")
+    subscriber_parser.add_argument("action", choices=["add", "list", "remove"])
+    subscriber_parser.add_argument("email", nargs="?", default=None)
+    subscriber_parser.add_argument("--name", type=str, default=None)
+    subscriber_parser.add_argument("--keyword", type=str, action="append", default=None,
+                                   help="Word or phrase to match in title/abstract (repeatable)")
+    subscriber_parser.add_argument("--category", type=str, action="append", default=None,
+                                   help="arXiv category to match, e.g. cs.CL (repeatable)")
+    subscriber_parser.set_defaults(handler=run_subscriber_command)
     
     args = parser.parse_args()
     
+    if args.command:
+        args.handler(args)
+        return
+
+    if not (args.run_once or args.schedule):
+        parser.print_help()
+        return
+
+    if args.arxiv_cache:
+        # Picked up by ArxivCollector, including in scheduled runs
+        os.environ["DEEP_READER_ARXIV_CACHE"] = args.arxiv_cache
+
+    # The ingestion stack is only needed by the cycle itself, not by the other subcommands
+    from deep_reader.core_loop import run_daily_cycle
+
     if args.run_once:
         run_daily_cycle(category=args.category)
     elif args.schedule:
+        from apscheduler.schedulers.background import BackgroundScheduler
+        from apscheduler.triggers.cron import CronTrigger
+        from deep_reader.recommender.engine import RecommendationEngine
+        from deep_reader.storage.partitioned import open_vault
+
         scheduler = BackgroundScheduler()
+        db = open_vault()
         # Schedule to run every day at 08:00 AM
         trigger = CronTrigger(hour=8, minute=0)
         
         scheduler.add_job(
             run_daily_cycle,
             trigger=trigger,
-            kwargs={"category": args.category},
+            # One vault and engine for the life of the scheduler: each cycle only
+            # syncs the vectors added since the last one into the engine's matrix
+            kwargs={"category": args.category, "db": db, "recommender": RecommendationEngine(db)},
             id="daily_cycle",
             name="Daily Research Paper Fetch",
             replace_existing=True
@@ -41,8 +225,6 @@ def main():
         except (KeyboardInterrupt, SystemExit):
             print("Stopping scheduler...")
             scheduler.shutdown()
-    else:
-        parser.print_help()
 
 if __name__ == "__main__":
     main()
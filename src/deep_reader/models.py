@@ -2,6 +2,22 @@ from datetime import datetime
 from typing import List, Optional
 from pydantic import BaseModel, Field, ConfigDict
 
+# Placeholders stored in llm_summary/key_insights instead of a real result. The backfill treats them as missing.
+SUMMARY_UNAVAILABLE = "Summary unavailable (LLM not configured)."
+SUMMARY_FAILED_PREFIX = "Summary generation failed:"
+INSIGHTS_UNAVAILABLE = "Key insights unavailable (LLM not configured)."
+INSIGHTS_FAILED_PREFIX = "Key insights generation failed:"
+
+
+def is_failed_output(text: Optional[str]) -> bool:
+    """True if `text` is missing or one of the placeholders returned on failure."""
+    return (
+        not text
+        or text in (SUMMARY_UNAVAILABLE, INSIGHTS_UNAVAILABLE)
+        or text.startswith((SUMMARY_FAILED_PREFIX, INSIGHTS_FAILED_PREFIX))
+    )
+
+
 class Paper(BaseModel):
     """
     Represents a research paper from ArXiv or other sources.
@@ -21,3 +37,20 @@ class Paper(BaseModel):
     key_insights: Optional[str] = None # Can be JSON string or Markdown list
     
     model_config = ConfigDict(frozen=True)
+
+
+class Subscriber(BaseModel):
+    """
+    A digest recipient with their own routing rules.
+
+    A new paper goes to the subscriber if it contains any of `keywords`
+    (whole words or phrases, case-insensitive, in title or abstract) and has
+    any of `categories`. An empty rule list places no restriction.
+    """
+    email: str
+    name: Optional[str] = None
+    keywords: List[str] = Field(default_factory=list)
+    categories: List[str] = Field(default_factory=list)
+    active: bool = True
+
+    model_config = ConfigDict(frozen=True)
@@ -1,11 +1,21 @@
-import smtplib
 import os
+from pathlib import Path
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import List
+from typing import List, Tuple
 from dotenv import load_dotenv
 
-from deep_reader.models import Paper
+from deep_reader.models import Paper, Subscriber
+from deep_reader.notifier.outbox import SmtpOutbox
+from deep_reader.notifier.templates import render_digest
+
+def _default_spool_dir() -> str:
+    """`mail_spool` next to the vault's database, wherever the process was started from."""
+    if os.getenv("DEEP_READER_PARTITIONS"):
+        vault_dir = Path(os.getenv("DEEP_READER_PARTITION_DIR", "vault"))
+    else:
+        vault_dir = Path(os.getenv("DEEP_READER_DB", "deep_reader.db")).parent
+    return str((vault_dir / "mail_spool").resolve())
 
 class EmailNotifier:
     def __init__(self):
@@ -16,6 +26,14 @@ class EmailNotifier:
         self.password = os.getenv("SMTP_PASSWORD")
         self.sender_email = os.getenv("SENDER_EMAIL", self.user)
         self.recipient_email = os.getenv("RECIPIENT_EMAIL")
+        self.outbox = SmtpOutbox(
+            self.host,
+            self.port,
+            user=self.user,
+            password=self.password,
+            starttls=os.getenv("SMTP_STARTTLS", "true").lower() != "false",
+            spool_dir=os.getenv("SMTP_SPOOL_DIR") or _default_spool_dir(),
+        )
 
     def send_daily_digest(self, papers: List[Paper]):
         """Sends an email with the list of papers."""
@@ -23,37 +41,85 @@ class EmailNotifier:
             print("No papers to send.")
             return
 
+        self._send(f"DeepReader Daily Digest - {len(papers)} Papers", "Daily Research Papers", papers)
+
+    def send_recommendations(self, recommendations: List[Tuple[Paper, float]]):
+        """Sends vault papers recommended from the reader's profile (used when nothing new arrived)."""
+        if not recommendations:
+            print("No recommendations to send.")
+            return
+
+        self._send(
+            f"DeepReader Recommendations - {len(recommendations)} Papers",
+            "From Your Vault",
+            [paper for paper, _ in recommendations],
+            intro="No new papers matched today. These earlier papers match what you have been reading.",
+        )
+
+    def _send(self, subject: str, heading: str, papers: List[Paper], intro: str = None):
         if not self.user or not self.password or not self.recipient_email:
             print("SMTP credentials or recipient not set. Skipping email.")
             return
 
-        msg = MIMEMultipart()
-        msg["From"] = self.sender_email
-        msg["To"] = self.recipient_email
-        msg["Subject"] = f"DeepReader Daily Digest - {len(papers)} Papers"
+        msg = self._build_message(self.recipient_email, subject, heading, papers, intro)
+        if self.outbox.send([msg]):
+            print(f"Email sent to {self.recipient_email}")
 
-        body = self._format_email_body(papers)
-        msg.attach(MIMEText(body, "html"))
+    def send_digests(self, digests: List[Tuple[Subscriber, List[Paper]]]) -> int:
+        """
+        Sends one personalised digest per subscriber through the shared outbox.
 
-        try:
-            with smtplib.SMTP(self.host, self.port) as server:
-                server.starttls()
-                server.login(self.user, self.password)
-                server.send_message(msg)
-            print(f"Email sent to {self.recipient_email}")
-        except Exception as e:
-            print(f"Failed to send email: {e}")
-
-    def _format_email_body(self, papers: List[Paper]) -> str:
-        html = "<h1>Daily Research Papers</h1>"
-        for paper in papers:
-            html += f"""
-            <div style="margin-bottom: 20px; border-bottom: 1px solid #ccc; padding-bottom: 10px;">
-                <h3><a href="{paper.pdf_url or '#'}">{paper.title}</a></h3>
-                <p><strong>Authors:</strong> {', '.join(paper.authors)}</p>
-                <p><strong>Category:</strong> {paper.primary_category}</p>
-                <p>{paper.summary[:500]}...</p>
-                <p><em>Published: {paper.published_date.strftime('%Y-%m-%d')}</em></p>
-            </div>
-            """
-        return html
+        All digests go over the same SMTP session; digests that cannot be
+        delivered are spooled and retried on the next send.
+
+        Returns:
+            int: Number of digests sent.
+        """
+        digests = [(subscriber, papers) for subscriber, papers in digests if papers]
+        if not digests:
+            return 0
+
+        if not self.user or not self.password:
+            print("SMTP credentials not set. Skipping subscriber digests.")
+            return 0
+
+        messages = [
+            self._build_message(
+                subscriber.email,
+                f"DeepReader Daily Digest - {len(papers)} Papers",
+                "Daily Research Papers",
+                papers,
+                self._subscriber_intro(subscriber, papers),
+            )
+            for subscriber, papers in digests
+        ]
+        sent = self.outbox.send(messages)
+        print(f"Sent {sent}/{len(messages)} subscriber digests.")
+        return sent
+
+    def close(self):
+        """Ends the SMTP session kept open between sends."""
+        self.outbox.close()
+
+    def _build_message(self, recipient: str, subject: str, heading: str, papers: List[Paper], intro: str = None) -> MIMEMultipart:
+        digest = render_digest(heading, papers, intro)
+        msg = MIMEMultipart("alternative")
+        msg["From"] = self.sender_email
+        msg["To"] = recipient
+        msg["Subject"] = subject
+        # Mail clients show the last alternative they can render, so HTML goes last
+        msg.attach(MIMEText(digest.text, "plain"))
+        msg.attach(MIMEText(digest.html, "html"))
+        return msg
+
+    def _subscriber_intro(self, subscriber: Subscriber, papers: List[Paper]) -> str:
+        rules = []
+        if subscriber.keywords:
+            rules.append(f"keywords: {', '.join(subscriber.keywords)}")
+        if subscriber.categories:
+            rules.append(f"categories: {', '.join(subscriber.categories)}")
+        greeting = f"Hi {subscriber.name}, " if subscriber.name else ""
+        intro = f"{greeting}{len(papers)} new papers matched your profile"
+        if rules:
+            intro += f" ({'; '.join(rules)})"
+        return intro + "."
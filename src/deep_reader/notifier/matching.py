@@ -0,0 +1,112 @@
+from collections import deque
+from typing import Dict, Iterable, Iterator, List, Set, Tuple
+
+from deep_reader.models import Paper, Subscriber
+
+
+def normalize(text: str) -> str:
+    """Lowercases and collapses whitespace, so phrases match across line breaks."""
+    return " ".join(text.lower().split())
+
+
+class AhoCorasick:
+    """
+    Multi-pattern string matcher (Aho-Corasick automaton).
+
+    All patterns are compiled into one trie with failure links, so a text is
+    scanned once no matter how many patterns there are.
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        self.patterns: List[str] = list(patterns)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+
+        for index, pattern in enumerate(self.patterns):
+            state = 0
+            for ch in pattern:
+                if ch not in self._goto[state]:
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                    self._goto[state][ch] = len(self._goto) - 1
+                state = self._goto[state][ch]
+            self._out[state].append(index)
+
+        # Breadth-first, so a state's failure target is finished before its children need it
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and ch not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(ch, 0)
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """Yields `(start, pattern_index)` for every occurrence of every pattern in `text`."""
+        goto, fail, out, patterns = self._goto, self._fail, self._out, self.patterns
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for index in out[state]:
+                yield i - len(patterns[index]) + 1, index
+
+
+class DigestRouter:
+    """
+    Routes new papers to every subscriber whose rules they match.
+
+    The keywords of all subscribers are compiled into a single automaton, so
+    each paper's text is scanned once for the whole subscriber list instead of
+    once per subscriber or keyword.
+    """
+
+    def __init__(self, subscribers: List[Subscriber]):
+        self.subscribers = subscribers
+        keyword_owners: Dict[str, Set[int]] = {}
+        self._category_owners: Dict[str, Set[int]] = {}
+        for i, subscriber in enumerate(subscribers):
+            for keyword in subscriber.keywords:
+                if normalize(keyword):
+                    keyword_owners.setdefault(normalize(keyword), set()).add(i)
+            for category in subscriber.categories:
+                self._category_owners.setdefault(category, set()).add(i)
+        self._matcher = AhoCorasick(keyword_owners)
+        self._keyword_owners = [keyword_owners[p] for p in self._matcher.patterns]
+        self._needs_keyword = {i for i, s in enumerate(subscribers) if s.keywords}
+        self._needs_category = {i for i, s in enumerate(subscribers) if s.categories}
+        self._unrestricted = {i for i, s in enumerate(subscribers) if not s.keywords and not s.categories}
+
+    def match(self, paper: Paper) -> Set[int]:
+        """Indexes of the subscribers `paper` should go to."""
+        text = normalize(f"{paper.title} {paper.summary}")
+        keyword_hits: Set[int] = set()
+        for start, index in self._matcher.iter_matches(text):
+            end = start + len(self._matcher.patterns[index])
+            # Whole words only: "rag" must not match "storage"
+            if (start == 0 or not text[start - 1].isalnum()) and (end == len(text) or not text[end].isalnum()):
+                keyword_hits |= self._keyword_owners[index]
+
+        category_hits: Set[int] = set()
+        for category in paper.categories:
+            category_hits |= self._category_owners.get(category, set())
+
+        return {
+            i for i in keyword_hits | category_hits | self._unrestricted
+            if (i not in self._needs_keyword or i in keyword_hits)
+            and (i not in self._needs_category or i in category_hits)
+        }
+
+    def route(self, papers: List[Paper]) -> List[Tuple[Subscriber, List[Paper]]]:
+        """Returns each subscriber with at least one matching paper, with their papers in batch order."""
+        routed: Dict[int, List[Paper]] = {}
+        for paper in papers:
+            for i in self.match(paper):
+                routed.setdefault(i, []).append(paper)
+        return [(self.subscribers[i], routed[i]) for i in sorted(routed)]
@@ -0,0 +1,220 @@
+import os
+import smtplib
+import time
+import uuid
+from email import message_from_bytes, policy
+from email.message import Message
+from pathlib import Path
+from typing import Iterable, Optional
+
+
+class SmtpOutbox:
+    """
+    Sends messages over one long-lived SMTP session and spools what it cannot deliver.
+
+    The session (connect, STARTTLS, login) is opened on the first message and
+    reused for every following one; after `idle_seconds` without traffic it is
+    probed with NOOP before reuse. A dropped connection or a transient (4xx)
+    reply closes the session and the message is retried on a fresh one with
+    exponential backoff. Messages that still fail are written to `spool_dir`
+    as `.eml` files and retried by `flush_spool()`, which the next send runs
+    first. If the server cannot be reached at all, the rest of the batch is
+    spooled without further connection attempts. Permanent (5xx) rejections
+    of a message are logged and dropped, since resending them cannot succeed;
+    recipients refused with a 4xx code (e.g. a full mailbox or greylisting)
+    are retried and spooled like any other transient failure.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int,
+        user: Optional[str] = None,
+        password: Optional[str] = None,
+        starttls: bool = True,
+        spool_dir: Optional[str] = None,
+        retries: int = 2,
+        backoff_seconds: float = 1.0,
+        idle_seconds: float = 30.0,
+        timeout: float = 30.0,
+    ):
+        """
+        Args:
+            host, port: SMTP server.
+            user, password: Login credentials (login is skipped when either is missing).
+            starttls: Upgrade the session with STARTTLS before logging in.
+            spool_dir: Directory for undelivered messages (None disables spooling).
+            retries: Extra attempts per message, each on a new session.
+            backoff_seconds: Base of the exponential wait between attempts.
+            idle_seconds: Idle time after which the session is checked with NOOP.
+            timeout: Socket timeout for the SMTP connection.
+        """
+        self.host = host
+        self.port = port
+        self.user = user
+        self.password = password
+        self.starttls = starttls
+        self.spool_dir = Path(spool_dir) if spool_dir else None
+        self.retries = retries
+        self.backoff_seconds = backoff_seconds
+        self.idle_seconds = idle_seconds
+        self.timeout = timeout
+
+        self._server: Optional[smtplib.SMTP] = None
+        self._last_used = 0.0
+        # Set when a session could not be opened; cleared at the start of each send()
+        self._offline = False
+
+    # --- Session ---
+
+    def _session(self) -> smtplib.SMTP:
+        if self._server is not None and time.monotonic() - self._last_used > self.idle_seconds:
+            try:
+                if self._server.noop()[0] != 250:
+                    self._drop()
+            except (smtplib.SMTPException, OSError):
+                self._drop()
+        if self._server is None:
+            server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+            try:
+                if self.starttls:
+                    server.starttls()
+                if self.user and self.password:
+                    server.login(self.user, self.password)
+            except BaseException:
+                server.close()
+                raise
+            self._server = server
+        return self._server
+
+    def _drop(self):
+        # The session is unusable; close the socket without another round trip
+        if self._server is not None:
+            try:
+                self._server.close()
+            except OSError:
+                pass
+            self._server = None
+
+    def close(self):
+        """Ends the SMTP session, if one is open."""
+        if self._server is not None:
+            try:
+                self._server.quit()
+            except (smtplib.SMTPException, OSError):
+                pass
+            self._drop()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # --- Delivery ---
+
+    def send(self, messages: Iterable[Message]) -> int:
+        """
+        Delivers messages in order over the shared session, after retrying the spool.
+
+        Returns:
+            int: Number of `messages` delivered (spooled and rejected ones are not counted).
+        """
+        self._offline = False
+        self.flush_spool()
+        sent = 0
+        for msg in messages:
+            # Once the server is unreachable, spool the rest instead of timing out on each message
+            status = "offline" if self._offline else self._deliver(msg)
+            if status == "sent":
+                sent += 1
+            elif status in ("retry", "offline"):
+                self._spool(msg)
+        return sent
+
+    def _deliver(self, msg: Message, attempts: Optional[int] = None) -> str:
+        """
+        Returns "sent", "rejected" (permanent failure), "retry" (gave up for now)
+        or "offline" (no session could be opened on the last attempt).
+        """
+        attempts = self.retries + 1 if attempts is None else attempts
+        for attempt in range(attempts):
+            connected = False
+            try:
+                server = self._session()
+                connected = True
+                server.send_message(msg)
+                self._last_used = time.monotonic()
+                return "sent"
+            except smtplib.SMTPRecipientsRefused as e:
+                if all(code >= 500 for code, _ in e.recipients.values()):
+                    print(f"Recipient refused for {msg['To']}: {e.recipients}")
+                    return "rejected"
+                error = e
+            except smtplib.SMTPResponseException as e:
+                permanent = connected and e.smtp_code >= 500
+                if permanent:
+                    print(f"Message to {msg['To']} rejected: {e.smtp_code} {e.smtp_error!r}")
+                    # The session is still usable after a rejected transaction
+                    self._reset()
+                    return "rejected"
+                error = e
+            except (smtplib.SMTPException, OSError) as e:
+                error = e
+            self._drop()
+            if attempt + 1 < attempts:
+                wait = self.backoff_seconds * (2 ** attempt)
+                print(f"Sending to {msg['To']} failed ({error}); retrying in {wait:.1f}s...")
+                time.sleep(wait)
+        print(f"Giving up on {msg['To']} for now: {error}")
+        if not connected:
+            self._offline = True
+            return "offline"
+        return "retry"
+
+    def _reset(self):
+        try:
+            self._server.rset()
+        except (smtplib.SMTPException, OSError):
+            self._drop()
+
+    # --- Spool ---
+
+    def _spool(self, msg: Message):
+        if self.spool_dir is None:
+            return
+        self.spool_dir.mkdir(parents=True, exist_ok=True)
+        # Time-ordered names keep retries in the original send order
+        path = self.spool_dir / f"{time.time_ns():020d}-{uuid.uuid4().hex[:8]}.eml"
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(msg.as_bytes(policy=policy.SMTP))
+        os.replace(tmp, path)
+        print(f"Spooled message to {msg['To']} as {path.name}")
+
+    def spooled(self) -> int:
+        """Number of messages waiting in the spool."""
+        if self.spool_dir is None or not self.spool_dir.exists():
+            return 0
+        return sum(1 for _ in self.spool_dir.glob("*.eml"))
+
+    def flush_spool(self) -> int:
+        """
+        Retries spooled messages once each, oldest first, and stops at the first
+        one that still cannot be delivered (the server is most likely still down).
+
+        Returns:
+            int: Number of spooled messages delivered.
+        """
+        if not self.spooled():
+            return 0
+        sent = 0
+        for path in sorted(self.spool_dir.glob("*.eml")):
+            msg = message_from_bytes(path.read_bytes(), policy=policy.default)
+            status = self._deliver(msg, attempts=1)
+            if status in ("retry", "offline"):
+                break
+            path.unlink()
+            sent += status == "sent"
+        if sent:
+            print(f"Delivered {sent} spooled messages.")
+        return sent
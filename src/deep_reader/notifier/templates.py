@@ -0,0 +1,98 @@
+from html import escape
+from string import Template
+from typing import Iterable, List, NamedTuple, Optional
+
+from deep_reader.models import Paper
+
+# Compiled once at import; rendering only substitutes into these.
+_HTML_DOCUMENT = Template("""<html>
+<body style="font-family: sans-serif;">
+<h1>$heading</h1>
+$intro$papers</body>
+</html>
+""")
+
+_HTML_INTRO = Template("<p>$text</p>\n")
+
+_HTML_PAPER = Template("""<div style="margin-bottom: 20px; border-bottom: 1px solid #ccc; padding-bottom: 10px;">
+    <h3><a href="$url">$title</a></h3>
+    <p><strong>Authors:</strong> $authors</p>
+    <p><strong>Category:</strong> $category</p>
+    <p>$summary</p>
+    <p><em>Published: $published</em></p>
+</div>
+""")
+
+_TEXT_DOCUMENT = Template("""$heading
+$underline
+
+$intro$papers""")
+
+_TEXT_PAPER = Template("""$title
+  $authors
+  $category | Published: $published
+  $url
+
+  $summary
+
+""")
+
+
+class RenderedDigest(NamedTuple):
+    html: str
+    text: str
+
+
+def _fields(paper: Paper, summary_chars: int) -> dict:
+    summary = paper.summary
+    if len(summary) > summary_chars:
+        summary = summary[:summary_chars].rstrip() + "..."
+    return {
+        "url": paper.pdf_url or f"https://arxiv.org/abs/{paper.arxiv_id}",
+        "title": paper.title,
+        "authors": ", ".join(paper.authors),
+        "category": paper.primary_category,
+        "summary": summary,
+        "published": paper.published_date.strftime("%Y-%m-%d"),
+    }
+
+
+def render_digest(
+    heading: str,
+    papers: Iterable[Paper],
+    intro: Optional[str] = None,
+    summary_chars: int = 500,
+) -> RenderedDigest:
+    """
+    Renders a paper digest as HTML and as its plain-text alternative.
+
+    Every paper is visited once; both bodies are collected as lists of parts
+    and joined at the end, so large digests cost linear time. All values are
+    HTML-escaped in the HTML body (titles and abstracts routinely contain `<`
+    and `&`).
+
+    Args:
+        heading: Title line of the digest.
+        papers: Papers in display order.
+        intro: Optional sentence shown under the heading.
+        summary_chars: Abstracts are cut to this many characters.
+    """
+    html_parts: List[str] = []
+    text_parts: List[str] = []
+    for paper in papers:
+        fields = _fields(paper, summary_chars)
+        text_parts.append(_TEXT_PAPER.substitute(fields))
+        html_parts.append(_HTML_PAPER.substitute({k: escape(v) for k, v in fields.items()}))
+
+    html = _HTML_DOCUMENT.substitute(
+        heading=escape(heading),
+        intro=_HTML_INTRO.substitute(text=escape(intro)) if intro else "",
+        papers="".join(html_parts),
+    )
+    text = _TEXT_DOCUMENT.substitute(
+        heading=heading,
+        underline="=" * len(heading),
+        intro=f"{intro}\n\n" if intro else "",
+        papers="".join(text_parts),
+    )
+    return RenderedDigest(html, text)
@@ -0,0 +1,52 @@
+import re
+import zlib
+from typing import List
+
+import numpy as np
+
+from deep_reader.models import Paper
+
+_TOKEN = re.compile(r"\w+")
+
+# Too frequent in abstracts to say anything about a reader's interests
+STOPWORDS = frozenset("""
+a an and are as at be by for from has have in is it its of on or our that the their this to we which with
+using based via paper propose proposed show results method methods approach new can these also
+""".split())
+
+
+class HashingEmbedder:
+    """
+    Embeds papers as feature-hashed bag-of-words vectors.
+
+    The vault stores no model embeddings, and this needs no model, vocabulary
+    or fitting step: a paper's vector depends only on its own title and
+    abstract, so new papers can be embedded as they arrive. Vectors are
+    L2-normalised float32, so a dot product is a cosine similarity.
+    """
+
+    def __init__(self, dim: int = 512):
+        self.dim = dim
+
+    def tokens(self, text: str) -> List[str]:
+        return [t for t in _TOKEN.findall(text.lower()) if len(t) > 1 and t not in STOPWORDS]
+
+    def embed_text(self, text: str) -> np.ndarray:
+        vector = np.zeros(self.dim, dtype=np.float32)
+        for token in self.tokens(text):
+            h = zlib.crc32(token.encode("utf-8"))
+            # The top bit picks the sign so colliding tokens cancel out on average
+            vector[h % self.dim] += 1.0 if h & 0x80000000 else -1.0
+        # Sublinear term frequency keeps one repeated word from dominating
+        vector = np.sign(vector) * np.log1p(np.abs(vector))
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def embed_paper(self, paper: Paper) -> np.ndarray:
+        # The title is repeated to weigh it above any single abstract sentence
+        return self.embed_text(f"{paper.title} {paper.title} {paper.summary}")
+
+    def embed_papers(self, papers: List[Paper]) -> np.ndarray:
+        if not papers:
+            return np.zeros((0, self.dim), dtype=np.float32)
+        return np.vstack([self.embed_paper(p) for p in papers])
@@ -0,0 +1,207 @@
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from deep_reader.models import Paper
+from deep_reader.recommender.embedding import HashingEmbedder
+from deep_reader.storage.db_manager import DatabaseManager
+from deep_reader.storage.partitioned import open_vault
+
+# The email digest has a single recipient, who is this reader
+DEFAULT_READER = "default"
+
+# How much an interaction pulls the profile towards the paper
+EVENT_WEIGHTS = {"open": 1.0, "star": 3.0}
+
+
+class RecommendationEngine:
+    """
+    Recommends vault papers from per-reader interest profiles.
+
+    A profile is a decayed, weighted sum of the vectors of the papers a reader
+    opened or starred; it is updated in place on every interaction rather than
+    recomputed from the reader's history. Scores are the cosine similarity of
+    every stored paper vector with the profile (one matrix-vector product),
+    damped by the paper's age with a half-life. The top-k are selected with
+    `np.argpartition` and stored, so digests and the API read precomputed
+    rows instead of scoring the corpus per request.
+    """
+
+    def __init__(
+        self,
+        db: Optional[DatabaseManager] = None,
+        embedder: Optional[HashingEmbedder] = None,
+        half_life_days: float = 180.0,
+        top_k: int = 50,
+        profile_decay: float = 0.95,
+    ):
+        """
+        Args:
+            db: Vault to read vectors from and store profiles in.
+            embedder: Paper embedder (must match the one that wrote the stored vectors).
+            half_life_days: Age at which a paper's score is halved.
+            top_k: Recommendations precomputed per reader.
+            profile_decay: Factor applied to a profile before each interaction is added, so interests can drift.
+        """
+        self.db = db or open_vault()
+        self.embedder = embedder or HashingEmbedder()
+        self.half_life_days = half_life_days
+        self.top_k = top_k
+        self.profile_decay = profile_decay
+
+        # In-memory copy of paper_vectors, synced incrementally by row version
+        self._lock = threading.Lock()
+        self._ids: List[str] = []
+        self._positions: Dict[str, int] = {}
+        self._matrix = np.zeros((0, self.embedder.dim), dtype=np.float32)
+        self._published = np.zeros(0, dtype=np.float64)
+        self._size = 0
+        self._version = 0
+
+    # --- Paper vectors ---
+
+    def index_papers(self, papers: List[Paper]) -> int:
+        """Embeds and stores vectors for `papers` (existing vectors are overwritten)."""
+        if not papers:
+            return 0
+        vectors = self.embedder.embed_papers(papers)
+        self.db.save_paper_vectors([
+            (p.arxiv_id, p.published_date.timestamp(), v.tobytes()) for p, v in zip(papers, vectors)
+        ])
+        return len(papers)
+
+    def index_new_papers(self, batch_size: int = 1000) -> int:
+        """Embeds every paper in the vault that has no vector yet (e.g. after a snapshot import)."""
+        indexed = 0
+        while True:
+            papers = self.db.get_papers_without_vectors(limit=batch_size)
+            if not papers:
+                return indexed
+            indexed += self.index_papers(papers)
+
+    def _sync(self):
+        """Applies vectors stored or re-indexed since the last call to the in-memory matrix."""
+        rows = self.db.load_paper_vectors(after_version=self._version)
+        if not rows:
+            return
+        added = len({paper_id for _, paper_id, _, _ in rows} - self._positions.keys())
+        needed = self._size + added
+        if needed > len(self._matrix):
+            # Grow geometrically so repeated small syncs stay amortised O(1) per vector
+            capacity = max(needed, 2 * len(self._matrix), 1024)
+            matrix = np.zeros((capacity, self.embedder.dim), dtype=np.float32)
+            matrix[:self._size] = self._matrix[:self._size]
+            published = np.zeros(capacity, dtype=np.float64)
+            published[:self._size] = self._published[:self._size]
+            self._matrix, self._published = matrix, published
+
+        for _, paper_id, published_ts, blob in rows:
+            vector = np.frombuffer(blob, dtype=np.float32)
+            if vector.shape[0] != self.embedder.dim:
+                raise ValueError(
+                    f"Stored vector for {paper_id} has dimension {vector.shape[0]}, "
+                    f"but the embedder uses {self.embedder.dim}. Re-index the vault."
+                )
+            position = self._positions.get(paper_id)
+            if position is None:
+                position = self._size
+                self._positions[paper_id] = position
+                self._ids.append(paper_id)
+                self._size += 1
+            # Re-indexed papers overwrite their slot in place
+            self._matrix[position] = vector
+            self._published[position] = published_ts
+        self._version = rows[-1][0]
+
+    # --- Profiles ---
+
+    def record_interaction(self, reader_id: str, paper_id: str, event: str) -> bool:
+        """
+        Folds an "open" or "star" of `paper_id` into the reader's profile and
+        refreshes their recommendations.
+
+        Returns:
+            bool: False if this interaction was already recorded (the profile is left unchanged).
+
+        Raises:
+            ValueError: Unknown event.
+            KeyError: The paper is not in the vault.
+        """
+        if event not in EVENT_WEIGHTS:
+            raise ValueError(f"Unknown event {event!r}. Choose one of {', '.join(EVENT_WEIGHTS)}.")
+
+        blob = self.db.get_paper_vector(paper_id)
+        if blob is None:
+            paper = self.db.get_paper(paper_id)
+            if paper is None:
+                raise KeyError(paper_id)
+            vector = self.embedder.embed_paper(paper)
+            self.index_papers([paper])
+        else:
+            vector = np.frombuffer(blob, dtype=np.float32)
+
+        def update(stored):
+            if stored:
+                profile, events = np.frombuffer(stored[0], dtype=np.float32), stored[1]
+            else:
+                profile, events = np.zeros(self.embedder.dim, dtype=np.float32), 0
+            profile = (self.profile_decay * profile + EVENT_WEIGHTS[event] * vector).astype(np.float32)
+            return profile.tobytes(), events + 1
+
+        # Read-modify-write in one transaction, so concurrent events for a reader are not lost
+        if not self.db.apply_reader_event(reader_id, paper_id, event, update):
+            return False
+
+        self.refresh(reader_id)
+        return True
+
+    # --- Scoring ---
+
+    def refresh(self, reader_id: str, now: Optional[float] = None) -> List[Tuple[str, float]]:
+        """Rescores the vault for one reader and stores their top-k. Returns the stored list."""
+        stored = self.db.get_reader_profile(reader_id)
+        if not stored:
+            return []
+        profile = np.frombuffer(stored[0], dtype=np.float32)
+        norm = np.linalg.norm(profile)
+        if not norm:
+            return []
+        seen = self.db.get_reader_seen(reader_id)
+        now = time.time() if now is None else now
+
+        with self._lock:
+            self._sync()
+            size = self._size
+            scores = self._matrix[:size] @ (profile / norm)
+            age_days = np.maximum(now - self._published[:size], 0.0) / 86400.0
+            scores *= np.power(0.5, age_days / self.half_life_days)
+            for paper_id in seen:
+                position = self._positions.get(paper_id)
+                if position is not None:
+                    scores[position] = -np.inf
+
+            k = min(self.top_k, size)
+            if k == 0:
+                top = np.zeros(0, dtype=np.int64)
+            else:
+                top = np.argpartition(-scores, k - 1)[:k]
+                top = top[np.argsort(-scores[top], kind="stable")]
+            ranked = [(self._ids[i], float(scores[i])) for i in top if scores[i] > 0]
+
+        self.db.save_recommendations(reader_id, ranked)
+        return ranked
+
+    def refresh_all(self) -> int:
+        """Refreshes every reader with a profile (call after new papers were indexed)."""
+        readers = self.db.list_reader_ids()
+        for reader_id in readers:
+            self.refresh(reader_id)
+        return len(readers)
+
+    def recommend(self, reader_id: str = DEFAULT_READER, k: int = 10) -> List[Tuple[Paper, float]]:
+        """Returns the reader's precomputed recommendations, best first."""
+        scored = self.db.get_recommendations(reader_id, limit=k)
+        papers = {p.arxiv_id: p for p in self.db.get_papers([pid for pid, _ in scored])}
+        return [(papers[pid], score) for pid, score in scored if pid in papers]
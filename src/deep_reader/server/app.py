@@ -1,19 +1,29 @@
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+import os
+import sqlite3
+import tempfile
+import uuid
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Header, Request
 from fastapi.middleware.cors import CORSMiddleware
-from typing import List, Optional
+from fastapi.responses import FileResponse, StreamingResponse
+from starlette.background import BackgroundTask
+from typing import List, Literal, Optional
 from pydantic import BaseModel
 from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 
-from deep_reader.storage.db_manager import DatabaseManager
-from deep_reader.models import Paper
-from deep_reader.core_loop import run_daily_cycle
+from deep_reader.storage.partitioned import open_vault
+from deep_reader.storage.export import MEDIA_TYPES, iter_csv, iter_ndjson, write_parquet
+from deep_reader.server.events import JobEvents, change_stream, load_changes
+from deep_reader.models import Paper, Subscriber
 
 # Load env vars
 load_dotenv()
 
 # Initialize DB Manager
-db_manager = DatabaseManager()
+db_manager = open_vault()
+
+# Progress of triggered jobs, streamed to /api/changes/stream subscribers
+job_events = JobEvents()
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
@@ -41,6 +51,49 @@ class PaperListResponse(BaseModel):
     limit: int
     offset: int
 
+class FacetCount(BaseModel):
+    value: str
+    count: int
+
+class FacetResponse(BaseModel):
+    total: int
+    categories: List[FacetCount]
+    dates: List[FacetCount]
+
+class RecommendedPaper(BaseModel):
+    paper: Paper
+    score: float
+
+class RecommendationResponse(BaseModel):
+    reader_id: str
+    items: List[RecommendedPaper]
+
+class InteractionRequest(BaseModel):
+    reader_id: str = "default"
+    paper_id: str
+    event: Literal["open", "star"] = "open"
+
+class FullTextHit(BaseModel):
+    paper_id: str
+    seq: int
+    score: float
+    text: str
+
+class FullTextResponse(BaseModel):
+    query: str
+    items: List[FullTextHit]
+
+class ChangeItem(BaseModel):
+    seq: int
+    op: str
+    paper: Optional[Paper]
+
+class ChangeFeedResponse(BaseModel):
+    since: int
+    next_since: int
+    has_more: bool
+    items: List[ChangeItem]
+
 class TriggerRequest(BaseModel):
     category: str = "cs.AI OR cs.LG OR cs.CV OR cs.CL"
     days: Optional[int] = None
@@ -49,6 +102,41 @@ class TriggerRequest(BaseModel):
     start_date: Optional[str] = None
     end_date: Optional[str] = None
 
+def run_cycle_job(**kwargs):
+    # Imported on first trigger so read-only workers never load the ingestion stack (arXiv, LLM SDKs, SMTP)
+    from deep_reader.core_loop import run_daily_cycle
+
+    progress = kwargs.get("progress")
+    # Reuse the API's engine so a cycle syncs only the vectors it added, not the whole vault
+    kwargs.setdefault("recommender", get_recommender())
+    try:
+        run_daily_cycle(**kwargs)
+    except Exception as e:
+        if progress:
+            progress("failed", {"error": str(e)})
+        raise
+
+_recommender = None
+
+def get_recommender():
+    # Created on first use so numpy is only imported by workers that serve recommendations
+    global _recommender
+    if _recommender is None:
+        from deep_reader.recommender.engine import RecommendationEngine
+
+        _recommender = RecommendationEngine(db_manager)
+    return _recommender
+
+_fulltext_store = None
+
+def get_fulltext_store():
+    global _fulltext_store
+    if _fulltext_store is None:
+        from deep_reader.storage.fulltext import FullTextStore
+
+        _fulltext_store = FullTextStore()
+    return _fulltext_store
+
 # --- Endpoints ---
 
 @app.get("/", tags=["Health"])
@@ -62,6 +150,7 @@ async def get_papers(
     topic: Optional[str] = None,
     start_date: Optional[str] = None,
     end_date: Optional[str] = None,
+    category: Optional[str] = None,
 ):
     """
     Get a paginated list of papers.
@@ -72,11 +161,13 @@ async def get_papers(
         topic=topic,
         start_date=start_date,
         end_date=end_date,
+        category=category,
     )
     total = db_manager.count_papers_filtered(
         topic=topic,
         start_date=start_date,
         end_date=end_date,
+        category=category,
     )
     
     return PaperListResponse(
@@ -86,6 +177,94 @@ async def get_papers(
         offset=offset
     )
 
+@app.get("/api/facets", response_model=FacetResponse, tags=["Papers"])
+async def get_facets(
+    topic: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    category: Optional[str] = None,
+    category_limit: int = 50,
+):
+    """
+    Category and per-day histograms for the papers matching the filters.
+    With `category` set, `dates` is that category's papers per day.
+    """
+    facets = db_manager.get_facets(
+        topic=topic,
+        start_date=start_date,
+        end_date=end_date,
+        category=category,
+        category_limit=category_limit,
+    )
+    return FacetResponse(
+        total=facets["total"],
+        categories=[FacetCount(value=v, count=n) for v, n in facets["categories"]],
+        dates=[FacetCount(value=v, count=n) for v, n in facets["dates"]],
+    )
+
+@app.get("/api/papers/export", tags=["Papers"])
+def export_papers(
+    format: Literal["ndjson", "csv", "parquet"] = "ndjson",
+    topic: Optional[str] = None,
+    start_date: Optional[str] = None,
+    end_date: Optional[str] = None,
+    category: Optional[str] = None,
+    chunk_size: int = 1000,
+):
+    """
+    Export all papers matching the filters in one streamed response.
+
+    NDJSON and CSV are streamed straight from a database cursor in chunks.
+    Parquet (requires pyarrow) is written to a temporary file first, since the
+    format needs its footer before it can be read.
+    """
+    chunks = db_manager.iter_paper_rows(
+        topic=topic,
+        start_date=start_date,
+        end_date=end_date,
+        chunk_size=chunk_size,
+        category=category,
+    )
+    headers = {"Content-Disposition": f'attachment; filename="papers.{format}"'}
+
+    if format == "parquet":
+        fd, path = tempfile.mkstemp(suffix=".parquet")
+        os.close(fd)
+        try:
+            write_parquet(chunks, path)
+        except ImportError as e:
+            os.unlink(path)
+            raise HTTPException(status_code=501, detail=str(e))
+        finally:
+            # Releases the cursor's connection if writing stopped before the last chunk
+            chunks.close()
+        return FileResponse(path, media_type=MEDIA_TYPES[format], headers=headers,
+                            background=BackgroundTask(os.unlink, path))
+
+    encode = iter_ndjson if format == "ndjson" else iter_csv
+    return StreamingResponse(encode(chunks), media_type=MEDIA_TYPES[format], headers=headers)
+
+@app.get("/api/search/fulltext", response_model=FullTextResponse, tags=["Papers"])
+def search_fulltext(q: str, limit: int = 20):
+    """
+    Search the indexed full text of papers (FTS5 query syntax). Returns matching chunks, best first.
+    """
+    try:
+        hits = get_fulltext_store().search(q, limit=limit)
+    except sqlite3.OperationalError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid full-text query: {e}")
+    return FullTextResponse(query=q, items=[FullTextHit(**hit) for hit in hits])
+
+@app.get("/api/papers/{paper_id}/fulltext", tags=["Papers"])
+def get_paper_fulltext(paper_id: str):
+    """
+    Get the extracted full text of a paper as its stored chunks.
+    """
+    chunks = get_fulltext_store().get_chunks(paper_id)
+    if not chunks:
+        raise HTTPException(status_code=404, detail="Full text not indexed")
+    return {"paper_id": paper_id, "chunks": chunks}
+
 @app.get("/api/papers/{paper_id}", response_model=Paper, tags=["Papers"])
 async def get_paper_detail(paper_id: str):
     """
@@ -96,22 +275,108 @@ async def get_paper_detail(paper_id: str):
         raise HTTPException(status_code=404, detail="Paper not found")
     return paper
 
+@app.get("/api/recommendations", response_model=RecommendationResponse, tags=["Recommendations"])
+def get_recommendations(reader_id: str = "default", k: int = 10):
+    """
+    Get the reader's precomputed recommendations (refreshed on each interaction and fetch cycle).
+    """
+    items = get_recommender().recommend(reader_id, k=k)
+    return RecommendationResponse(
+        reader_id=reader_id,
+        items=[RecommendedPaper(paper=paper, score=score) for paper, score in items],
+    )
+
+@app.post("/api/recommendations/events", tags=["Recommendations"])
+def record_interaction(request: InteractionRequest):
+    """
+    Record that a reader opened or starred a paper and update their interest profile.
+    """
+    try:
+        recorded = get_recommender().record_interaction(request.reader_id, request.paper_id, request.event)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Paper not found")
+    return {"status": "recorded" if recorded else "duplicate"}
+
+@app.get("/api/changes", response_model=ChangeFeedResponse, tags=["Changes"])
+def get_changes(since: int = 0, limit: int = 500):
+    """
+    Papers inserted or updated after change `since`, oldest first, each at its latest change.
+    Poll again with `next_since`; `has_more` means the next page is already available.
+    A `reload` item without a paper marks a bulk import: re-read the paper list instead.
+    """
+    items, next_since = load_changes(db_manager, since, limit)
+    return ChangeFeedResponse(
+        since=since,
+        next_since=next_since,
+        has_more=len(items) == limit,
+        items=[ChangeItem(**item) for item in items],
+    )
+
+@app.get("/api/changes/stream", tags=["Changes"])
+async def stream_changes(
+    request: Request,
+    since: Optional[int] = None,
+    last_event_id: Optional[str] = Header(default=None),
+):
+    """
+    Server-sent events: `insert`/`update` events with the changed paper (SSE id = change seq)
+    and `job` events with the progress of triggered fetch cycles.
+
+    Starts after `since`, or after `Last-Event-ID` when an EventSource reconnects,
+    or at the current end of the feed.
+    """
+    if since is None:
+        if last_event_id and last_event_id.isdigit():
+            since = int(last_event_id)
+        else:
+            since = db_manager.get_change_seq()
+    return StreamingResponse(
+        change_stream(db_manager, job_events, since, request.is_disconnected),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+@app.get("/api/subscribers", response_model=List[Subscriber], tags=["Subscribers"])
+async def list_subscribers(active_only: bool = False):
+    """
+    List digest subscribers and their routing rules.
+    """
+    return db_manager.list_subscribers(active_only=active_only)
+
+@app.put("/api/subscribers", response_model=Subscriber, tags=["Subscribers"])
+async def save_subscriber(subscriber: Subscriber):
+    """
+    Create or update a subscriber. New papers matching any keyword and any category are sent to them.
+    """
+    db_manager.save_subscriber(subscriber)
+    return subscriber
+
+@app.delete("/api/subscribers/{email}", tags=["Subscribers"])
+async def delete_subscriber(email: str):
+    if not db_manager.delete_subscriber(email):
+        raise HTTPException(status_code=404, detail="Subscriber not found")
+    return {"status": "deleted"}
+
 @app.post("/api/trigger", tags=["Jobs"])
 async def trigger_fetch(request: TriggerRequest, background_tasks: BackgroundTasks):
     """
     Manually trigger the fetch cycle in the background.
     """
+    job_id = uuid.uuid4().hex[:12]
+    progress = job_events.reporter(job_id)
+    progress("queued", {})
     if request.query:
-        background_tasks.add_task(run_daily_cycle, query=request.query)
+        background_tasks.add_task(run_cycle_job, query=request.query, progress=progress)
         message = f"Fetch job triggered with custom query: {request.query}"
     else:
         background_tasks.add_task(
-            run_daily_cycle, 
+            run_cycle_job, 
             category=request.category, 
             days=request.days, 
             topic=request.topic,
             start_date_str=request.start_date,
-            end_date_str=request.end_date
+            end_date_str=request.end_date,
+            progress=progress,
         )
         msg_parts = [f"category: {request.category}"]
         if request.start_date and request.end_date:
@@ -124,4 +389,4 @@ async def trigger_fetch(request: TriggerRequest, background_tasks: BackgroundTas
             
         message = f"Fetch job triggered for {', '.join(msg_parts)}"
         
-    return {"status": "accepted", "message": message}
+    return {"status": "accepted", "message": message, "job_id": job_id}
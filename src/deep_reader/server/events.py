@@ -0,0 +1,120 @@
+import asyncio
+import json
+import threading
+import time
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from starlette.concurrency import run_in_threadpool
+
+from deep_reader.storage.db_manager import DatabaseManager
+
+ProgressCallback = Callable[[str, Dict[str, Any]], None]
+
+
+class JobEvents:
+    """
+    Recent progress events of background jobs, kept in memory.
+
+    Jobs run in worker threads and publish here; each SSE subscriber polls
+    with the id of the last event it saw. Only the newest `maxlen` events are
+    kept, so a subscriber that falls far behind skips older progress (paper
+    changes themselves are never lost, they come from the database).
+    """
+
+    def __init__(self, maxlen: int = 1000):
+        self._events: deque = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+        self._last_id = 0
+
+    @property
+    def last_id(self) -> int:
+        return self._last_id
+
+    def publish(self, job_id: str, stage: str, data: Optional[Dict[str, Any]] = None):
+        with self._lock:
+            self._last_id += 1
+            self._events.append({"id": self._last_id, "job_id": job_id, "stage": stage,
+                                 "time": time.time(), **(data or {})})
+
+    def reporter(self, job_id: str) -> ProgressCallback:
+        """Returns a `progress(stage, data)` callback bound to `job_id` (see `run_daily_cycle`)."""
+        return lambda stage, data=None: self.publish(job_id, stage, data)
+
+    def since(self, event_id: int) -> List[Dict[str, Any]]:
+        with self._lock:
+            return [event for event in self._events if event["id"] > event_id]
+
+
+def load_changes(db: DatabaseManager, since: int, limit: int) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Reads one page of the change feed with the changed papers attached.
+
+    Returns:
+        (items, next_since): items are `{"seq", "op", "paper"}` dicts, oldest first.
+        `paper` is None if the paper no longer exists, and for "reload" items.
+    """
+    changes = db.get_changes(since=since, limit=limit)
+    papers = {p.arxiv_id: p for p in db.get_papers([pid for _, pid, _ in changes])}
+    items = [{"seq": seq, "op": op, "paper": papers.get(pid)} for seq, pid, op in changes]
+    return items, changes[-1][0] if changes else since
+
+
+def format_sse(data: str, event: Optional[str] = None, event_id: Optional[int] = None) -> str:
+    lines = []
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    if event:
+        lines.append(f"event: {event}")
+    lines.extend(f"data: {line}" for line in data.splitlines() or [""])
+    return "\n".join(lines) + "\n\n"
+
+
+async def change_stream(
+    db: DatabaseManager,
+    jobs: JobEvents,
+    since: int,
+    is_disconnected: Callable[[], Awaitable[bool]],
+    poll_interval: float = 1.0,
+    keepalive_seconds: float = 15.0,
+    batch_size: int = 200,
+) -> AsyncIterator[str]:
+    """
+    Server-sent events for paper changes after `since` and for job progress.
+
+    Paper events are named after the change ("insert"/"update") and carry the
+    change seq as their SSE id, so a reconnecting EventSource resumes from
+    `Last-Event-ID` without gaps. A "reload" event (no paper) follows a bulk
+    import. Job events ("job") carry no id. The feed is
+    polled with one indexed range query per interval, so writers in other
+    processes (CLI imports, backfills) show up too.
+    """
+    job_cursor = jobs.last_id
+    last_sent = time.monotonic()
+    while not await is_disconnected():
+        sent = False
+        while True:
+            items, next_since = await run_in_threadpool(load_changes, db, since, batch_size)
+            for item in items:
+                paper = item["paper"]
+                payload = {"seq": item["seq"], "op": item["op"],
+                           "paper": paper.model_dump(mode="json") if paper else None}
+                yield format_sse(json.dumps(payload), event=item["op"], event_id=item["seq"])
+            since = next_since
+            sent = sent or bool(items)
+            if len(items) < batch_size:
+                break
+
+        for event in jobs.since(job_cursor):
+            job_cursor = event["id"]
+            yield format_sse(json.dumps(event), event="job")
+            sent = True
+
+        now = time.monotonic()
+        if sent:
+            last_sent = now
+        elif now - last_sent >= keepalive_seconds:
+            # Comment line: keeps proxies from closing an idle connection
+            yield ": keepalive\n\n"
+            last_sent = now
+        await asyncio.sleep(poll_interval)
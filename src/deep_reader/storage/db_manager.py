@@ -1,17 +1,90 @@
+import os
 import sqlite3
 import json
-from typing import Optional, List
-from datetime import datetime
+from collections import Counter
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, List, Tuple
+from datetime import datetime, timezone
+from pathlib import Path
+
+from deep_reader.models import (
+    INSIGHTS_FAILED_PREFIX,
+    INSIGHTS_UNAVAILABLE,
+    SUMMARY_FAILED_PREFIX,
+    SUMMARY_UNAVAILABLE,
+    Paper,
+    Subscriber,
+)
+
+# Rows the backfill still has to process: missing or empty intelligence fields, or stored failure
+# placeholders (the same outputs `is_failed_output` rejects).
+# Shared verbatim by the partial index and the query, so SQLite can use the index.
+NEEDS_INTELLIGENCE_SQL = (
+    "(llm_summary IS NULL OR key_insights IS NULL OR llm_summary = '' OR key_insights = ''"
+    f" OR llm_summary = '{SUMMARY_UNAVAILABLE}' OR llm_summary LIKE '{SUMMARY_FAILED_PREFIX}%'"
+    f" OR key_insights = '{INSIGHTS_UNAVAILABLE}' OR key_insights LIKE '{INSIGHTS_FAILED_PREFIX}%')"
+)
+
+# Secondary indexes are kept in one place so bulk loads can drop them and rebuild them once at the end.
+SECONDARY_INDEXES = {
+    "idx_papers_published_date": "CREATE INDEX IF NOT EXISTS idx_papers_published_date ON papers(published_date)",
+    "idx_paper_authors_author": "CREATE INDEX IF NOT EXISTS idx_paper_authors_author ON paper_authors(author_id)",
+    "idx_papers_needs_intelligence": (
+        f"CREATE INDEX IF NOT EXISTS idx_papers_needs_intelligence ON papers(arxiv_id) WHERE {NEEDS_INTELLIGENCE_SQL}"
+    ),
+}
+
+# Change-feed entry written once per bulk load instead of one per paper; it tells clients to re-sync
+BULK_LOAD_CHANGE = ("*", "reload")
+
+# Trade durability for speed while bulk loading. A crashed load is re-run from its checkpoint.
+BULK_LOAD_PRAGMAS = [
+    "PRAGMA synchronous = OFF",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -262144",  # 256 MiB
+]
+
+
+class BulkLoadSession:
+    """
+    Handle returned by `DatabaseManager.bulk_load`. Each `write` is one transaction.
+    """
+
+    def __init__(self, db: "DatabaseManager", conn: sqlite3.Connection):
+        self._db = db
+        self._conn = conn
+        self.written = 0
+
+    def write(self, papers: List[Paper]) -> int:
+        """Upserts a batch and commits it. Existing `llm_summary`/`key_insights` are kept."""
+        cursor = self._conn.cursor()
+        self._db._write_papers(cursor, papers, keep_intelligence=True, update_facets=False, record_changes=False)
+        self._conn.commit()
+        self.written += len(papers)
+        return len(papers)
 
-from deep_reader.models import Paper
 
 class DatabaseManager:
-    def __init__(self, db_path: str = "deep_reader.db"):
-        self.db_path = db_path
-        self._init_db()
+    def __init__(self, db_path: Optional[str] = None, read_only: bool = False, track_changes: bool = True):
+        """
+        Args:
+            db_path: SQLite file (defaults to `DEEP_READER_DB` or `deep_reader.db`).
+            read_only: Open an existing, immutable file without locking and never write to it
+                (used for frozen partitions, see `PartitionedDatabaseManager`).
+            track_changes: Record paper inserts/updates in the `paper_changes` feed. Partitions
+                turn this off because their catalog keeps the feed.
+        """
+        # DEEP_READER_DB lets the server and tools point at a different vault without code changes
+        self.db_path = db_path or os.getenv("DEEP_READER_DB", "deep_reader.db")
+        self.read_only = read_only
+        self.track_changes = track_changes
+        if not read_only:
+            self._init_db()
 
-    def _get_connection(self):
-        return sqlite3.connect(self.db_path)
+    def _get_connection(self, **kwargs):
+        if self.read_only:
+            return sqlite3.connect(f"{Path(self.db_path).resolve().as_uri()}?mode=ro&immutable=1", uri=True, **kwargs)
+        return sqlite3.connect(self.db_path, **kwargs)
 
     def _init_db(self):
         """Initialize the database schema."""
@@ -61,8 +134,179 @@ class DatabaseManager:
                     PRIMARY KEY (paper_id, author_id)
                 )
             """)
+
+            # Normalized categories: exact matches instead of LIKE on the JSON string
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS paper_categories (
+                    paper_id TEXT NOT NULL,
+                    category TEXT NOT NULL,
+                    PRIMARY KEY (category, paper_id)
+                ) WITHOUT ROWID
+            """)
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_paper_categories_paper ON paper_categories(paper_id)")
+
+            # Materialized facet aggregates, maintained incrementally by the save path
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS daily_counts (
+                    day TEXT PRIMARY KEY,  -- YYYY-MM-DD of published_date (UTC)
+                    count INTEGER NOT NULL
+                )
+            """)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS daily_category_counts (
+                    category TEXT NOT NULL,
+                    day TEXT NOT NULL,
+                    count INTEGER NOT NULL,
+                    PRIMARY KEY (category, day)
+                ) WITHOUT ROWID
+            """)
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_daily_category_counts_day ON daily_category_counts(day)")
+
+            # Recommendation data. Vectors are float32 bytes written by deep_reader.recommender.
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS paper_vectors (
+                    paper_id TEXT UNIQUE NOT NULL,
+                    published_ts REAL NOT NULL,  -- Unix time, for recency decay without a join
+                    vector BLOB NOT NULL,
+                    version INTEGER  -- Bumped on every upsert, so in-memory copies can sync re-indexed rows
+                )
+            """)
+            # Migration: vaults created before the version column get their rowid as version
+            try:
+                cursor.execute("ALTER TABLE paper_vectors ADD COLUMN version INTEGER")
+                cursor.execute("UPDATE paper_vectors SET version = rowid")
+            except sqlite3.OperationalError:
+                pass
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_paper_vectors_version ON paper_vectors(version)")
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS reader_profiles (
+                    reader_id TEXT PRIMARY KEY,
+                    vector BLOB NOT NULL,
+                    events INTEGER NOT NULL DEFAULT 0,
+                    updated_at TIMESTAMP
+                )
+            """)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS reader_events (
+                    reader_id TEXT NOT NULL,
+                    paper_id TEXT NOT NULL,
+                    event TEXT NOT NULL,  -- "open" or "star"
+                    created_at TIMESTAMP,
+                    PRIMARY KEY (reader_id, paper_id, event)
+                ) WITHOUT ROWID
+            """)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS reader_recommendations (
+                    reader_id TEXT NOT NULL,
+                    rank INTEGER NOT NULL,
+                    paper_id TEXT NOT NULL,
+                    score REAL NOT NULL,
+                    PRIMARY KEY (reader_id, rank)
+                ) WITHOUT ROWID
+            """)
+
+            # Change feed: the latest change of each paper. A new change moves the paper's row to
+            # a higher seq, so reading the feed is one range scan of the seq index.
+            cursor.execute("PRAGMA table_info(paper_changes)")
+            change_columns = {row[1] for row in cursor.fetchall()}
+            if change_columns and "inserted_seq" not in change_columns:
+                # Migration: vaults created with the append-only feed (one row per change)
+                cursor.execute("ALTER TABLE paper_changes RENAME TO paper_changes_log")
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS paper_changes (
+                    paper_id TEXT PRIMARY KEY,
+                    seq INTEGER NOT NULL,  -- only ever grows, so clients can resume from it
+                    op TEXT NOT NULL,  -- latest change: "insert", "update" or "reload"
+                    inserted_seq INTEGER,  -- seq of the paper's insert, if it was recorded
+                    changed_at TIMESTAMP
+                )
+            """)
+            cursor.execute("CREATE UNIQUE INDEX IF NOT EXISTS idx_paper_changes_seq ON paper_changes(seq)")
+            if change_columns and "inserted_seq" not in change_columns:
+                cursor.execute("""
+                    INSERT INTO paper_changes (paper_id, seq, op, inserted_seq, changed_at)
+                    SELECT paper_id, MAX(seq), 'update', MIN(CASE WHEN op = 'insert' THEN seq END), MAX(changed_at)
+                    FROM paper_changes_log GROUP BY paper_id
+                """)
+                cursor.execute("DROP TABLE paper_changes_log")
+
+            # Digest subscribers with their routing rules (JSON lists)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS subscribers (
+                    email TEXT PRIMARY KEY,
+                    name TEXT,
+                    keywords TEXT NOT NULL DEFAULT '[]',
+                    categories TEXT NOT NULL DEFAULT '[]',
+                    active INTEGER NOT NULL DEFAULT 1,
+                    created_at TIMESTAMP
+                )
+            """)
+
+            # Migration: the partial index of vaults created with an older NEEDS_INTELLIGENCE_SQL
+            cursor.execute("SELECT sql FROM sqlite_master WHERE name = 'idx_papers_needs_intelligence'")
+            row = cursor.fetchone()
+            if row and NEEDS_INTELLIGENCE_SQL not in row[0]:
+                cursor.execute("DROP INDEX idx_papers_needs_intelligence")
+
+            for index_sql in SECONDARY_INDEXES.values():
+                cursor.execute(index_sql)
+
+            # Migration: vaults created before the facet tables existed
+            cursor.execute("SELECT EXISTS(SELECT 1 FROM papers), EXISTS(SELECT 1 FROM paper_categories)")
+            has_papers, has_categories = cursor.fetchone()
+            if has_papers and not has_categories:
+                self._rebuild_facets(cursor)
             conn.commit()
 
+    def _rebuild_facets(self, cursor: sqlite3.Cursor):
+        """Recomputes paper_categories and the daily aggregates from the papers table."""
+        cursor.execute("DELETE FROM paper_categories")
+        cursor.execute("DELETE FROM daily_counts")
+        cursor.execute("DELETE FROM daily_category_counts")
+        cursor.execute("""
+            INSERT OR IGNORE INTO paper_categories (paper_id, category)
+            SELECT p.arxiv_id, j.value FROM papers p, json_each(p.categories) j
+        """)
+        cursor.execute("""
+            INSERT INTO daily_counts (day, count)
+            SELECT strftime('%Y-%m-%d', published_date), COUNT(*) FROM papers GROUP BY 1
+        """)
+        cursor.execute("""
+            INSERT INTO daily_category_counts (category, day, count)
+            SELECT pc.category, strftime('%Y-%m-%d', p.published_date) AS day, COUNT(*)
+            FROM paper_categories pc JOIN papers p ON p.arxiv_id = pc.paper_id
+            GROUP BY pc.category, day
+        """)
+
+    @contextmanager
+    def bulk_load(self) -> Iterator[BulkLoadSession]:
+        """
+        Opens a session tuned for loading millions of rows.
+
+        Applies `BULK_LOAD_PRAGMAS` and drops `SECONDARY_INDEXES` for the duration of
+        the session; the indexes and facet aggregates are rebuilt once when the session ends.
+        Instead of one change-feed row per paper, a session that wrote anything records a
+        single `BULK_LOAD_CHANGE`.
+        """
+        conn = self._get_connection()
+        session = BulkLoadSession(self, conn)
+        try:
+            for pragma in BULK_LOAD_PRAGMAS:
+                conn.execute(pragma)
+            for name in SECONDARY_INDEXES:
+                conn.execute(f"DROP INDEX IF EXISTS {name}")
+            conn.commit()
+            yield session
+        finally:
+            conn.rollback()
+            for index_sql in SECONDARY_INDEXES.values():
+                conn.execute(index_sql)
+            self._rebuild_facets(conn.cursor())
+            if self.track_changes and session.written:
+                self._record_changes(conn.cursor(), [BULK_LOAD_CHANGE])
+            conn.commit()
+            conn.close()
+
     def _parse_date(self, date_val):
         """Parses a date value which might be a string or datetime object."""
         if isinstance(date_val, str):
@@ -81,47 +325,584 @@ class DatabaseManager:
                 return date_val # Return as is or raise
         return date_val
 
+    def _iso_date(self, date_val):
+        """ISO string of a stored date; values that do not parse (including NULL) are passed through unchanged."""
+        parsed = self._parse_date(date_val)
+        return parsed.isoformat() if isinstance(parsed, datetime) else parsed
+
+    def _paper_from_row(self, row: Dict[str, Any]) -> Paper:
+        """
+        Builds a `Paper` from a row dict as yielded by `iter_paper_rows`.
+
+        Raises:
+            ValueError: The row does not make a valid paper (e.g. a NULL or unparseable date).
+        """
+        return Paper(**{
+            **row,
+            "published_date": self._parse_date(row["published_date"]),
+            "updated_date": self._parse_date(row["updated_date"]),
+        })
+
     def save_paper(self, paper: Paper):
         """Saves a paper and its authors to the database."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
-            
-            # 1. Insert Paper
-            # Convert list categories to JSON
-            categories_json = json.dumps(paper.categories)
-            
-            cursor.execute("""
+            self._write_papers(cursor, [paper])
+            conn.commit()
+
+    def save_papers(self, papers: Iterable[Paper], batch_size: int = 1000) -> int:
+        """
+        Saves many papers, committing once per batch instead of once per paper.
+
+        Args:
+            papers: Papers to upsert. May be a generator; it is consumed lazily.
+            batch_size: Number of papers written per transaction.
+
+        Returns:
+            int: Number of papers written.
+        """
+        written = 0
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            batch: List[Paper] = []
+            for paper in papers:
+                batch.append(paper)
+                if len(batch) >= batch_size:
+                    self._write_papers(cursor, batch)
+                    conn.commit()
+                    written += len(batch)
+                    batch = []
+            if batch:
+                self._write_papers(cursor, batch)
+                conn.commit()
+                written += len(batch)
+        return written
+
+    def _write_papers(
+        self,
+        cursor: sqlite3.Cursor,
+        papers: List[Paper],
+        keep_intelligence: bool = False,
+        update_facets: bool = True,
+        record_changes: bool = True,
+    ):
+        """
+        Writes papers and their author links using the given cursor (no commit).
+
+        Args:
+            cursor: Cursor of an open transaction.
+            papers: Papers to upsert.
+            keep_intelligence: If True, rows that already exist keep their `llm_summary`
+                and `key_insights` (used by metadata-only imports).
+            update_facets: Maintain paper_categories and the daily aggregates. Bulk
+                loads turn this off and rebuild them once at the end instead.
+            record_changes: Append the changed papers to the change feed (if this
+                manager tracks changes). Bulk loads record one entry at the end instead.
+        """
+        rows = self._paper_rows(papers)
+
+        if self.track_changes and record_changes:
+            self._record_changes(cursor, self._diff_rows(cursor, rows, keep_intelligence))
+
+        if update_facets:
+            self._update_facets(cursor, papers)
+
+        # 1. Insert Papers
+        if keep_intelligence:
+            paper_sql = """
+                INSERT INTO papers
+                (arxiv_id, title, summary, published_date, updated_date, primary_category, categories, pdf_url, llm_summary, key_insights)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(arxiv_id) DO UPDATE SET
+                    title = excluded.title,
+                    summary = excluded.summary,
+                    published_date = excluded.published_date,
+                    updated_date = excluded.updated_date,
+                    primary_category = excluded.primary_category,
+                    categories = excluded.categories,
+                    pdf_url = excluded.pdf_url
+            """
+        else:
+            paper_sql = """
                 INSERT OR REPLACE INTO papers 
                 (arxiv_id, title, summary, published_date, updated_date, primary_category, categories, pdf_url, llm_summary, key_insights)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
+            """
+        cursor.executemany(paper_sql, rows)
+
+        # 2. Insert Authors (if not exists) and Link
+        # Resolving the author id inside the INSERT avoids a SELECT round-trip per author.
+        author_links = [(paper.arxiv_id, name) for paper in papers for name in paper.authors]
+        cursor.executemany("INSERT OR IGNORE INTO authors (name) VALUES (?)",
+                           [(name,) for _, name in author_links])
+        cursor.executemany("""
+            INSERT OR IGNORE INTO paper_authors (paper_id, author_id)
+            SELECT ?, id FROM authors WHERE name = ?
+        """, author_links)
+
+    @staticmethod
+    def _paper_rows(papers: List[Paper]) -> List[tuple]:
+        """Parameters for the papers INSERT, in column order."""
+        return [
+            (
                 paper.arxiv_id,
                 paper.title,
                 paper.summary,
                 paper.published_date,
                 paper.updated_date,
                 paper.primary_category,
-                categories_json,
+                json.dumps(paper.categories),
                 paper.pdf_url,
                 paper.llm_summary,
                 paper.key_insights
-            ))
-            
-            # 2. Insert Authors and Link
-            for author_name in paper.authors:
-                # Insert author if not exists
-                cursor.execute("INSERT OR IGNORE INTO authors (name) VALUES (?)", (author_name,))
-                
-                # Get author ID (whether inserted or existed)
-                cursor.execute("SELECT id FROM authors WHERE name = ?", (author_name,))
-                author_id = cursor.fetchone()[0]
-                
-                # Link
-                cursor.execute("INSERT OR IGNORE INTO paper_authors (paper_id, author_id) VALUES (?, ?)", 
-                               (paper.arxiv_id, author_id))
-            
+            )
+            for paper in papers
+        ]
+
+    def _diff_papers(self, papers: List[Paper], keep_intelligence: bool = False) -> List[Tuple[str, str]]:
+        """`_diff_rows` for papers against this file's committed state."""
+        with self._get_connection() as conn:
+            return self._diff_rows(conn.cursor(), self._paper_rows(papers), keep_intelligence)
+
+    @staticmethod
+    def _diff_rows(cursor: sqlite3.Cursor, rows: List[tuple], keep_intelligence: bool) -> List[Tuple[str, str]]:
+        """
+        Compares papers rows about to be written with the stored ones.
+
+        Returns:
+            `(paper_id, op)` for rows that are new ("insert") or differ ("update").
+            Re-saving an unchanged paper, as every fetch cycle does, yields nothing.
+        """
+        # Stored values are compared as SQLite returns them: datetimes as their ISO text
+        def normalize(row):
+            row = tuple(v.isoformat(" ") if isinstance(v, datetime) else v for v in row)
+            return row[:8] if keep_intelligence else row
+
+        ids = [row[0] for row in rows]
+        stored: Dict[str, tuple] = {}
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            marks = ",".join("?" * len(chunk))
+            cursor.execute(f"""
+                SELECT arxiv_id, title, summary, published_date, updated_date, primary_category,
+                       categories, pdf_url, llm_summary, key_insights
+                FROM papers WHERE arxiv_id IN ({marks})
+            """, chunk)
+            stored.update((row[0], normalize(row)) for row in cursor.fetchall())
+
+        changes = []
+        for row in rows:
+            new = normalize(row)
+            old = stored.get(row[0])
+            if old != new:
+                changes.append((row[0], "insert" if old is None else "update"))
+                stored[row[0]] = new
+        return changes
+
+    @staticmethod
+    def _existing_ids(cursor: sqlite3.Cursor, arxiv_ids: List[str]) -> set:
+        existing = set()
+        for start in range(0, len(arxiv_ids), 500):
+            chunk = arxiv_ids[start:start + 500]
+            marks = ",".join("?" * len(chunk))
+            cursor.execute(f"SELECT arxiv_id FROM papers WHERE arxiv_id IN ({marks})", chunk)
+            existing.update(r[0] for r in cursor.fetchall())
+        return existing
+
+    @staticmethod
+    def _record_changes(cursor: sqlite3.Cursor, changes: List[Tuple[str, str]]):
+        """Moves each `(paper_id, op)` to the next seq of the change feed, in the caller's transaction."""
+        now = datetime.now(timezone.utc)
+        # WHERE true: an upsert's SELECT needs a WHERE clause to parse unambiguously
+        cursor.executemany("""
+            INSERT INTO paper_changes (paper_id, seq, op, inserted_seq, changed_at)
+            SELECT ?1, next.seq, ?2, CASE WHEN ?2 = 'insert' THEN next.seq END, ?3
+            FROM (SELECT COALESCE(MAX(seq), 0) + 1 AS seq FROM paper_changes) AS next
+            WHERE true
+            ON CONFLICT(paper_id) DO UPDATE SET
+                seq = excluded.seq, op = excluded.op, changed_at = excluded.changed_at,
+                inserted_seq = COALESCE(excluded.inserted_seq, paper_changes.inserted_seq)
+        """, [(paper_id, op, now) for paper_id, op in changes])
+
+    def get_changes(self, since: int = 0, limit: int = 500) -> List[Tuple[int, str, str]]:
+        """
+        Returns `(seq, paper_id, op)` for papers changed after `since`, oldest first.
+
+        The feed keeps one row per paper, at its latest seq, so a client that fell
+        behind does not download the same paper several times, and each page is
+        one range scan of the seq index. `op` is "insert" if the paper was created
+        after `since`; "reload" (paper_id "*") marks a bulk load, after which
+        clients should re-read the vault. Pass the last returned seq as the next `since`.
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT seq, paper_id, CASE WHEN inserted_seq > ? THEN 'insert' ELSE op END
+                FROM paper_changes
+                WHERE seq > ?
+                ORDER BY seq
+                LIMIT ?
+            """, (since, since, limit))
+            return cursor.fetchall()
+
+    def get_change_seq(self) -> int:
+        """The latest change seq (0 for an empty feed); new subscribers start from here."""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT COALESCE(MAX(seq), 0) FROM paper_changes")
+            return cursor.fetchone()[0]
+
+    @staticmethod
+    def _day(value: datetime) -> str:
+        """Day bucket of a datetime, matching SQLite's strftime('%Y-%m-%d', ...) (UTC for aware values)."""
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc)
+        return value.strftime("%Y-%m-%d")
+
+    def _update_facets(self, cursor: sqlite3.Cursor, papers: List[Paper]):
+        """Applies the facet deltas caused by upserting `papers` (call before writing them)."""
+        ids = list({paper.arxiv_id for paper in papers})
+        state: Dict[str, Tuple[str, frozenset]] = {}
+        for start in range(0, len(ids), 500):
+            chunk = ids[start:start + 500]
+            marks = ",".join("?" * len(chunk))
+            cursor.execute(
+                f"SELECT arxiv_id, strftime('%Y-%m-%d', published_date) FROM papers WHERE arxiv_id IN ({marks})",
+                chunk,
+            )
+            old_days = dict(cursor.fetchall())
+            cursor.execute(
+                f"SELECT paper_id, category FROM paper_categories WHERE paper_id IN ({marks})",
+                chunk,
+            )
+            old_categories: Dict[str, set] = {}
+            for pid, category in cursor.fetchall():
+                old_categories.setdefault(pid, set()).add(category)
+            for pid, day in old_days.items():
+                state[pid] = (day, frozenset(old_categories.get(pid, ())))
+
+        day_deltas: Counter = Counter()
+        category_deltas: Counter = Counter()
+        removed_links = []
+        added_links = []
+        # Walk the batch in order so a paper repeated within it is only counted once
+        for paper in papers:
+            old = state.get(paper.arxiv_id)
+            new = (self._day(paper.published_date), frozenset(paper.categories))
+            if old == new:
+                continue
+            if old:
+                day_deltas[old[0]] -= 1
+                for category in old[1]:
+                    category_deltas[(category, old[0])] -= 1
+                removed_links.extend((paper.arxiv_id, category) for category in old[1] - new[1])
+            day_deltas[new[0]] += 1
+            for category in new[1]:
+                category_deltas[(category, new[0])] += 1
+            added_links.extend((paper.arxiv_id, category) for category in new[1] - (old[1] if old else frozenset()))
+            state[paper.arxiv_id] = new
+
+        cursor.executemany("DELETE FROM paper_categories WHERE paper_id = ? AND category = ?", removed_links)
+        cursor.executemany("INSERT OR IGNORE INTO paper_categories (paper_id, category) VALUES (?, ?)", added_links)
+        cursor.executemany("""
+            INSERT INTO daily_counts (day, count) VALUES (?, ?)
+            ON CONFLICT(day) DO UPDATE SET count = count + excluded.count
+        """, [(day, delta) for day, delta in day_deltas.items() if delta])
+        cursor.executemany("""
+            INSERT INTO daily_category_counts (category, day, count) VALUES (?, ?, ?)
+            ON CONFLICT(category, day) DO UPDATE SET count = count + excluded.count
+        """, [(category, day, delta) for (category, day), delta in category_deltas.items() if delta])
+        cursor.executemany("DELETE FROM daily_counts WHERE day = ? AND count <= 0",
+                           [(day,) for day, delta in day_deltas.items() if delta < 0])
+        cursor.executemany("DELETE FROM daily_category_counts WHERE category = ? AND day = ? AND count <= 0",
+                           [key for key, delta in category_deltas.items() if delta < 0])
+
+    def get_backfill_candidates(self, after_id: str = "", limit: int = 100) -> List[Dict[str, Any]]:
+        """
+        Returns the next papers (by arxiv_id) that lack `llm_summary`/`key_insights`
+        or hold a failure placeholder in either field.
+
+        Keyset pagination over the partial index `idx_papers_needs_intelligence`
+        keeps each call cheap regardless of how far into the vault the backfill is.
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT arxiv_id, summary, llm_summary, key_insights FROM papers
+                WHERE {NEEDS_INTELLIGENCE_SQL} AND arxiv_id > ?
+                ORDER BY arxiv_id
+                LIMIT ?
+            """, (after_id, limit))
+            return [
+                {"arxiv_id": pid, "summary": summary, "llm_summary": llm_summ, "key_insights": insights}
+                for pid, summary, llm_summ, insights in cursor.fetchall()
+            ]
+
+    def get_pdf_candidates(self, after_id: str = "", limit: int = 100) -> List[Tuple[str, str]]:
+        """Returns the next `(arxiv_id, pdf_url)` pairs after `after_id` (keyset order) for papers with a PDF link."""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT arxiv_id, pdf_url FROM papers
+                WHERE arxiv_id > ? AND pdf_url IS NOT NULL AND pdf_url != ''
+                ORDER BY arxiv_id
+                LIMIT ?
+            """, (after_id, limit))
+            return cursor.fetchall()
+
+    def update_intelligence(self, updates: List[Tuple[str, Optional[str], Optional[str]]]) -> int:
+        """
+        Writes `(arxiv_id, llm_summary, key_insights)` updates in one transaction.
+        A None value leaves the stored field unchanged.
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany("""
+                UPDATE papers
+                SET llm_summary = COALESCE(?, llm_summary),
+                    key_insights = COALESCE(?, key_insights)
+                WHERE arxiv_id = ?
+            """, [(summary, insights, pid) for pid, summary, insights in updates])
+            updated = cursor.rowcount
+            if self.track_changes:
+                existing = self._existing_ids(cursor, [pid for pid, _, _ in updates])
+                self._record_changes(cursor, [(pid, "update") for pid, _, _ in updates if pid in existing])
+            conn.commit()
+            return updated
+
+    def _remove_papers(self, arxiv_ids: List[str]) -> int:
+        """
+        Deletes papers with their author and category links and takes them out
+        of the daily aggregates. Nothing is written to the change feed; this is
+        used when a paper moves to another partition, where it is re-inserted.
+        """
+        removed = 0
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            for start in range(0, len(arxiv_ids), 500):
+                chunk = arxiv_ids[start:start + 500]
+                marks = ",".join("?" * len(chunk))
+                cursor.execute(
+                    f"SELECT arxiv_id, strftime('%Y-%m-%d', published_date) FROM papers WHERE arxiv_id IN ({marks})",
+                    chunk,
+                )
+                days = dict(cursor.fetchall())
+                cursor.execute(f"SELECT paper_id, category FROM paper_categories WHERE paper_id IN ({marks})", chunk)
+                category_deltas = Counter((category, days[pid]) for pid, category in cursor.fetchall() if pid in days)
+                day_deltas = Counter(days.values())
+
+                cursor.executemany("UPDATE daily_counts SET count = count - ? WHERE day = ?",
+                                   [(delta, day) for day, delta in day_deltas.items()])
+                cursor.executemany("UPDATE daily_category_counts SET count = count - ? WHERE category = ? AND day = ?",
+                                   [(delta, category, day) for (category, day), delta in category_deltas.items()])
+                cursor.execute("DELETE FROM daily_counts WHERE count <= 0")
+                cursor.execute("DELETE FROM daily_category_counts WHERE count <= 0")
+                cursor.execute(f"DELETE FROM paper_categories WHERE paper_id IN ({marks})", chunk)
+                cursor.execute(f"DELETE FROM paper_authors WHERE paper_id IN ({marks})", chunk)
+                cursor.execute(f"DELETE FROM papers WHERE arxiv_id IN ({marks})", chunk)
+                removed += cursor.rowcount
+            conn.commit()
+        return removed
+
+    # --- Subscribers ---
+
+    def save_subscriber(self, subscriber: Subscriber):
+        """Creates or replaces a subscriber (keyed by email)."""
+        with self._get_connection() as conn:
+            conn.execute("""
+                INSERT INTO subscribers (email, name, keywords, categories, active, created_at)
+                VALUES (?, ?, ?, ?, ?, ?)
+                ON CONFLICT(email) DO UPDATE SET
+                    name = excluded.name, keywords = excluded.keywords,
+                    categories = excluded.categories, active = excluded.active
+            """, (subscriber.email, subscriber.name, json.dumps(subscriber.keywords),
+                  json.dumps(subscriber.categories), int(subscriber.active), datetime.now(timezone.utc)))
+            conn.commit()
+
+    def list_subscribers(self, active_only: bool = True) -> List[Subscriber]:
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute(f"""
+                SELECT email, name, keywords, categories, active FROM subscribers
+                {"WHERE active = 1" if active_only else ""}
+                ORDER BY email
+            """)
+            return [
+                Subscriber(email=email, name=name, keywords=json.loads(keywords),
+                           categories=json.loads(categories), active=bool(active))
+                for email, name, keywords, categories, active in cursor.fetchall()
+            ]
+
+    def delete_subscriber(self, email: str) -> bool:
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("DELETE FROM subscribers WHERE email = ?", (email,))
+            conn.commit()
+            return cursor.rowcount > 0
+
+    # --- Recommendation storage ---
+
+    def get_papers_without_vectors(self, limit: int = 1000) -> List[Paper]:
+        """Returns papers that have not been embedded yet."""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT p.arxiv_id FROM papers p
+                LEFT JOIN paper_vectors v ON v.paper_id = p.arxiv_id
+                WHERE v.paper_id IS NULL
+                LIMIT ?
+            """, (limit,))
+            ids = [r[0] for r in cursor.fetchall()]
+        return self.get_papers(ids)
+
+    def save_paper_vectors(self, rows: List[Tuple[str, float, bytes]]):
+        """Upserts `(paper_id, published_ts, vector_bytes)` rows, giving each a new version."""
+        with self._get_connection() as conn:
+            conn.executemany("""
+                INSERT INTO paper_vectors (paper_id, published_ts, vector, version)
+                VALUES (?, ?, ?, (SELECT COALESCE(MAX(version), 0) + 1 FROM paper_vectors))
+                ON CONFLICT(paper_id) DO UPDATE SET
+                    published_ts = excluded.published_ts, vector = excluded.vector, version = excluded.version
+            """, rows)
+            conn.commit()
+
+    def load_paper_vectors(self, after_version: int = 0) -> List[Tuple[int, str, float, bytes]]:
+        """Returns `(version, paper_id, published_ts, vector_bytes)` rows added or replaced after `after_version`."""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT version, paper_id, published_ts, vector FROM paper_vectors
+                WHERE version > ? ORDER BY version
+            """, (after_version,))
+            return cursor.fetchall()
+
+    def get_paper_vector(self, paper_id: str) -> Optional[bytes]:
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT vector FROM paper_vectors WHERE paper_id = ?", (paper_id,))
+            row = cursor.fetchone()
+            return row[0] if row else None
+
+    def get_reader_profile(self, reader_id: str) -> Optional[Tuple[bytes, int]]:
+        """Returns `(vector_bytes, events)` for a reader, or None if they have no profile yet."""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT vector, events FROM reader_profiles WHERE reader_id = ?", (reader_id,))
+            return cursor.fetchone()
+
+    def list_reader_ids(self) -> List[str]:
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT reader_id FROM reader_profiles ORDER BY reader_id")
+            return [r[0] for r in cursor.fetchall()]
+
+    def apply_reader_event(
+        self,
+        reader_id: str,
+        paper_id: str,
+        event: str,
+        update: Callable[[Optional[Tuple[bytes, int]]], Tuple[bytes, int]],
+    ) -> bool:
+        """
+        Records that a reader opened/starred a paper and updates their profile, atomically.
+
+        The event insert, profile read and profile write share one `BEGIN IMMEDIATE`
+        transaction, so concurrent events for the same reader are applied one after
+        another instead of overwriting each other.
+
+        Args:
+            update: Maps the stored `(vector_bytes, events)` (None for a new reader)
+                to the new profile.
+
+        Returns:
+            bool: False if the event was already recorded (the profile is left unchanged).
+        """
+        conn = self._get_connection(isolation_level=None)
+        try:
+            cursor = conn.cursor()
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.execute("""
+                INSERT OR IGNORE INTO reader_events (reader_id, paper_id, event, created_at)
+                VALUES (?, ?, ?, ?)
+            """, (reader_id, paper_id, event, datetime.now(timezone.utc)))
+            if cursor.rowcount == 0:
+                cursor.execute("ROLLBACK")
+                return False
+            cursor.execute("SELECT vector, events FROM reader_profiles WHERE reader_id = ?", (reader_id,))
+            vector, events = update(cursor.fetchone())
+            cursor.execute("""
+                INSERT OR REPLACE INTO reader_profiles (reader_id, vector, events, updated_at)
+                VALUES (?, ?, ?, ?)
+            """, (reader_id, vector, events, datetime.now(timezone.utc)))
+            cursor.execute("COMMIT")
+            return True
+        except BaseException:
+            if conn.in_transaction:
+                conn.rollback()
+            raise
+        finally:
+            conn.close()
+
+    def get_reader_seen(self, reader_id: str) -> List[str]:
+        """Papers the reader already interacted with (excluded from recommendations)."""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT DISTINCT paper_id FROM reader_events WHERE reader_id = ?", (reader_id,))
+            return [r[0] for r in cursor.fetchall()]
+
+    def save_recommendations(self, reader_id: str, scored: List[Tuple[str, float]]):
+        """Replaces the precomputed recommendations of a reader (best first)."""
+        with self._get_connection() as conn:
+            conn.execute("DELETE FROM reader_recommendations WHERE reader_id = ?", (reader_id,))
+            conn.executemany(
+                "INSERT INTO reader_recommendations (reader_id, rank, paper_id, score) VALUES (?, ?, ?, ?)",
+                [(reader_id, rank, pid, score) for rank, (pid, score) in enumerate(scored)],
+            )
             conn.commit()
 
+    def get_recommendations(self, reader_id: str, limit: int = 10) -> List[Tuple[str, float]]:
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT paper_id, score FROM reader_recommendations
+                WHERE reader_id = ? ORDER BY rank LIMIT ?
+            """, (reader_id, limit))
+            return cursor.fetchall()
+
+    def get_papers(self, arxiv_ids: List[str]) -> List[Paper]:
+        """Retrieves several papers by ID, in the given order (missing IDs are skipped)."""
+        papers = {}
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            for start in range(0, len(arxiv_ids), 500):
+                chunk = arxiv_ids[start:start + 500]
+                marks = ",".join("?" * len(chunk))
+                cursor.execute(f"SELECT * FROM papers WHERE arxiv_id IN ({marks})", chunk)
+                rows = cursor.fetchall()
+                cursor.execute(f"""
+                    SELECT pa.paper_id, a.name FROM paper_authors pa
+                    JOIN authors a ON a.id = pa.author_id
+                    WHERE pa.paper_id IN ({marks})
+                """, chunk)
+                authors: Dict[str, List[str]] = {}
+                for pid, name in cursor.fetchall():
+                    authors.setdefault(pid, []).append(name)
+                for (pid, title, summary, pub_date, upd_date, prim_cat, cats_json, pdf, llm_summ, insights) in rows:
+                    papers[pid] = Paper(
+                        arxiv_id=pid,
+                        title=title,
+                        authors=authors.get(pid, []),
+                        summary=summary,
+                        published_date=self._parse_date(pub_date),
+                        updated_date=self._parse_date(upd_date),
+                        primary_category=prim_cat,
+                        categories=json.loads(cats_json),
+                        pdf_url=pdf,
+                        llm_summary=llm_summ,
+                        key_insights=insights
+                    )
+        return [papers[pid] for pid in arxiv_ids if pid in papers]
+
     def get_paper(self, arxiv_id: str) -> Optional[Paper]:
         """Retrieves a paper by its ID."""
         with self._get_connection() as conn:
@@ -165,6 +946,135 @@ class DatabaseManager:
                 key_insights=insights
             )
             
+    def _build_filters(
+        self,
+        topic: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        category: Optional[str] = None,
+        schema: str = "main",
+    ) -> Tuple[str, List[str]]:
+        """
+        Builds the WHERE clause shared by the list, count, facet and export queries.
+
+        `schema` qualifies the tables the clause refers to, for queries against an ATTACHed database.
+        """
+        clauses = []
+        params: List[str] = []
+
+        if topic:
+            # Split topic into individual keywords and ensure all of them are present
+            # This increases robustness against minor title variations
+            keywords = topic.lower().split()
+            for kw in keywords:
+                like = f"%{kw}%"
+                clauses.append(
+                    "(LOWER(title) LIKE ? OR LOWER(summary) LIKE ? OR LOWER(primary_category) LIKE ? OR LOWER(categories) LIKE ?)"
+                )
+                params.extend([like, like, like, like])
+
+        if start_date:
+            # Use strftime style to ensure clean date comparison
+            clauses.append("strftime('%Y-%m-%d', published_date) >= ?")
+            params.append(start_date)
+
+        if end_date:
+            clauses.append("strftime('%Y-%m-%d', published_date) <= ?")
+            params.append(end_date)
+
+        if category:
+            # Exact match through the normalized table ("cs.CL" must not match "cs.CLx")
+            clauses.append(f"arxiv_id IN (SELECT paper_id FROM {schema}.paper_categories WHERE category = ?)")
+            params.append(category)
+
+        where_sql = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where_sql, params
+
+    @staticmethod
+    def _day_range(start_date: Optional[str], end_date: Optional[str], column: str = "day") -> Tuple[str, List[str]]:
+        """AND-clauses restricting a YYYY-MM-DD `column` of the aggregate tables."""
+        sql, params = "", []
+        if start_date:
+            sql += f" AND {column} >= ?"
+            params.append(start_date)
+        if end_date:
+            sql += f" AND {column} <= ?"
+            params.append(end_date)
+        return sql, params
+
+    def get_facets(
+        self,
+        topic: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        category: Optional[str] = None,
+        category_limit: int = 50,
+    ) -> Dict[str, Any]:
+        """
+        Category and per-day histograms for the papers matching the filters.
+
+        Without a topic, everything is read from the materialized aggregates (or
+        the category index when filtering by category). With a topic, matching
+        papers are collected into a temp table in one scan and both facets are
+        grouped from it, instead of scanning once per facet.
+
+        Returns:
+            dict: {"total": int, "categories": [(category, count)], "dates": [(day, count)]}
+            Categories are sorted by count (top `category_limit`), dates ascending.
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+
+            if not topic and not category:
+                day_sql, day_params = self._day_range(start_date, end_date)
+                cursor.execute(f"""
+                    SELECT category, SUM(count) AS n FROM daily_category_counts
+                    WHERE 1 = 1 {day_sql}
+                    GROUP BY category ORDER BY n DESC, category LIMIT ?
+                """, [*day_params, category_limit])
+                categories = cursor.fetchall()
+                cursor.execute(f"SELECT day, count FROM daily_counts WHERE 1 = 1 {day_sql} ORDER BY day", day_params)
+                dates = cursor.fetchall()
+                return {"total": sum(n for _, n in dates), "categories": categories, "dates": dates}
+
+            if not topic:
+                # Per-day counts of one category come straight from its aggregate rows
+                day_sql, day_params = self._day_range(start_date, end_date)
+                cursor.execute(
+                    f"SELECT day, count FROM daily_category_counts WHERE category = ? {day_sql} ORDER BY day",
+                    [category, *day_params],
+                )
+                dates = cursor.fetchall()
+                # Co-occurring categories, walking only this category's papers via the index
+                date_sql, date_params = self._day_range(start_date, end_date, "strftime('%Y-%m-%d', p.published_date)")
+                cursor.execute(f"""
+                    SELECT other.category, COUNT(*) AS n
+                    FROM paper_categories pc
+                    JOIN paper_categories other ON other.paper_id = pc.paper_id
+                    {"JOIN papers p ON p.arxiv_id = pc.paper_id" if date_sql else ""}
+                    WHERE pc.category = ? {date_sql}
+                    GROUP BY other.category ORDER BY n DESC, other.category LIMIT ?
+                """, [category, *date_params, category_limit])
+                categories = cursor.fetchall()
+                return {"total": sum(n for _, n in dates), "categories": categories, "dates": dates}
+
+            where_sql, params = self._build_filters(topic, start_date, end_date, category)
+            cursor.execute("DROP TABLE IF EXISTS temp.facet_matches")
+            cursor.execute(f"""
+                CREATE TEMP TABLE facet_matches AS
+                SELECT arxiv_id, strftime('%Y-%m-%d', published_date) AS day FROM papers {where_sql}
+            """, params)
+            cursor.execute("SELECT day, COUNT(*) FROM facet_matches GROUP BY day ORDER BY day")
+            dates = cursor.fetchall()
+            cursor.execute("""
+                SELECT pc.category, COUNT(*) AS n
+                FROM facet_matches m JOIN paper_categories pc ON pc.paper_id = m.arxiv_id
+                GROUP BY pc.category ORDER BY n DESC, pc.category LIMIT ?
+            """, (category_limit,))
+            categories = cursor.fetchall()
+            cursor.execute("DROP TABLE temp.facet_matches")
+            return {"total": sum(n for _, n in dates), "categories": categories, "dates": dates}
+
     def count_papers(self) -> int:
         with self._get_connection() as conn:
             cursor = conn.cursor()
@@ -176,34 +1086,24 @@ class DatabaseManager:
         topic: Optional[str] = None,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
+        category: Optional[str] = None,
     ) -> int:
         with self._get_connection() as conn:
             cursor = conn.cursor()
 
-            clauses = []
-            params: List[str] = []
-
-            if topic:
-                # Split topic into individual keywords and ensure all of them are present
-                # This increases robustness against minor title variations
-                keywords = topic.lower().split()
-                for kw in keywords:
-                    like = f"%{kw}%"
-                    clauses.append(
-                        "(LOWER(title) LIKE ? OR LOWER(summary) LIKE ? OR LOWER(primary_category) LIKE ? OR LOWER(categories) LIKE ?)"
+            if not topic:
+                # Date/category-only counts are answered from the daily aggregates
+                day_sql, day_params = self._day_range(start_date, end_date)
+                if category:
+                    cursor.execute(
+                        f"SELECT COALESCE(SUM(count), 0) FROM daily_category_counts WHERE category = ? {day_sql}",
+                        [category, *day_params],
                     )
-                    params.extend([like, like, like, like])
-
-            if start_date:
-                # Use strftime style to ensure clean date comparison
-                clauses.append("strftime('%Y-%m-%d', published_date) >= ?")
-                params.append(start_date)
+                else:
+                    cursor.execute(f"SELECT COALESCE(SUM(count), 0) FROM daily_counts WHERE 1 = 1 {day_sql}", day_params)
+                return cursor.fetchone()[0]
 
-            if end_date:
-                clauses.append("strftime('%Y-%m-%d', published_date) <= ?")
-                params.append(end_date)
-
-            where_sql = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+            where_sql, params = self._build_filters(topic, start_date, end_date, category)
 
             cursor.execute(
                 f"SELECT COUNT(*) FROM papers {where_sql}",
@@ -218,35 +1118,13 @@ class DatabaseManager:
         topic: Optional[str] = None,
         start_date: Optional[str] = None,
         end_date: Optional[str] = None,
+        category: Optional[str] = None,
     ) -> List[Paper]:
         """Retrieves a list of papers ordered by published date."""
         with self._get_connection() as conn:
             cursor = conn.cursor()
 
-            clauses = []
-            params: List[str] = []
-
-            if topic:
-                # Split topic into individual keywords and ensure all of them are present
-                # This increases robustness against minor title variations
-                keywords = topic.lower().split()
-                for kw in keywords:
-                    like = f"%{kw}%"
-                    clauses.append(
-                        "(LOWER(title) LIKE ? OR LOWER(summary) LIKE ? OR LOWER(primary_category) LIKE ? OR LOWER(categories) LIKE ?)"
-                    )
-                    params.extend([like, like, like, like])
-
-            if start_date:
-                # Use strftime style to ensure clean date comparison
-                clauses.append("strftime('%Y-%m-%d', published_date) >= ?")
-                params.append(start_date)
-
-            if end_date:
-                clauses.append("strftime('%Y-%m-%d', published_date) <= ?")
-                params.append(end_date)
-
-            where_sql = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+            where_sql, params = self._build_filters(topic, start_date, end_date, category)
 
             cursor.execute(
                 f"""
@@ -288,3 +1166,59 @@ class DatabaseManager:
                 ))
                 
             return papers
+
+    def iter_paper_rows(
+        self,
+        topic: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        chunk_size: int = 1000,
+        category: Optional[str] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Streams filtered papers as chunks of plain dicts (same keys as `Paper`).
+
+        Rows come from a single server-side cursor via `fetchmany`, and authors are
+        aggregated in SQL, so memory stays bounded by `chunk_size` no matter how
+        many rows match. Intended for exports; use `get_recent_papers` for pages.
+        """
+        where_sql, params = self._build_filters(topic, start_date, end_date, category)
+        # Streaming responses may resume the generator on a different worker thread
+        conn = self._get_connection(check_same_thread=False)
+        try:
+            cursor = conn.execute(
+                f"""
+                SELECT p.arxiv_id, p.title,
+                       (SELECT json_group_array(a.name) FROM paper_authors pa
+                        JOIN authors a ON a.id = pa.author_id
+                        WHERE pa.paper_id = p.arxiv_id) AS authors,
+                       p.summary, p.published_date, p.updated_date, p.primary_category,
+                       p.categories, p.pdf_url, p.llm_summary, p.key_insights
+                FROM papers p
+                {where_sql}
+                ORDER BY p.published_date DESC
+                """,
+                params,
+            )
+            while True:
+                rows = cursor.fetchmany(chunk_size)
+                if not rows:
+                    break
+                yield [
+                    {
+                        "arxiv_id": pid,
+                        "title": title,
+                        "authors": json.loads(authors_json),
+                        "summary": summary,
+                        "published_date": self._iso_date(pub_date),
+                        "updated_date": self._iso_date(upd_date),
+                        "primary_category": prim_cat,
+                        "categories": json.loads(cats_json),
+                        "pdf_url": pdf,
+                        "llm_summary": llm_summ,
+                        "key_insights": insights,
+                    }
+                    for (pid, title, authors_json, summary, pub_date, upd_date, prim_cat, cats_json, pdf, llm_summ, insights) in rows
+                ]
+        finally:
+            conn.close()
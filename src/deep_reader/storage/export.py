@@ -0,0 +1,125 @@
+import csv
+import io
+import json
+from typing import Any, Dict, Iterable, Iterator, List
+
+EXPORT_FORMATS = ("ndjson", "csv", "parquet")
+
+EXPORT_COLUMNS = [
+    "arxiv_id",
+    "title",
+    "authors",
+    "summary",
+    "published_date",
+    "updated_date",
+    "primary_category",
+    "categories",
+    "pdf_url",
+    "llm_summary",
+    "key_insights",
+]
+
+MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+    "parquet": "application/vnd.apache.parquet",
+}
+
+# List columns are flattened with this separator in CSV
+CSV_LIST_SEPARATOR = "; "
+
+Chunks = Iterable[List[Dict[str, Any]]]
+
+
+def iter_ndjson(chunks: Chunks) -> Iterator[bytes]:
+    """Encodes row chunks as newline-delimited JSON, one bytes block per chunk."""
+    for rows in chunks:
+        yield "".join(json.dumps(row, ensure_ascii=False) + "\n" for row in rows).encode("utf-8")
+
+
+def iter_csv(chunks: Chunks) -> Iterator[bytes]:
+    """Encodes row chunks as CSV (header first), one bytes block per chunk."""
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=EXPORT_COLUMNS)
+    writer.writeheader()
+    yield buffer.getvalue().encode("utf-8")
+
+    for rows in chunks:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows(
+            {**row, "authors": CSV_LIST_SEPARATOR.join(row["authors"]),
+             "categories": CSV_LIST_SEPARATOR.join(row["categories"])}
+            for row in rows
+        )
+        yield buffer.getvalue().encode("utf-8")
+
+
+def write_parquet(chunks: Chunks, path: str) -> int:
+    """
+    Writes row chunks to a Parquet file, one row group per chunk.
+
+    Requires the optional `pyarrow` package.
+
+    Returns:
+        int: Number of rows written.
+    """
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("pyarrow package is required for Parquet export. Install it with `pip install pyarrow`.")
+
+    schema = pa.schema([
+        ("arxiv_id", pa.string()),
+        ("title", pa.string()),
+        ("authors", pa.list_(pa.string())),
+        ("summary", pa.string()),
+        ("published_date", pa.string()),
+        ("updated_date", pa.string()),
+        ("primary_category", pa.string()),
+        ("categories", pa.list_(pa.string())),
+        ("pdf_url", pa.string()),
+        ("llm_summary", pa.string()),
+        ("key_insights", pa.string()),
+    ])
+
+    written = 0
+    with pq.ParquetWriter(path, schema, compression="zstd") as writer:
+        for rows in chunks:
+            writer.write_table(pa.Table.from_pylist(rows, schema=schema))
+            written += len(rows)
+    return written
+
+
+def write_export(chunks: Chunks, fmt: str, output) -> int:
+    """
+    Writes an export in `fmt` to `output` (a binary file object, or a path for Parquet).
+
+    Returns:
+        int: Number of rows written.
+    """
+    if fmt not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format {fmt!r}. Choose one of {', '.join(EXPORT_FORMATS)}.")
+
+    if fmt == "parquet":
+        return write_parquet(chunks, output)
+
+    counted = _Counter(chunks)
+    encode = iter_ndjson if fmt == "ndjson" else iter_csv
+    for block in encode(counted):
+        output.write(block)
+    return counted.rows
+
+
+class _Counter:
+    """Counts rows while passing chunks through."""
+
+    def __init__(self, chunks: Chunks):
+        self._chunks = chunks
+        self.rows = 0
+
+    def __iter__(self):
+        for rows in self._chunks:
+            self.rows += len(rows)
+            yield rows
@@ -0,0 +1,235 @@
+import mmap
+import os
+import sqlite3
+import threading
+import zlib
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set
+
+
+def chunk_text(text: str, chunk_chars: int = 2000, overlap: int = 200) -> List[str]:
+    """
+    Splits extracted text into overlapping chunks of about `chunk_chars`,
+    preferring to cut at whitespace so words are not split.
+    """
+    text = " ".join(text.split())
+    chunks = []
+    start = 0
+    while start < len(text):
+        end = min(start + chunk_chars, len(text))
+        if end < len(text):
+            cut = text.rfind(" ", start + chunk_chars // 2, end)
+            end = cut if cut > 0 else end
+        chunks.append(text[start:end].strip())
+        if end >= len(text):
+            break
+        start = max(end - overlap, start + 1)
+    return [c for c in chunks if c]
+
+
+class FullTextStore:
+    """
+    Stores the extracted full text of papers outside the main vault.
+
+    Chunks are zlib-compressed one by one and appended to a single blob file;
+    a small SQLite index next to it maps each chunk to its (offset, length)
+    and holds a contentless FTS5 index over the chunk text. Reads go through
+    a memory map of the blob file, so a chunk is decompressed straight from
+    the page cache without an intermediate copy, and the vault database only
+    ever grows by the metadata it already had.
+
+    The blob file is append-only: replacing a paper's text writes new chunks
+    and orphans the old bytes. The index is the source of truth, so bytes
+    written by an interrupted run are simply never referenced.
+    """
+
+    def __init__(self, root: Optional[str] = None):
+        """
+        Args:
+            root: Directory for `chunks.bin` and `index.db` (defaults to `DEEP_READER_FULLTEXT_DIR` or `./fulltext`).
+        """
+        self.root = Path(root or os.getenv("DEEP_READER_FULLTEXT_DIR", "fulltext"))
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.blob_path = self.root / "chunks.bin"
+        self.index_path = self.root / "index.db"
+        self.blob_path.touch(exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._map: Optional[mmap.mmap] = None
+        self._map_file = None
+        self._init_db()
+
+    def _get_connection(self):
+        return sqlite3.connect(self.index_path)
+
+    def _init_db(self):
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS documents (
+                    paper_id TEXT PRIMARY KEY,
+                    status TEXT NOT NULL,  -- "indexed" or "failed"
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    chunks INTEGER NOT NULL DEFAULT 0,
+                    error TEXT,
+                    updated_at TIMESTAMP
+                )
+            """)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS chunks (
+                    id INTEGER PRIMARY KEY,
+                    paper_id TEXT NOT NULL,
+                    seq INTEGER NOT NULL,
+                    offset INTEGER NOT NULL,
+                    length INTEGER NOT NULL,
+                    UNIQUE (paper_id, seq)
+                )
+            """)
+            # Contentless: the text lives compressed in chunks.bin, FTS only keeps the inverted index
+            cursor.execute("CREATE VIRTUAL TABLE IF NOT EXISTS chunk_fts USING fts5(text, content='')")
+            conn.commit()
+
+    # --- Blob file ---
+
+    def _read_blob(self, offset: int, length: int) -> str:
+        with self._lock:
+            if self._map is None or offset + length > len(self._map):
+                self._remap()
+            view = memoryview(self._map)[offset:offset + length]
+            try:
+                return zlib.decompress(view).decode("utf-8")
+            finally:
+                view.release()
+
+    def _remap(self):
+        # Called with the lock held, after the blob file has grown past the current mapping
+        self._unmap()
+        self._map_file = open(self.blob_path, "rb")
+        self._map = mmap.mmap(self._map_file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _unmap(self):
+        if self._map is not None:
+            self._map.close()
+            self._map_file.close()
+            self._map = self._map_file = None
+
+    def close(self):
+        with self._lock:
+            self._unmap()
+
+    # --- Writes ---
+
+    def add_document(self, paper_id: str, chunks: List[str]) -> int:
+        """Stores (or replaces) the chunks of one paper and indexes them. Returns the number of chunks."""
+        blobs = [zlib.compress(c.encode("utf-8"), 6) for c in chunks]
+        with self._lock:
+            with open(self.blob_path, "ab") as f:
+                offset = f.seek(0, os.SEEK_END)
+                for blob in blobs:
+                    f.write(blob)
+                f.flush()
+                os.fsync(f.fileno())
+
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            self._delete_chunks(cursor, paper_id)
+            for seq, (text, blob) in enumerate(zip(chunks, blobs)):
+                cursor.execute(
+                    "INSERT INTO chunks (paper_id, seq, offset, length) VALUES (?, ?, ?, ?)",
+                    (paper_id, seq, offset, len(blob)),
+                )
+                cursor.execute("INSERT INTO chunk_fts (rowid, text) VALUES (?, ?)", (cursor.lastrowid, text))
+                offset += len(blob)
+            cursor.execute("""
+                INSERT INTO documents (paper_id, status, attempts, chunks, error, updated_at)
+                VALUES (?, 'indexed', 1, ?, NULL, ?)
+                ON CONFLICT(paper_id) DO UPDATE SET
+                    status = 'indexed', attempts = attempts + 1, chunks = excluded.chunks,
+                    error = NULL, updated_at = excluded.updated_at
+            """, (paper_id, len(chunks), datetime.now(timezone.utc)))
+            conn.commit()
+        return len(chunks)
+
+    def _delete_chunks(self, cursor: sqlite3.Cursor, paper_id: str):
+        cursor.execute("SELECT id, offset, length FROM chunks WHERE paper_id = ?", (paper_id,))
+        for chunk_id, offset, length in cursor.fetchall():
+            # Contentless FTS5 needs the original text to remove its terms
+            cursor.execute(
+                "INSERT INTO chunk_fts (chunk_fts, rowid, text) VALUES ('delete', ?, ?)",
+                (chunk_id, self._read_blob(offset, length)),
+            )
+        cursor.execute("DELETE FROM chunks WHERE paper_id = ?", (paper_id,))
+
+    def mark_failed(self, paper_id: str, error: str):
+        """Records a failed download or extraction so later runs can retry up to a limit."""
+        with self._get_connection() as conn:
+            conn.execute("""
+                INSERT INTO documents (paper_id, status, attempts, error, updated_at)
+                VALUES (?, 'failed', 1, ?, ?)
+                ON CONFLICT(paper_id) DO UPDATE SET
+                    status = 'failed', attempts = attempts + 1, error = excluded.error,
+                    updated_at = excluded.updated_at
+            """, (paper_id, error[:500], datetime.now(timezone.utc)))
+            conn.commit()
+
+    # --- Reads ---
+
+    def done_ids(self, paper_ids: List[str], max_attempts: int = 3) -> Set[str]:
+        """Returns the IDs among `paper_ids` that are indexed or have failed `max_attempts` times."""
+        done = set()
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            for start in range(0, len(paper_ids), 500):
+                chunk = paper_ids[start:start + 500]
+                marks = ",".join("?" * len(chunk))
+                cursor.execute(f"""
+                    SELECT paper_id FROM documents
+                    WHERE paper_id IN ({marks}) AND (status = 'indexed' OR attempts >= ?)
+                """, [*chunk, max_attempts])
+                done.update(r[0] for r in cursor.fetchall())
+        return done
+
+    def get_chunks(self, paper_id: str) -> List[str]:
+        """Returns the stored text chunks of a paper in order (empty if it has none)."""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT offset, length FROM chunks WHERE paper_id = ? ORDER BY seq", (paper_id,))
+            rows = cursor.fetchall()
+        return [self._read_blob(offset, length) for offset, length in rows]
+
+    def search(self, query: str, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Full-text search over all chunks (FTS5 query syntax), best match first.
+
+        Returns:
+            List[dict]: `paper_id`, `seq`, `score` (bm25, lower is better) and the chunk `text`.
+        """
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT c.paper_id, c.seq, c.offset, c.length, f.score
+                FROM (SELECT rowid, bm25(chunk_fts) AS score FROM chunk_fts
+                      WHERE chunk_fts MATCH ? ORDER BY score LIMIT ?) f
+                JOIN chunks c ON c.id = f.rowid
+                ORDER BY f.score
+            """, (query, limit))
+            rows = cursor.fetchall()
+        return [
+            {"paper_id": pid, "seq": seq, "score": score, "text": self._read_blob(offset, length)}
+            for pid, seq, offset, length, score in rows
+        ]
+
+    def stats(self) -> Dict[str, int]:
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT COUNT(*) FROM documents WHERE status = 'indexed'")
+            documents = cursor.fetchone()[0]
+            cursor.execute("SELECT COUNT(*), COALESCE(SUM(length), 0) FROM chunks")
+            chunks, live_bytes = cursor.fetchone()
+        return {
+            "documents": documents,
+            "chunks": chunks,
+            "live_bytes": live_bytes,
+            "blob_bytes": self.blob_path.stat().st_size,
+        }
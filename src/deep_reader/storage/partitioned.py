@@ -0,0 +1,601 @@
+import heapq
+import os
+import sqlite3
+import stat
+from collections import defaultdict
+from contextlib import ExitStack, contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from deep_reader.models import Paper
+from deep_reader.storage.db_manager import BULK_LOAD_CHANGE, BulkLoadSession, DatabaseManager
+
+GRANULARITIES = ("year", "month")
+
+# SQLite's default SQLITE_MAX_ATTACHED; fan-out queries attach at most this many partitions at once
+MAX_ATTACHED = 10
+
+# Tables that describe readers rather than papers; they stay in the catalog
+CATALOG_TABLES = ("paper_vectors", "reader_profiles", "reader_events", "reader_recommendations", "subscribers")
+
+# (key, path, read_only)
+Partition = Tuple[str, str, bool]
+
+
+class _PartitionedBulkLoadSession:
+    """
+    Routes each batch to the bulk-load session of the partitions it touches.
+    Like a single-file bulk load, it records one `BULK_LOAD_CHANGE` instead of a change per paper.
+    """
+
+    def __init__(self, db: "PartitionedDatabaseManager", stack: ExitStack):
+        self._db = db
+        self._stack = stack
+        self._sessions: Dict[str, BulkLoadSession] = {}
+        self.written = 0
+
+    def write(self, papers: List[Paper]) -> int:
+        papers = self._db._skip_frozen_noops(papers, keep_intelligence=True)
+        papers, _ = self._db._evict_moved(papers, keep_intelligence=True)
+        for key, group in self._db._group_by_partition(papers).items():
+            writer = self._db._writer(key)
+            if key not in self._sessions:
+                self._sessions[key] = self._stack.enter_context(writer.bulk_load())
+            self._sessions[key].write(group)
+        self._db._record_locations(papers, [])
+        self.written += len(papers)
+        return len(papers)
+
+    def _finish(self):
+        if self.written:
+            self._db._record_locations([], [BULK_LOAD_CHANGE])
+
+
+class PartitionedDatabaseManager(DatabaseManager):
+    """
+    Vault split into one SQLite file per year (or month) of `published_date`.
+
+    Each partition is an ordinary vault file with the usual schema. A small
+    catalog database (`catalog.db`) maps every arxiv_id to its partition,
+    records each partition's date range, and holds the reader tables
+    (vectors, profiles, recommendations), which are not time-partitioned.
+
+    List and count queries only touch the partitions their date filter
+    overlaps: those are ATTACHed to one connection (up to `MAX_ATTACHED` at a
+    time) and queried with a single `UNION ALL` whose branches are each
+    sorted and limited, newest partition first. Old partitions can be frozen:
+    they are vacuumed, made read-only on disk, and opened with
+    `immutable=1` so readers skip locking entirely.
+    """
+
+    def __init__(self, root: Optional[str] = None, granularity: str = "year"):
+        """
+        Args:
+            root: Directory holding `catalog.db` and the partitions
+                (defaults to `DEEP_READER_PARTITION_DIR` or `./vault`).
+            granularity: "year" or "month". Must stay the same for the lifetime of a vault.
+        """
+        if granularity not in GRANULARITIES:
+            raise ValueError(f"Unknown granularity {granularity!r}. Choose one of {', '.join(GRANULARITIES)}.")
+        self.root = Path(root or os.getenv("DEEP_READER_PARTITION_DIR", "vault"))
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.granularity = granularity
+        # key -> (manager, (read_only, mtime of a frozen file)) the manager was opened for
+        self._managers: Dict[str, Tuple[DatabaseManager, Tuple[bool, Optional[int]]]] = {}
+        super().__init__(db_path=str(self.root / "catalog.db"))
+
+    def _init_db(self):
+        # The catalog has the regular schema (for the reader tables) plus the partition map
+        super()._init_db()
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS partitions (
+                    key TEXT PRIMARY KEY,  -- "2024" or "2024-03"
+                    path TEXT NOT NULL,
+                    start_day TEXT NOT NULL,
+                    end_day TEXT NOT NULL,
+                    read_only INTEGER NOT NULL DEFAULT 0
+                )
+            """)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS paper_partitions (
+                    arxiv_id TEXT PRIMARY KEY,
+                    key TEXT NOT NULL
+                ) WITHOUT ROWID
+            """)
+            conn.commit()
+
+    # --- Partition catalog ---
+
+    def _key(self, paper: Paper) -> str:
+        day = self._day(paper.published_date)
+        return day[:4] if self.granularity == "year" else day[:7]
+
+    def _bounds(self, key: str) -> Tuple[str, str]:
+        if self.granularity == "year":
+            return f"{key}-01-01", f"{key}-12-31"
+        # Day strings compare lexically, so "-31" bounds every month
+        return f"{key}-01", f"{key}-31"
+
+    def _group_by_partition(self, papers: Iterable[Paper]) -> Dict[str, List[Paper]]:
+        groups: Dict[str, List[Paper]] = defaultdict(list)
+        for paper in papers:
+            groups[self._key(paper)].append(paper)
+        return groups
+
+    def list_partitions(self, start_date: Optional[str] = None, end_date: Optional[str] = None) -> List[Partition]:
+        """Partitions whose date range overlaps [start_date, end_date] (YYYY-MM-DD), newest first."""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("""
+                SELECT key, path, read_only FROM partitions
+                WHERE (? IS NULL OR end_day >= ?) AND (? IS NULL OR start_day <= ?)
+                ORDER BY key DESC
+            """, (start_date, start_date, end_date, end_date))
+            return [(key, path, bool(ro)) for key, path, ro in cursor.fetchall()]
+
+    def _partition(self, key: str) -> Optional[Partition]:
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.execute("SELECT key, path, read_only FROM partitions WHERE key = ?", (key,))
+            row = cursor.fetchone()
+            return (row[0], row[1], bool(row[2])) if row else None
+
+    def _manager(self, key: str, partition: Optional[Partition] = None) -> DatabaseManager:
+        """
+        Manager for reading a partition (read-only and lock-free if it is frozen).
+
+        Managers are cached, but another process (e.g. the CLI) may freeze or
+        thaw a partition while this one runs. The cached manager is reopened
+        whenever the partition's read-only flag changes, or, for a frozen
+        partition, its file changes: `immutable=1` reads of a file that is
+        being modified can return corrupt results.
+        """
+        _, path, read_only = partition or self._partition(key)
+        state = (read_only, os.stat(path).st_mtime_ns if read_only else None)
+        cached = self._managers.get(key)
+        if cached is None or cached[1] != state:
+            # The catalog keeps the change feed, so seqs stay monotonic across partitions
+            manager = DatabaseManager(db_path=path, read_only=read_only, track_changes=False)
+            self._managers[key] = cached = (manager, state)
+        return cached[0]
+
+    def _writer(self, key: str) -> DatabaseManager:
+        """Manager for writing to a partition, creating the partition if needed."""
+        partition = self._partition(key)
+        if partition is None:
+            start_day, end_day = self._bounds(key)
+            path = str(self.root / f"papers-{key}.db")
+            with self._get_connection() as conn:
+                conn.execute(
+                    "INSERT OR IGNORE INTO partitions (key, path, start_day, end_day) VALUES (?, ?, ?, ?)",
+                    (key, path, start_day, end_day),
+                )
+                conn.commit()
+        elif partition[2]:
+            raise PermissionError(f"Partition {key} is frozen (read-only); it cannot be written to.")
+        return self._manager(key, partition)
+
+    def _skip_frozen_noops(self, papers: List[Paper], keep_intelligence: bool = False) -> List[Paper]:
+        """
+        Drops papers that a frozen partition already holds unchanged, so
+        re-saving them (as a fetch over an old date range does) is a no-op
+        rather than an error. Call before writing `papers`.
+
+        Raises:
+            PermissionError: A paper would change a frozen partition (be added to,
+                changed in, or moved out of it). Nothing has been written yet.
+        """
+        frozen = {partition[0]: partition for partition in self.list_partitions() if partition[2]}
+        if not frozen:
+            return papers
+        located = self._locate([paper.arxiv_id for paper in papers])
+        unchanged = set()
+        for key, group in self._group_by_partition(papers).items():
+            if key not in frozen:
+                continue
+            changes = self._manager(key, frozen[key])._diff_papers(group, keep_intelligence)
+            if changes:
+                raise PermissionError(f"Partition {key} is frozen (read-only); paper {changes[0][0]} cannot be written to it.")
+            unchanged.update(paper.arxiv_id for paper in group)
+        for paper in papers:
+            old_key = located.get(paper.arxiv_id)
+            if paper.arxiv_id not in unchanged and old_key in frozen:
+                raise PermissionError(f"Partition {old_key} is frozen (read-only); paper {paper.arxiv_id} cannot move out of it.")
+        return [paper for paper in papers if paper.arxiv_id not in unchanged]
+
+    def _evict_moved(self, papers: List[Paper], keep_intelligence: bool = False) -> Tuple[List[Paper], set]:
+        """
+        Deletes papers from the partition they are stored in when a changed
+        `published_date` now routes them to another one, so a re-save does not
+        leave a duplicate behind. Call before writing `papers`.
+
+        Args:
+            papers: Papers about to be written.
+            keep_intelligence: Carry the stored `llm_summary`/`key_insights` over to the
+                new partition (for metadata-only writes that keep them).
+
+        Returns:
+            (papers, moved_ids): the papers to write and the IDs that changed partition.
+        """
+        located = self._locate([paper.arxiv_id for paper in papers])
+        moved: Dict[str, List[str]] = defaultdict(list)
+        moved_ids = set()
+        for paper in papers:
+            old_key, new_key = located.get(paper.arxiv_id), self._key(paper)
+            if old_key is not None and old_key != new_key and paper.arxiv_id not in moved_ids:
+                # Fail on a frozen destination before anything is deleted
+                self._writer(new_key)
+                moved[old_key].append(paper.arxiv_id)
+                moved_ids.add(paper.arxiv_id)
+        if not moved:
+            return papers, moved_ids
+
+        stored: Dict[str, Paper] = {}
+        for old_key, ids in moved.items():
+            writer = self._writer(old_key)
+            if keep_intelligence:
+                stored.update((p.arxiv_id, p) for p in writer.get_papers(ids))
+            writer._remove_papers(ids)
+        if stored:
+            papers = [
+                paper.model_copy(update={
+                    "llm_summary": stored[paper.arxiv_id].llm_summary,
+                    "key_insights": stored[paper.arxiv_id].key_insights,
+                }) if paper.arxiv_id in stored else paper
+                for paper in papers
+            ]
+        return papers, moved_ids
+
+    @staticmethod
+    def _as_updates(changes: List[Tuple[str, str]], moved: set) -> List[Tuple[str, str]]:
+        # A moved paper is new to its partition but not to the vault
+        return [(pid, "update" if pid in moved else op) for pid, op in changes]
+
+    def _record_locations(self, papers: List[Paper], changes: List[Tuple[str, str]]):
+        """Maps the papers to their partitions and appends `changes` to the catalog's change feed."""
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            cursor.executemany(
+                "INSERT OR REPLACE INTO paper_partitions (arxiv_id, key) VALUES (?, ?)",
+                [(paper.arxiv_id, self._key(paper)) for paper in papers],
+            )
+            self._record_changes(cursor, changes)
+            conn.commit()
+
+    def _locate(self, arxiv_ids: List[str]) -> Dict[str, str]:
+        """Maps arxiv_id -> partition key (unknown IDs are left out)."""
+        located = {}
+        with self._get_connection() as conn:
+            cursor = conn.cursor()
+            for start in range(0, len(arxiv_ids), 500):
+                chunk = arxiv_ids[start:start + 500]
+                marks = ",".join("?" * len(chunk))
+                cursor.execute(f"SELECT arxiv_id, key FROM paper_partitions WHERE arxiv_id IN ({marks})", chunk)
+                located.update(cursor.fetchall())
+        return located
+
+    @contextmanager
+    def _attached(self, partitions: List[Partition]) -> Iterator[Tuple[sqlite3.Connection, List[str]]]:
+        """Opens the catalog with `partitions` attached as p0, p1, ...; yields (conn, schema names)."""
+        conn = sqlite3.connect(f"{Path(self.db_path).resolve().as_uri()}?mode=ro", uri=True)
+        try:
+            schemas = []
+            for i, (_, path, read_only) in enumerate(partitions):
+                uri = f"{Path(path).resolve().as_uri()}?mode=ro" + ("&immutable=1" if read_only else "")
+                conn.execute(f"ATTACH DATABASE ? AS p{i}", (uri,))
+                schemas.append(f"p{i}")
+            yield conn, schemas
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _batches(partitions: List[Partition]) -> Iterator[List[Partition]]:
+        for start in range(0, len(partitions), MAX_ATTACHED):
+            yield partitions[start:start + MAX_ATTACHED]
+
+    def freeze_partition(self, key: str):
+        """
+        Makes a partition immutable: vacuums it, marks it read-only in the catalog
+        and removes write permission from the file. Later writes to it raise PermissionError.
+        """
+        partition = self._partition(key)
+        if partition is None:
+            raise KeyError(key)
+        if partition[2]:
+            return
+        path = partition[1]
+        with sqlite3.connect(path) as conn:
+            conn.execute("PRAGMA optimize")
+        # VACUUM cannot run inside the implicit transaction of a `with` block
+        conn = sqlite3.connect(path, isolation_level=None)
+        try:
+            conn.execute("VACUUM")
+        finally:
+            conn.close()
+        with self._get_connection() as conn:
+            conn.execute("UPDATE partitions SET read_only = 1 WHERE key = ?", (key,))
+            conn.commit()
+        os.chmod(path, stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)
+        self._managers.pop(key, None)
+        print(f"Partition {key} frozen.")
+
+    def thaw_partition(self, key: str):
+        """Makes a frozen partition writable again (e.g. to backfill summaries into it)."""
+        partition = self._partition(key)
+        if partition is None:
+            raise KeyError(key)
+        os.chmod(partition[1], stat.S_IRUSR | stat.S_IWUSR | stat.S_IRGRP | stat.S_IROTH)
+        with self._get_connection() as conn:
+            conn.execute("UPDATE partitions SET read_only = 0 WHERE key = ?", (key,))
+            conn.commit()
+        self._managers.pop(key, None)
+
+    def freeze_before(self, key: str) -> List[str]:
+        """Freezes every writable partition older than `key` (e.g. "2024"). Returns the frozen keys."""
+        frozen = []
+        for part_key, _, read_only in self.list_partitions():
+            if part_key < key and not read_only:
+                self.freeze_partition(part_key)
+                frozen.append(part_key)
+        return frozen
+
+    # --- Writes ---
+
+    def save_paper(self, paper: Paper):
+        self.save_papers([paper])
+
+    def save_papers(self, papers: Iterable[Paper], batch_size: int = 1000) -> int:
+        written = 0
+        batch: List[Paper] = []
+        for paper in papers:
+            batch.append(paper)
+            if len(batch) >= batch_size:
+                written += self._save_batch(batch)
+                batch = []
+        if batch:
+            written += self._save_batch(batch)
+        return written
+
+    def _save_batch(self, papers: List[Paper]) -> int:
+        papers = self._skip_frozen_noops(papers)
+        papers, moved = self._evict_moved(papers)
+        changes = []
+        for key, group in self._group_by_partition(papers).items():
+            writer = self._writer(key)
+            changes.extend(writer._diff_papers(group))
+            writer.save_papers(group, batch_size=len(group))
+        self._record_locations(papers, self._as_updates(changes, moved))
+        return len(papers)
+
+    @contextmanager
+    def bulk_load(self) -> Iterator[_PartitionedBulkLoadSession]:
+        """Bulk-load session over all partitions; each touched partition gets its own `bulk_load`."""
+        with ExitStack() as stack:
+            session = _PartitionedBulkLoadSession(self, stack)
+            # Registered first, so it runs after every partition session has closed
+            stack.callback(session._finish)
+            yield session
+
+    def update_intelligence(self, updates: List[Tuple[str, Optional[str], Optional[str]]]) -> int:
+        located = self._locate([pid for pid, _, _ in updates])
+        groups: Dict[str, List[Tuple[str, Optional[str], Optional[str]]]] = defaultdict(list)
+        for update in updates:
+            if update[0] in located:
+                groups[located[update[0]]].append(update)
+        # Check every target first, so a frozen one does not leave the others half-updated
+        writers = {key: self._writer(key) for key in groups}
+        updated = sum(writers[key].update_intelligence(group) for key, group in groups.items())
+        with self._get_connection() as conn:
+            self._record_changes(conn.cursor(), [(pid, "update") for group in groups.values() for pid, _, _ in group])
+            conn.commit()
+        return updated
+
+    # --- Reads ---
+
+    def get_paper(self, arxiv_id: str) -> Optional[Paper]:
+        key = self._locate([arxiv_id]).get(arxiv_id)
+        return self._manager(key).get_paper(arxiv_id) if key else None
+
+    def get_papers(self, arxiv_ids: List[str]) -> List[Paper]:
+        groups: Dict[str, List[str]] = defaultdict(list)
+        for pid, key in self._locate(arxiv_ids).items():
+            groups[key].append(pid)
+        papers = {p.arxiv_id: p for key, ids in groups.items() for p in self._manager(key).get_papers(ids)}
+        return [papers[pid] for pid in arxiv_ids if pid in papers]
+
+    def get_recent_papers(
+        self,
+        limit: int = 20,
+        offset: int = 0,
+        topic: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        category: Optional[str] = None,
+    ) -> List[Paper]:
+        """
+        Newest papers matching the filters, merged across the overlapping partitions.
+
+        Each partition branch returns at most `offset + limit` rows (id and date
+        only); partitions are visited newest first and the walk stops as soon as
+        enough rows were found, so old partitions are usually never opened.
+        """
+        need = offset + limit
+        found: List[Tuple[str, str]] = []  # (arxiv_id, partition key)
+        for group in self._batches(self.list_partitions(start_date, end_date)):
+            with self._attached(group) as (conn, schemas):
+                branches, params = [], []
+                for schema in schemas:
+                    where_sql, where_params = self._build_filters(topic, start_date, end_date, category, schema=schema)
+                    branches.append(f"""
+                        SELECT * FROM (
+                            SELECT arxiv_id, published_date, '{schema}' AS part FROM {schema}.papers
+                            {where_sql} ORDER BY published_date DESC LIMIT ?
+                        )
+                    """)
+                    params.extend([*where_params, need - len(found)])
+                cursor = conn.execute(
+                    " UNION ALL ".join(branches) + " ORDER BY published_date DESC LIMIT ?",
+                    [*params, need - len(found)],
+                )
+                keys = {schema: key for schema, (key, _, _) in zip(schemas, group)}
+                found.extend((pid, keys[part]) for pid, _, part in cursor.fetchall())
+            if len(found) >= need:
+                break
+
+        page = found[offset:need]
+        groups: Dict[str, List[str]] = defaultdict(list)
+        for pid, key in page:
+            groups[key].append(pid)
+        papers = {p.arxiv_id: p for key, ids in groups.items() for p in self._manager(key).get_papers(ids)}
+        return [papers[pid] for pid, _ in page if pid in papers]
+
+    def _sum_over_partitions(self, partitions: List[Partition], branch) -> int:
+        """Sums one scalar query over partitions; `branch(schema)` returns its (sql, params)."""
+        total = 0
+        for group in self._batches(partitions):
+            with self._attached(group) as (conn, schemas):
+                parts = [branch(schema) for schema in schemas]
+                cursor = conn.execute(
+                    f"SELECT COALESCE(SUM(n), 0) FROM ({' UNION ALL '.join(sql for sql, _ in parts)})",
+                    [param for _, params in parts for param in params],
+                )
+                total += cursor.fetchone()[0]
+        return total
+
+    def count_papers(self) -> int:
+        return self._sum_over_partitions(
+            self.list_partitions(), lambda schema: (f"SELECT COUNT(*) AS n FROM {schema}.papers", [])
+        )
+
+    def count_papers_filtered(
+        self,
+        topic: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        category: Optional[str] = None,
+    ) -> int:
+        partitions = self.list_partitions(start_date, end_date)
+        if not topic:
+            # Same fast path as the single-file vault: each partition's daily aggregates
+            day_sql, day_params = self._day_range(start_date, end_date)
+
+            def branch(schema):
+                if category:
+                    return (f"SELECT SUM(count) AS n FROM {schema}.daily_category_counts WHERE category = ? {day_sql}",
+                            [category, *day_params])
+                return f"SELECT SUM(count) AS n FROM {schema}.daily_counts WHERE 1 = 1 {day_sql}", day_params
+        else:
+            def branch(schema):
+                where_sql, params = self._build_filters(topic, start_date, end_date, category, schema=schema)
+                return f"SELECT COUNT(*) AS n FROM {schema}.papers {where_sql}", params
+
+        return self._sum_over_partitions(partitions, branch)
+
+    def get_facets(
+        self,
+        topic: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        category: Optional[str] = None,
+        category_limit: int = 50,
+    ) -> Dict[str, Any]:
+        categories: Dict[str, int] = defaultdict(int)
+        dates: List[Tuple[str, int]] = []
+        for key, _, _ in self.list_partitions(start_date, end_date):
+            # LIMIT -1: every category, so the merged top list is exact
+            facets = self._manager(key).get_facets(topic, start_date, end_date, category, category_limit=-1)
+            for value, n in facets["categories"]:
+                categories[value] += n
+            dates.extend(facets["dates"])
+        dates.sort()
+        ranked = sorted(categories.items(), key=lambda item: (-item[1], item[0]))[:category_limit]
+        return {"total": sum(n for _, n in dates), "categories": ranked, "dates": dates}
+
+    def iter_paper_rows(
+        self,
+        topic: Optional[str] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        chunk_size: int = 1000,
+        category: Optional[str] = None,
+    ) -> Iterator[List[Dict[str, Any]]]:
+        # Partitions cover disjoint date ranges, so newest-first concatenation keeps the order
+        for key, _, _ in self.list_partitions(start_date, end_date):
+            yield from self._manager(key).iter_paper_rows(topic, start_date, end_date, chunk_size, category)
+
+    def get_backfill_candidates(self, after_id: str = "", limit: int = 100) -> List[Dict[str, Any]]:
+        """Next candidates by arxiv_id across writable partitions (frozen ones are not backfilled)."""
+        per_partition = [
+            self._manager(key).get_backfill_candidates(after_id, limit)
+            for key, _, read_only in self.list_partitions() if not read_only
+        ]
+        return list(heapq.merge(*per_partition, key=lambda row: row["arxiv_id"]))[:limit]
+
+    def get_pdf_candidates(self, after_id: str = "", limit: int = 100) -> List[Tuple[str, str]]:
+        per_partition = [self._manager(key).get_pdf_candidates(after_id, limit) for key, _, _ in self.list_partitions()]
+        return list(heapq.merge(*per_partition))[:limit]
+
+    def get_papers_without_vectors(self, limit: int = 1000) -> List[Paper]:
+        ids: List[str] = []
+        for group in self._batches(self.list_partitions()):
+            with self._attached(group) as (conn, schemas):
+                branches = [f"""
+                    SELECT p.arxiv_id FROM {schema}.papers p
+                    LEFT JOIN main.paper_vectors v ON v.paper_id = p.arxiv_id
+                    WHERE v.paper_id IS NULL
+                """ for schema in schemas]
+                cursor = conn.execute(" UNION ALL ".join(branches) + " LIMIT ?", (limit - len(ids),))
+                ids.extend(r[0] for r in cursor.fetchall())
+            if len(ids) >= limit:
+                break
+        return self.get_papers(ids)
+
+
+def migrate_to_partitions(source: DatabaseManager, target: PartitionedDatabaseManager, chunk_size: int = 5000) -> int:
+    """
+    Copies a single-file vault into a partitioned one.
+
+    Papers are streamed through `iter_paper_rows` into a bulk load; the reader
+    tables are copied into the catalog as they are. Rows that do not make a
+    valid paper (e.g. a NULL or unparseable `published_date`, which decides the
+    partition) are skipped and reported at the end.
+
+    Returns:
+        int: Number of papers copied.
+    """
+    copied = 0
+    skipped: List[str] = []
+    with target.bulk_load() as session:
+        for rows in source.iter_paper_rows(chunk_size=chunk_size):
+            papers = []
+            for row in rows:
+                try:
+                    papers.append(source._paper_from_row(row))
+                except ValueError as e:
+                    print(f"Skipping {row['arxiv_id']}: {e}")
+                    skipped.append(row["arxiv_id"])
+            copied += session.write(papers)
+            print(f"Copied {copied} papers.")
+    if skipped:
+        print(f"{len(skipped)} papers could not be migrated: {', '.join(skipped)}")
+
+    with sqlite3.connect(target.db_path) as conn:
+        conn.execute("ATTACH DATABASE ? AS source", (source.db_path,))
+        for table in CATALOG_TABLES:
+            conn.execute(f"INSERT OR IGNORE INTO main.{table} SELECT * FROM source.{table}")
+        conn.commit()
+        conn.execute("DETACH DATABASE source")
+    return copied
+
+
+def open_vault() -> DatabaseManager:
+    """
+    Opens the configured vault: a `PartitionedDatabaseManager` when
+    `DEEP_READER_PARTITIONS` is "year" or "month", else the single-file `DatabaseManager`.
+    """
+    granularity = os.getenv("DEEP_READER_PARTITIONS")
+    if granularity:
+        return PartitionedDatabaseManager(granularity=granularity)
+    return DatabaseManager()
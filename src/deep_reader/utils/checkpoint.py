@@ -0,0 +1,18 @@
+import json
+import os
+from pathlib import Path
+
+
+def load_checkpoint(path: Path) -> dict:
+    """Returns the state saved at `path`, or an empty dict if there is no checkpoint yet."""
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def save_checkpoint(path: Path, state: dict):
+    """Saves `state` as JSON at `path`."""
+    # Write-then-rename so an interrupted write never leaves a truncated checkpoint
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps(state, indent=2))
+    os.replace(tmp, path)
@@ -0,0 +1,46 @@
+import os
+import tempfile
+from datetime import datetime, timezone
+from typing import Optional, Sequence
+
+import pytest
+
+from deep_reader.models import Paper
+from deep_reader.storage.db_manager import DatabaseManager
+
+# deep_reader.server.app opens its vault at import time; keep test runs from creating ./deep_reader.db
+os.environ.setdefault("DEEP_READER_DB", os.path.join(tempfile.mkdtemp(prefix="deep_reader_tests_"), "deep_reader.db"))
+
+
+def make_paper(
+    arxiv_id: str,
+    title: str = "Paper",
+    summary: str = "Summary",
+    categories: Sequence[str] = ("cs.AI",),
+    year: int = 2024,
+    month: int = 5,
+    day: int = 1,
+    published: Optional[datetime] = None,
+    **fields,
+) -> Paper:
+    """
+    Builds a test paper published on `year-month-day` (UTC) unless `published` is given.
+
+    `fields` set any other `Paper` attribute (authors, pdf_url, llm_summary, ...).
+    """
+    published = published or datetime(year, month, day, tzinfo=timezone.utc)
+    values = {
+        "authors": ["A"],
+        "published_date": published,
+        "updated_date": published,
+        "primary_category": categories[0],
+        "categories": list(categories),
+    }
+    values.update(fields)
+    return Paper(arxiv_id=arxiv_id, title=title, summary=summary, **values)
+
+
+@pytest.fixture
+def db(tmp_path):
+    """An empty single-file vault; test modules seed it by overriding `db(db)`."""
+    return DatabaseManager(db_path=str(tmp_path / "vault.db"))
@@ -28,7 +28,7 @@ def test_llm():
         print(f"Failed to init: {e}")
         return
 
-    if (llm.provider == "google" and not llm.model) or (llm.provider in ["custom", "openai"] and not llm.client):
+    if not llm.is_configured:
         print("LLM model not initialized (API Key missing?). Skipping generation.")
         return
 
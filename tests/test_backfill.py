@@ -0,0 +1,115 @@
+import json
+import threading
+
+import pytest
+from conftest import make_paper
+
+from deep_reader.backfill import run_backfill
+from deep_reader.models import SUMMARY_FAILED_PREFIX
+from deep_reader.storage.db_manager import NEEDS_INTELLIGENCE_SQL, DatabaseManager
+
+
+class FakeLLM:
+    is_configured = True
+
+    def __init__(self, fail_on=()):
+        self.fail_on = set(fail_on)
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def generate_summary(self, text):
+        with self._lock:
+            self.calls.append(("summary", text))
+        if text in self.fail_on:
+            return f"{SUMMARY_FAILED_PREFIX} boom"
+        return f"summary of {text}"
+
+    def generate_key_insights(self, text):
+        with self._lock:
+            self.calls.append(("insights", text))
+        return json.dumps([f"insight of {text}"])
+
+
+@pytest.fixture
+def db(db):
+    states = [
+        (None, None),
+        ("Existing summary", None),
+        (f"{SUMMARY_FAILED_PREFIX} timeout", None),
+        ("Done", '["done"]'),
+        (None, None),
+    ]
+    db.save_papers(
+        make_paper(f"2301.0000{i}", f"Paper {i}", f"abstract {i}", llm_summary=summary, key_insights=insights)
+        for i, (summary, insights) in enumerate(states)
+    )
+    return db
+
+
+def test_backfill_fills_missing_fields(db, tmp_path):
+    llm = FakeLLM(fail_on={"abstract 4"})
+    checkpoint = tmp_path / "ckpt.json"
+
+    stats = run_backfill(db=db, llm=llm, concurrency=3, batch_size=2, checkpoint_path=str(checkpoint))
+
+    assert stats["complete"]
+    assert stats["processed"] == 4  # 2301.00003 is already complete
+    assert stats["failed"] == 1
+    assert not checkpoint.exists()
+
+    assert db.get_paper("2301.00000").llm_summary == "summary of abstract 0"
+    assert db.get_paper("2301.00001").llm_summary == "Existing summary"  # not regenerated
+    assert db.get_paper("2301.00001").key_insights == '["insight of abstract 1"]'
+    assert db.get_paper("2301.00002").llm_summary == "summary of abstract 2"  # failure string replaced
+    assert ("summary", "abstract 3") not in llm.calls
+    # The failed summary stays missing, the insights still got stored
+    failed = db.get_paper("2301.00004")
+    assert failed.llm_summary is None
+    assert failed.key_insights == '["insight of abstract 4"]'
+
+
+def test_backfill_resumes_from_checkpoint(db, tmp_path):
+    checkpoint = tmp_path / "ckpt.json"
+
+    first = run_backfill(db=db, llm=FakeLLM(), batch_size=2, limit=2, checkpoint_path=str(checkpoint))
+    assert not first["complete"]
+    assert json.loads(checkpoint.read_text())["last_id"] == "2301.00001"
+
+    llm = FakeLLM()
+    second = run_backfill(db=db, llm=llm, batch_size=2, checkpoint_path=str(checkpoint))
+    assert second["complete"]
+    assert second["processed"] == 4
+    assert {text for _, text in llm.calls} == {"abstract 2", "abstract 4"}
+
+
+def test_empty_outputs_are_candidates_and_old_index_is_replaced(db):
+    import sqlite3
+
+    with sqlite3.connect(db.db_path) as conn:
+        conn.execute("UPDATE papers SET llm_summary = '' WHERE arxiv_id = '2301.00003'")
+        # Partial index as created by an older release, without the empty-string cases
+        conn.execute("DROP INDEX idx_papers_needs_intelligence")
+        conn.execute("CREATE INDEX idx_papers_needs_intelligence ON papers(arxiv_id) "
+                     "WHERE (llm_summary IS NULL OR key_insights IS NULL)")
+
+    db = DatabaseManager(db_path=db.db_path)
+    assert "2301.00003" in [row["arxiv_id"] for row in db.get_backfill_candidates()]
+    with sqlite3.connect(db.db_path) as conn:
+        plan = conn.execute(f"EXPLAIN QUERY PLAN SELECT arxiv_id FROM papers WHERE {NEEDS_INTELLIGENCE_SQL} "
+                            "AND arxiv_id > '' ORDER BY arxiv_id").fetchall()
+    assert "idx_papers_needs_intelligence" in plan[0][3]
+
+
+def test_cycle_leaves_failure_placeholders_to_the_backfill(db):
+    from benchmarks.synthetic import FakeNotifier
+    from deep_reader.core_loop import run_daily_cycle
+
+    class Refetch:
+        def fetch_papers(self, query, max_results):
+            return db.get_papers(["2301.00000", "2301.00002"])
+
+    llm = FakeLLM()
+    run_daily_cycle(collector=Refetch(), db=db, notifier=FakeNotifier(), llm=llm)
+    # The missing summary is generated, the stored failure is not retried
+    assert llm.calls == [("summary", "abstract 0")]
+    assert db.get_paper("2301.00002").llm_summary == f"{SUMMARY_FAILED_PREFIX} timeout"
@@ -0,0 +1,47 @@
+import json
+
+from benchmarks.bench_pipeline import compare, main
+from benchmarks.synthetic import SyntheticCorpus
+
+
+def test_synthetic_corpus_is_deterministic():
+    a = list(SyntheticCorpus(50, seed=7))
+    b = list(SyntheticCorpus(50, seed=7))
+
+    assert [p.model_dump() for p in a] == [p.model_dump() for p in b]
+    assert len({p.arxiv_id for p in a}) == 50
+    assert all(p.categories[0] == p.primary_category for p in a)
+
+
+def test_benchmark_suite_writes_json(tmp_path):
+    output = tmp_path / "bench.json"
+
+    assert main(["--sizes", "200", "--repeat", "2", "--fetch-size", "20",
+                 "--workdir", str(tmp_path), "--output", str(output)]) == 0
+
+    document = json.loads(output.read_text())
+    result = document["results"]["200"]
+    assert result["bulk_ingest"]["papers"] == 200
+    # Half of the fetched window is new, so it gets summarized and notified
+    assert result["full_cycle"]["notified"] == 10
+    assert compare(document, document, threshold=1.2) == []
+
+
+def test_load_test_reports_per_endpoint(tmp_path):
+    import os
+
+    from benchmarks.load_test import main as load_main
+    from deep_reader.server import app as app_module
+
+    before = (os.environ.get("DEEP_READER_DB"), app_module.db_manager, app_module.run_cycle_job)
+    output = tmp_path / "load.json"
+
+    assert load_main(["--papers", "100", "--rate", "20", "--duration", "1", "--concurrency", "4",
+                      "--db", str(tmp_path / "vault.db"), "--output", str(output)]) == 0
+
+    report = json.loads(output.read_text())["results"]
+    assert report["overall"]["count"] == 20
+    assert report["overall"]["errors"] == 0
+    assert set(report["endpoints"]) <= {"list", "deep", "search", "detail", "trigger"}
+    # The harness must not leak its vault or fake cycle into later tests
+    assert (os.environ.get("DEEP_READER_DB"), app_module.db_manager, app_module.run_cycle_job) == before
@@ -0,0 +1,148 @@
+import asyncio
+import json
+
+from conftest import make_paper
+from fastapi.testclient import TestClient
+
+from deep_reader.server import app as app_module
+from deep_reader.server.events import JobEvents, change_stream
+from deep_reader.storage.db_manager import DatabaseManager
+from deep_reader.storage.partitioned import PartitionedDatabaseManager
+
+
+def test_feed_records_real_changes_only(db):
+    db.save_papers([make_paper("a"), make_paper("b")])
+    assert [(pid, op) for _, pid, op in db.get_changes()] == [("a", "insert"), ("b", "insert")]
+    seq = db.get_change_seq()
+
+    db.save_paper(make_paper("a"))  # unchanged re-save, as every fetch cycle does
+    assert db.get_changes(since=seq) == []
+
+    db.save_paper(make_paper("a", title="Paper v2"))
+    db.update_intelligence([("b", "A summary", None)])
+    db.update_intelligence([("missing", "x", None)])
+    assert [(pid, op) for _, pid, op in db.get_changes(since=seq)] == [("a", "update"), ("b", "update")]
+
+
+def test_feed_collapses_repeated_changes_and_pages(db):
+    db.save_paper(make_paper("a"))
+    db.save_paper(make_paper("b"))
+    db.save_paper(make_paper("a", title="again"))
+    changes = db.get_changes()
+    # "a" appears once, at its latest seq, still flagged as new to this client
+    assert [(pid, op) for _, pid, op in changes] == [("b", "insert"), ("a", "insert")]
+
+    first = db.get_changes(limit=1)
+    rest = db.get_changes(since=first[-1][0])
+    assert [pid for _, pid, _ in first + rest] == ["b", "a"]
+
+
+def test_partitioned_feed_is_global(tmp_path):
+    vault = PartitionedDatabaseManager(str(tmp_path / "parts"))
+    vault.save_papers([make_paper("old", year=2020), make_paper("new", year=2024)])
+    vault.save_paper(make_paper("old", year=2020))
+    vault.save_paper(make_paper("old", title="changed", year=2020))
+    assert [(pid, op) for _, pid, op in vault.get_changes()] == [("new", "insert"), ("old", "insert")]
+    assert [(pid, op) for _, pid, op in vault.get_changes(since=2)] == [("old", "update")]
+
+
+def test_changes_endpoint(db, monkeypatch):
+    monkeypatch.setattr(app_module, "db_manager", db)
+    db.save_papers([make_paper("a"), make_paper("b"), make_paper("c")])
+    client = TestClient(app_module.app)
+
+    page = client.get("/api/changes", params={"since": 0, "limit": 2}).json()
+    assert [item["paper"]["arxiv_id"] for item in page["items"]] == ["a", "b"]
+    assert page["has_more"]
+    page = client.get("/api/changes", params={"since": page["next_since"]}).json()
+    assert [item["paper"]["arxiv_id"] for item in page["items"]] == ["c"]
+    assert not page["has_more"]
+    assert client.get("/api/changes", params={"since": page["next_since"]}).json()["items"] == []
+
+
+def test_stream_pushes_changes_and_job_progress(db):
+    db.save_paper(make_paper("before"))
+    jobs = JobEvents()
+
+    async def collect():
+        events = []
+        start = db.get_change_seq()
+
+        async def is_disconnected():
+            return len(events) >= 2
+
+        async def writer():
+            await asyncio.sleep(0.05)
+            db.save_paper(make_paper("after"))
+            jobs.reporter("job1")("complete", {"new": 1})
+
+        task = asyncio.create_task(writer())
+        async for message in change_stream(db, jobs, start, is_disconnected, poll_interval=0.01):
+            if not message.startswith(":"):
+                events.append(message)
+        await task
+        return events
+
+    events = asyncio.run(asyncio.wait_for(collect(), timeout=5))
+    paper_event, job_event = events
+    assert paper_event.startswith("id: ")
+    assert "event: insert" in paper_event
+    assert json.loads(paper_event.split("data: ", 1)[1])["paper"]["arxiv_id"] == "after"
+    assert "event: job" in job_event
+    assert json.loads(job_event.split("data: ", 1)[1])["stage"] == "complete"
+
+
+def test_cycle_reports_progress(db):
+    from benchmarks.synthetic import FakeArxivCollector, FakeLLMClient, FakeNotifier, SyntheticCorpus
+    from deep_reader.core_loop import run_daily_cycle
+
+    stages = []
+    corpus = SyntheticCorpus(size=5)
+    run_daily_cycle(collector=FakeArxivCollector(corpus, limit=3), db=db, notifier=FakeNotifier(),
+                    llm=FakeLLMClient(), progress=lambda stage, data=None: stages.append((stage, data)))
+    names = [stage for stage, _ in stages]
+    assert names[0] == "started" and names[-1] == "complete"
+    assert [data["done"] for stage, data in stages if stage == "saved"] == [1, 2, 3]
+    assert len(db.get_changes()) == 3
+
+
+def test_feed_pages_with_an_index_range_scan(db):
+    import sqlite3
+
+    db.save_papers([make_paper(str(i)) for i in range(5)])
+    with sqlite3.connect(db.db_path) as conn:
+        plan = conn.execute("EXPLAIN QUERY PLAN SELECT seq, paper_id FROM paper_changes "
+                            "WHERE seq > 2 ORDER BY seq LIMIT 2").fetchall()
+    assert "idx_paper_changes_seq" in plan[0][3] and not any("TEMP B-TREE" in row[3] for row in plan)
+    assert [pid for _, pid, _ in db.get_changes(since=2, limit=2)] == ["2", "3"]
+
+
+def test_bulk_load_records_one_reload_marker(db, tmp_path):
+    seq = db.get_change_seq()
+    with db.bulk_load() as session:
+        session.write([make_paper(str(i)) for i in range(50)])
+        session.write([make_paper("0", title="again")])
+    assert db.get_changes(since=seq) == [(seq + 1, "*", "reload")]
+
+    vault = PartitionedDatabaseManager(str(tmp_path / "parts"))
+    with vault.bulk_load() as session:
+        session.write([make_paper("old", year=2020), make_paper("new", year=2024)])
+    assert [(pid, op) for _, pid, op in vault.get_changes()] == [("*", "reload")]
+    assert vault.count_papers() == 2
+
+
+def test_append_only_feed_is_migrated(tmp_path):
+    import sqlite3
+
+    path = str(tmp_path / "old.db")
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE paper_changes (seq INTEGER PRIMARY KEY AUTOINCREMENT, paper_id TEXT NOT NULL, "
+                     "op TEXT NOT NULL, changed_at TIMESTAMP)")
+        conn.executemany("INSERT INTO paper_changes (paper_id, op) VALUES (?, ?)",
+                         [("a", "insert"), ("b", "insert"), ("a", "update")])
+
+    db = DatabaseManager(db_path=path)
+    assert db.get_changes() == [(2, "b", "insert"), (3, "a", "insert")]
+    assert db.get_changes(since=1) == [(2, "b", "insert"), (3, "a", "update")]
+    db.save_paper(make_paper("c"))
+    assert db.get_changes(since=3) == [(4, "c", "insert")]
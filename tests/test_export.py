@@ -0,0 +1,116 @@
+import csv
+import io
+import json
+
+import pytest
+from conftest import make_paper
+from fastapi.testclient import TestClient
+
+from deep_reader.models import Paper
+from deep_reader.server import app as app_module
+from deep_reader.storage.export import iter_csv, write_export
+
+
+@pytest.fixture
+def db(db):
+    db.save_papers(
+        make_paper(
+            f"2301.{i:05d}",
+            f"Diffusion Paper {i}" if i % 2 else f"Other Paper {i}",
+            "Summary, with a comma",
+            categories=("cs.AI", "cs.LG"),
+            year=2023,
+            month=1,
+            day=1 + i,
+            authors=["Ada Lovelace", f"Author {i}"],
+        )
+        for i in range(7)
+    )
+    return db
+
+
+def test_iter_paper_rows_streams_in_chunks(db):
+    chunks = list(db.iter_paper_rows(chunk_size=3))
+
+    assert [len(c) for c in chunks] == [3, 3, 1]
+    first = chunks[0][0]
+    assert first["arxiv_id"] == "2301.00006"  # newest first
+    assert sorted(first["authors"]) == ["Ada Lovelace", "Author 6"]
+    assert first["categories"] == ["cs.AI", "cs.LG"]
+    # Rows round-trip into the API model
+    assert Paper(**first).published_date.day == 7
+
+
+def test_write_export_ndjson_and_csv(db):
+    out = io.BytesIO()
+    assert write_export(db.iter_paper_rows(topic="diffusion"), "ndjson", out) == 3
+    lines = out.getvalue().decode().splitlines()
+    assert {json.loads(line)["arxiv_id"] for line in lines} == {"2301.00001", "2301.00003", "2301.00005"}
+
+    text = b"".join(iter_csv(db.iter_paper_rows(chunk_size=2))).decode()
+    rows = list(csv.DictReader(io.StringIO(text)))
+    assert len(rows) == 7
+    assert rows[0]["summary"] == "Summary, with a comma"
+    assert rows[0]["categories"] == "cs.AI; cs.LG"
+
+
+def test_write_export_rejects_unknown_format(db):
+    with pytest.raises(ValueError):
+        write_export(db.iter_paper_rows(), "xml", io.BytesIO())
+
+
+def test_export_endpoint_streams(db, monkeypatch):
+    monkeypatch.setattr(app_module, "db_manager", db)
+    client = TestClient(app_module.app)
+
+    response = client.get("/api/papers/export", params={"format": "ndjson", "start_date": "2023-01-05"})
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    assert len(response.text.splitlines()) == 3
+
+    response = client.get("/api/papers/export", params={"format": "csv"})
+    assert response.status_code == 200
+    assert len(response.text.splitlines()) == 8  # header + rows
+
+
+def test_export_passes_through_unparseable_dates(db):
+    with db._get_connection() as conn:
+        conn.execute("UPDATE papers SET published_date = NULL, updated_date = 'sometime' WHERE arxiv_id = '2301.00003'")
+        conn.commit()
+
+    rows = {row["arxiv_id"]: row for chunk in db.iter_paper_rows(chunk_size=2) for row in chunk}
+    assert len(rows) == 7
+    assert rows["2301.00003"]["published_date"] is None
+    assert rows["2301.00003"]["updated_date"] == "sometime"
+    assert rows["2301.00004"]["published_date"].startswith("2023-01-05")
+
+
+def test_parquet_export_without_pyarrow_closes_rows(db, monkeypatch):
+    import inspect
+
+    def missing_pyarrow(chunks, path):
+        raise ImportError("pyarrow package is required")
+
+    generators = []
+
+    def iter_rows(**kwargs):
+        generators.append(db.iter_paper_rows(**kwargs))
+        return generators[-1]
+
+    monkeypatch.setattr(app_module, "write_parquet", missing_pyarrow)
+    monkeypatch.setattr(app_module, "db_manager", type("Vault", (), {"iter_paper_rows": staticmethod(iter_rows)})())
+    response = TestClient(app_module.app).get("/api/papers/export", params={"format": "parquet"})
+
+    assert response.status_code == 501
+    assert inspect.getgeneratorstate(generators[0]) == inspect.GEN_CLOSED
+
+
+def test_write_export_parquet(db, tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "papers.parquet"
+
+    assert write_export(db.iter_paper_rows(chunk_size=4), "parquet", str(path)) == 7
+
+    parquet = pq.ParquetFile(path)
+    assert parquet.metadata.num_rows == 7
+    assert parquet.metadata.num_row_groups == 2
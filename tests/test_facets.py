@@ -0,0 +1,88 @@
+import sqlite3
+
+import pytest
+from conftest import make_paper
+from fastapi.testclient import TestClient
+
+from deep_reader.server import app as app_module
+from deep_reader.storage.db_manager import DatabaseManager
+
+
+@pytest.fixture
+def db(db):
+    db.save_papers([
+        make_paper("2403.00001", "Diffusion for text", categories=["cs.CL", "cs.AI"], month=3, day=1),
+        make_paper("2403.00002", categories=["cs.CV"], month=3, day=1),
+        make_paper("2403.00003", "Diffusion for speech", categories=["cs.CL"], month=3, day=2),
+        make_paper("2403.00004", categories=["cs.CLX"], month=3, day=3),  # must not be counted as cs.CL
+    ])
+    return db
+
+
+def aggregates(db):
+    with sqlite3.connect(db.db_path) as conn:
+        return (
+            sorted(conn.execute("SELECT * FROM daily_counts")),
+            sorted(conn.execute("SELECT * FROM daily_category_counts")),
+            sorted(conn.execute("SELECT * FROM paper_categories")),
+        )
+
+
+def test_incremental_aggregates_match_rebuild(db):
+    # Move a paper to another day and change its categories, then re-save unchanged ones
+    db.save_paper(make_paper("2403.00001", categories=["cs.CL", "cs.LG"], month=3, day=2))
+    db.save_paper(make_paper("2403.00002", categories=["cs.CV"], month=3, day=1))
+    db.save_papers([make_paper("2403.00005", categories=["cs.AI"], month=3, day=3), make_paper("2403.00005", categories=["cs.AI"], month=3, day=4)])
+
+    incremental = aggregates(db)
+    with sqlite3.connect(db.db_path) as conn:
+        db._rebuild_facets(conn.cursor())
+        conn.commit()
+    assert incremental == aggregates(db)
+    assert ("2024-03-03", 1) in incremental[0]  # day 3 only has the cs.CLX paper now
+
+
+def test_category_filter_is_exact(db):
+    assert db.count_papers_filtered(category="cs.CL") == 2
+    assert {p.arxiv_id for p in db.get_recent_papers(category="cs.CL")} == {"2403.00001", "2403.00003"}
+    assert db.count_papers_filtered(category="cs.CL", start_date="2024-03-02") == 1
+    assert db.count_papers_filtered(start_date="2024-03-02", end_date="2024-03-02") == 1
+
+
+def test_facets(db):
+    facets = db.get_facets()
+    assert facets["total"] == 4
+    assert facets["categories"][0] == ("cs.CL", 2)
+    assert facets["dates"] == [("2024-03-01", 2), ("2024-03-02", 1), ("2024-03-03", 1)]
+
+    by_category = db.get_facets(category="cs.CL")
+    assert by_category["dates"] == [("2024-03-01", 1), ("2024-03-02", 1)]
+    assert dict(by_category["categories"]) == {"cs.CL": 2, "cs.AI": 1}
+
+    by_topic = db.get_facets(topic="diffusion", end_date="2024-03-01")
+    assert by_topic["total"] == 1
+    assert dict(by_topic["categories"]) == {"cs.CL": 1, "cs.AI": 1}
+
+
+def test_existing_vault_is_migrated(db):
+    with sqlite3.connect(db.db_path) as conn:
+        conn.execute("DROP TABLE paper_categories")
+        conn.execute("DROP TABLE daily_counts")
+        conn.execute("DROP TABLE daily_category_counts")
+
+    migrated = DatabaseManager(db_path=db.db_path)
+    assert migrated.get_facets()["total"] == 4
+    assert migrated.count_papers_filtered(category="cs.CL") == 2
+
+
+def test_facets_endpoint(db, monkeypatch):
+    monkeypatch.setattr(app_module, "db_manager", db)
+    client = TestClient(app_module.app)
+
+    response = client.get("/api/facets", params={"start_date": "2024-03-02"})
+    assert response.status_code == 200
+    body = response.json()
+    assert body["total"] == 2
+    assert {c["value"] for c in body["categories"]} == {"cs.CL", "cs.CLX"}
+
+    assert client.get("/api/papers", params={"category": "cs.CL"}).json()["total"] == 2
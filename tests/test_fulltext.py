@@ -0,0 +1,156 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from conftest import make_paper
+from fastapi.testclient import TestClient
+
+from deep_reader.collector.pdf_fetcher import PdfDownloader
+from deep_reader.fulltext import run_fulltext
+from deep_reader.server import app as app_module
+from deep_reader.storage.fulltext import FullTextStore, chunk_text
+
+
+def make_pdf(text: str) -> bytes:
+    """Builds a one-page PDF showing `text`."""
+    stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode("latin-1")
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] /Contents 4 0 R "
+        b"/Resources << /Font << /F1 5 0 R >> >> >>",
+        b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+    ]
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for i, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % i + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % o for o in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return out
+
+
+class PdfServer:
+    """Local stand-in for arxiv.org/pdf: honours Range requests and can drop connections."""
+
+    def __init__(self, files):
+        self.files = files
+        self.truncate_first = set()  # paths whose first response is cut short
+        self.requests = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                server.requests.append((self.path, self.headers.get("Range")))
+                body = server.files.get(self.path)
+                if body is None:
+                    self.send_error(404)
+                    return
+                start = 0
+                if self.headers.get("Range"):
+                    start = int(self.headers["Range"].split("=")[1].rstrip("-"))
+                    self.send_response(206)
+                else:
+                    self.send_response(200)
+                self.send_header("Content-Length", str(len(body) - start))
+                self.end_headers()
+                if self.path in server.truncate_first:
+                    server.truncate_first.discard(self.path)
+                    self.wfile.write(body[start:start + len(body) // 2])
+                    self.wfile.flush()
+                    self.connection.shutdown(2)
+                    return
+                self.wfile.write(body[start:])
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def server():
+    server = PdfServer({
+        "/pdf/1": make_pdf("Sparse attention kernels for long context transformers " * 3),
+        "/pdf/2": make_pdf("Protein folding with equivariant graph networks " * 3),
+    })
+    yield server
+    server.close()
+
+
+@pytest.fixture
+def db(db, server):
+    db.save_papers([
+        make_paper(f"2401.0000{i}", f"Paper {i}", "Abstract", categories=("cs.LG",), pdf_url=f"{server.url}/pdf/{i}")
+        for i in (1, 2, 3)  # /pdf/3 does not exist
+    ])
+    return db
+
+
+def test_chunk_text_overlaps_and_respects_size():
+    text = " ".join(f"word{i}" for i in range(1000))
+    chunks = chunk_text(text, chunk_chars=200, overlap=50)
+    assert all(len(c) <= 200 for c in chunks)
+    assert chunks[0].split()[0] == "word0" and chunks[-1].split()[-1] == "word999"
+    assert chunks[1].split()[0] in chunks[0]
+
+
+def test_store_roundtrip_replace_and_search(tmp_path):
+    store = FullTextStore(str(tmp_path / "ft"))
+    store.add_document("a", ["diffusion models for audio", "second chunk about vocoders"])
+    store.add_document("b", ["graph networks"])
+    assert store.get_chunks("a") == ["diffusion models for audio", "second chunk about vocoders"]
+    assert [h["paper_id"] for h in store.search("vocoders")] == ["a"]
+
+    # Replacing a document drops its old terms from the index
+    store.add_document("a", ["rewritten text"])
+    assert store.search("vocoders") == []
+    assert store.get_chunks("a") == ["rewritten text"]
+    assert store.stats()["blob_bytes"] > store.stats()["live_bytes"]
+    store.close()
+
+
+def test_download_resumes_after_dropped_connection(tmp_path, server):
+    server.files["/big"] = bytes(range(256)) * 2000
+    server.truncate_first.add("/big")
+    downloader = PdfDownloader(str(tmp_path / "pdfs"), retries=2, backoff_seconds=0)
+    path = downloader.download("big", f"{server.url}/big")
+    assert path.read_bytes() == server.files["/big"]
+    ranges = [r for p, r in server.requests if p == "/big"]
+    # The retry asks only for the bytes that were not received yet
+    assert ranges[0] is None and int(ranges[1].split("=")[1].rstrip("-")) > 0
+
+
+def test_run_fulltext_indexes_and_skips_finished_work(tmp_path, db, server):
+    store = FullTextStore(str(tmp_path / "ft"))
+    downloader = PdfDownloader(str(tmp_path / "pdfs"), retries=0, backoff_seconds=0)
+
+    stats = run_fulltext(db=db, store=store, downloader=downloader, workers=1, max_attempts=2)
+    assert (stats["indexed"], stats["failed"]) == (2, 1)
+    assert [h["paper_id"] for h in store.search("equivariant")] == ["2401.00002"]
+    assert not list((tmp_path / "pdfs").glob("*.pdf"))
+
+    # Only the failed paper is retried, and only until max_attempts
+    assert run_fulltext(db=db, store=store, downloader=downloader, workers=1, max_attempts=2)["attempted"] == 1
+    assert run_fulltext(db=db, store=store, downloader=downloader, workers=1, max_attempts=2)["attempted"] == 0
+
+    app_module._fulltext_store = store
+    try:
+        client = TestClient(app_module.app)
+        hits = client.get("/api/search/fulltext", params={"q": "sparse attention"}).json()["items"]
+        assert hits[0]["paper_id"] == "2401.00001"
+        assert client.get("/api/papers/2401.00001/fulltext").json()["chunks"]
+        assert client.get("/api/papers/2401.00003/fulltext").status_code == 404
+        assert client.get("/api/search/fulltext", params={"q": '"unbalanced'}).status_code == 400
+    finally:
+        app_module._fulltext_store = None
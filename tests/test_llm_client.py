@@ -0,0 +1,79 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from deep_reader.intelligence import Provider, available_providers, register_provider
+from deep_reader.intelligence.llm_client import LLMClient
+
+
+class EchoProvider(Provider):
+    instances = 0
+
+    def __init__(self, api_key, base_url=None, model_name=None):
+        EchoProvider.instances += 1
+        self.model_name = model_name
+
+    def complete(self, prompt: str) -> str:
+        return f"{self.model_name}: {len(prompt)}"
+
+
+def test_provider_is_created_on_first_use():
+    register_provider("echo", EchoProvider)
+    EchoProvider.instances = 0
+
+    llm = LLMClient(provider="echo", api_key="key", model_name="tiny")
+    assert "echo" in available_providers()
+    assert EchoProvider.instances == 0
+
+    assert llm.generate_summary("abstract").startswith("tiny: ")
+    llm.generate_summary("again")
+    assert EchoProvider.instances == 1
+
+
+def test_missing_key_disables_generation():
+    llm = LLMClient(provider="google", api_key=None)
+    llm.api_key = None  # ignore keys from the environment
+
+    assert not llm.is_configured
+    assert llm.generate_summary("abstract") == "Summary unavailable (LLM not configured)."
+
+
+def test_unknown_provider():
+    with pytest.raises(NotImplementedError):
+        LLMClient(provider="nope", api_key="key")
+
+
+def test_server_import_skips_ingestion_stack(tmp_path):
+    code = (
+        "import sys, deep_reader.server.app; "
+        "print(','.join(m for m in ('google.generativeai', 'openai', 'arxiv', 'smtplib') if m in sys.modules))"
+    )
+    out = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True,
+                         env={"PYTHONPATH": str(Path(__file__).parent.parent / "src"), "DEEP_READER_DB": str(tmp_path / "vault.db")})
+    assert out.stdout.strip() == ""
+
+
+def test_provider_must_implement_complete():
+    class Incomplete(Provider):
+        pass
+
+    with pytest.raises(TypeError):
+        Incomplete()
+
+
+def test_provider_setup_errors_are_raised_once_not_stored():
+    attempts = []
+
+    def missing_sdk(**kwargs):
+        attempts.append(kwargs)
+        raise ImportError("the SDK is not installed")
+
+    register_provider("broken", missing_sdk)
+    llm = LLMClient(provider="broken", api_key="key")
+    with pytest.raises(ImportError):
+        llm.generate_summary("abstract")
+    with pytest.raises(ImportError):
+        llm.generate_key_insights("abstract")
+    assert len(attempts) == 1
@@ -0,0 +1,105 @@
+from unittest.mock import MagicMock, patch
+
+import smtplib
+
+import pytest
+from conftest import make_paper
+
+from deep_reader.models import Subscriber
+from deep_reader.notifier.email_service import EmailNotifier
+from deep_reader.notifier.matching import AhoCorasick, DigestRouter
+
+
+def test_aho_corasick_finds_overlapping_patterns():
+    matcher = AhoCorasick(["he", "she", "his", "hers"])
+    found = sorted((start, matcher.patterns[i]) for start, i in matcher.iter_matches("ushers"))
+    assert found == [(1, "she"), (2, "he"), (2, "hers")]
+
+
+def test_router_applies_keyword_and_category_rules():
+    subscribers = [
+        Subscriber(email="rag@x", keywords=["RAG", "retrieval augmented"]),
+        Subscriber(email="nlp@x", categories=["cs.CL"]),
+        Subscriber(email="both@x", keywords=["diffusion"], categories=["cs.CV"]),
+        Subscriber(email="all@x"),
+    ]
+    papers = [
+        make_paper("1", "Retrieval\nAugmented generation", categories=("cs.CL",)),
+        make_paper("2", "Diffusion storage formats", categories=("cs.CV",)),  # "storage" is not "rag"
+        make_paper("3", "Diffusion for text", categories=("cs.CL",)),
+        make_paper("4", "A RAG benchmark"),
+    ]
+    routed = {s.email: [p.arxiv_id for p in ps] for s, ps in DigestRouter(subscribers).route(papers)}
+    assert routed == {
+        "rag@x": ["1", "4"],
+        "nlp@x": ["1", "3"],
+        "both@x": ["2"],
+        "all@x": ["1", "2", "3", "4"],
+    }
+
+
+def test_subscribers_are_stored(db):
+    db.save_subscriber(Subscriber(email="a@x", keywords=["llm"]))
+    db.save_subscriber(Subscriber(email="b@x", active=False))
+    db.save_subscriber(Subscriber(email="a@x", keywords=["agents"], name="Ada"))
+    assert db.list_subscribers() == [Subscriber(email="a@x", keywords=["agents"], name="Ada")]
+    assert len(db.list_subscribers(active_only=False)) == 2
+    assert db.delete_subscriber("b@x") and not db.delete_subscriber("b@x")
+
+
+@patch("smtplib.SMTP")
+@patch.dict("os.environ", {"SMTP_USER": "bot@example.com", "SMTP_PASSWORD": "pw"})
+def test_digests_share_one_smtp_session(mock_smtp):
+    server = MagicMock()
+    # The server drops the session once; the notifier reconnects and carries on
+    server.send_message.side_effect = [None, smtplib.SMTPServerDisconnected("bye"), None, None]
+    mock_smtp.return_value = server
+
+    paper = make_paper("1", "Paper")
+    digests = [(Subscriber(email=f"user{i}@x", name=f"User {i}", keywords=["paper"]), [paper]) for i in range(3)]
+    notifier = EmailNotifier()
+    notifier.outbox.backoff_seconds = 0
+    assert notifier.send_digests(digests) == 3
+    server.quit.assert_not_called()
+    notifier.close()
+
+    assert mock_smtp.call_count == 2
+    assert server.login.call_count == 2
+    recipients = [c.args[0]["To"] for c in server.send_message.call_args_list]
+    assert recipients == ["user0@x", "user1@x", "user1@x", "user2@x"]
+    server.quit.assert_called_once()
+
+
+def test_cycle_fans_out_to_subscribers(db):
+    from benchmarks.synthetic import FakeArxivCollector, FakeLLMClient, FakeNotifier, SyntheticCorpus
+    from deep_reader.core_loop import run_daily_cycle
+
+    corpus = SyntheticCorpus(size=10)
+    papers = list(corpus.papers(0, 10))
+    db.save_subscriber(Subscriber(email="cat@x", categories=[papers[0].primary_category]))
+    db.save_subscriber(Subscriber(email="none@x", keywords=["no such phrase anywhere"]))
+
+    notifier = FakeNotifier()
+    run_daily_cycle(collector=FakeArxivCollector(corpus, limit=10), db=db, notifier=notifier, llm=FakeLLMClient())
+    assert [email for email, _ in notifier.digests] == ["cat@x"]
+    assert all(papers[0].primary_category in p.categories for p in notifier.digests[0][1])
+
+
+def test_cycle_closes_notifier_when_sending_fails(db):
+    from benchmarks.synthetic import FakeArxivCollector, FakeLLMClient, FakeNotifier, SyntheticCorpus
+    from deep_reader.core_loop import run_daily_cycle
+
+    class FailingNotifier(FakeNotifier):
+        closed = False
+
+        def send_daily_digest(self, papers):
+            raise RuntimeError("smtp down")
+
+        def close(self):
+            self.closed = True
+
+    notifier = FailingNotifier()
+    with pytest.raises(RuntimeError):
+        run_daily_cycle(collector=FakeArxivCollector(SyntheticCorpus(size=5), limit=5), db=db,
+                        notifier=notifier, llm=FakeLLMClient())
+    assert notifier.closed
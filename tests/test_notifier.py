@@ -1,5 +1,5 @@
 import pytest
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 from datetime import datetime, timezone
 from deep_reader.notifier.email_service import EmailNotifier
 from deep_reader.models import Paper
@@ -28,8 +28,7 @@ def sample_papers():
 })
 def test_send_daily_digest(mock_smtp, sample_papers):
     # Setup mock
-    mock_server = MagicMock()
-    mock_smtp.return_value.__enter__.return_value = mock_server
+    mock_server = mock_smtp.return_value
     
     notifier = EmailNotifier()
     notifier.send_daily_digest(sample_papers)
@@ -45,6 +44,8 @@ def test_send_daily_digest(mock_smtp, sample_papers):
     msg = args[0]
     assert msg["To"] == "user@example.com"
     assert "DeepReader Daily Digest" in msg["Subject"]
+    assert msg.get_content_type() == "multipart/alternative"
+    assert [part.get_content_type() for part in msg.get_payload()] == ["text/plain", "text/html"]
 
 def test_send_no_papers():
     notifier = EmailNotifier()
@@ -0,0 +1,143 @@
+import socket
+from datetime import datetime, timezone
+from email import message_from_bytes, policy
+from email.message import EmailMessage
+
+from benchmarks.smtp_sink import SmtpSink
+from deep_reader.models import Paper
+from deep_reader.notifier.outbox import SmtpOutbox
+from deep_reader.notifier.templates import render_digest
+
+
+def make_message(i: int) -> EmailMessage:
+    msg = EmailMessage()
+    msg["From"] = "bot@example.com"
+    msg["To"] = f"reader{i}@example.com"
+    msg["Subject"] = f"Digest {i}"
+    msg.set_content(f"Body {i}\n.leading dot\n")
+    return msg
+
+
+def make_outbox(port: int, tmp_path, **kwargs) -> SmtpOutbox:
+    return SmtpOutbox("127.0.0.1", port, starttls=False, spool_dir=str(tmp_path / "spool"),
+                      backoff_seconds=0, **kwargs)
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def test_render_digest_escapes_html_and_has_text_alternative():
+    paper = Paper(
+        arxiv_id="2401.00001",
+        title="Bounds for <b> & friends",
+        authors=["A. O'Neil"],
+        summary="x" * 600,
+        published_date=datetime(2024, 1, 2, tzinfo=timezone.utc),
+        updated_date=datetime(2024, 1, 2, tzinfo=timezone.utc),
+        primary_category="cs.LG",
+        categories=["cs.LG"],
+        pdf_url=None,
+    )
+    digest = render_digest("Daily <Papers>", [paper] * 3, intro="3 new papers")
+
+    assert "Bounds for &lt;b&gt; &amp; friends" in digest.html
+    assert "Daily &lt;Papers&gt;" in digest.html and "<b>" not in digest.html
+    assert digest.html.count("https://arxiv.org/abs/2401.00001") == 3
+    assert "Bounds for <b> & friends" in digest.text
+    assert "x" * 500 + "..." in digest.text and "x" * 501 not in digest.text
+    assert digest.text.startswith("Daily <Papers>\n==============\n\n3 new papers\n")
+
+
+def test_outbox_reuses_one_session_under_load(tmp_path):
+    with SmtpSink() as sink, make_outbox(sink.port, tmp_path) as outbox:
+        assert outbox.send(make_message(i) for i in range(300)) == 300
+
+    assert sink.connections == 1
+    assert sink.recipients() == [f"reader{i}@example.com" for i in range(300)]
+    body = message_from_bytes(sink.messages[7][2], policy=policy.default).get_content()
+    assert body.splitlines() == ["Body 7", ".leading dot"]
+
+
+def test_outbox_reconnects_after_drops_without_duplicates(tmp_path):
+    with SmtpSink(drop_after=10) as sink, make_outbox(sink.port, tmp_path) as outbox:
+        assert outbox.send(make_message(i) for i in range(45)) == 45
+
+    assert sink.connections == 5
+    assert sink.recipients() == [f"reader{i}@example.com" for i in range(45)]
+
+
+def test_transient_errors_retry_and_permanent_ones_drop(tmp_path):
+    with SmtpSink() as sink, make_outbox(sink.port, tmp_path) as outbox:
+        sink.fail_next = 2
+        sink.refuse = {"reader1@example.com"}
+        assert outbox.send(make_message(i) for i in range(3)) == 2
+
+    assert sink.recipients() == ["reader0@example.com", "reader2@example.com"]
+    assert outbox.spooled() == 0
+
+
+def test_unreachable_server_spools_batch_after_first_failure(tmp_path, monkeypatch):
+    import smtplib
+
+    attempts = []
+
+    def refuse(*args, **kwargs):
+        attempts.append(args)
+        raise ConnectionRefusedError("down")
+
+    monkeypatch.setattr(smtplib, "SMTP", refuse)
+    outbox = make_outbox(free_port(), tmp_path, retries=2)
+    assert outbox.send(make_message(i) for i in range(50)) == 0
+
+    assert len(attempts) == 3
+    assert outbox.spooled() == 50
+
+
+def test_undeliverable_messages_are_spooled_and_flushed_in_order(tmp_path):
+    port = free_port()
+    outbox = make_outbox(port, tmp_path, retries=1)
+    assert outbox.send(make_message(i) for i in range(3)) == 0
+    assert outbox.spooled() == 3
+
+    # Once connecting fails, the rest of the batch is spooled without new attempts
+    assert outbox.send(make_message(i) for i in range(3, 6)) == 0
+    assert outbox.spooled() == 6
+
+    with SmtpSink(port=port) as sink:
+        # The next send delivers the spool first, oldest message first
+        assert outbox.send([make_message(6)]) == 1
+        outbox.close()
+
+    assert outbox.spooled() == 0
+    assert sink.recipients() == [f"reader{i}@example.com" for i in range(7)]
+    assert sink.connections == 1
+
+
+def test_temporarily_refused_recipient_is_spooled_not_dropped(tmp_path):
+    with SmtpSink() as sink, make_outbox(sink.port, tmp_path, retries=1) as outbox:
+        sink.defer = {"reader1@example.com"}
+        assert outbox.send(make_message(i) for i in range(3)) == 2
+        assert outbox.spooled() == 1
+
+        sink.defer = set()
+        assert outbox.send([make_message(3)]) == 1
+
+    assert outbox.spooled() == 0
+    assert sink.recipients() == [f"reader{i}@example.com" for i in (0, 2, 1, 3)]
+
+
+def test_default_spool_dir_follows_the_vault(tmp_path, monkeypatch):
+    from deep_reader.notifier.email_service import EmailNotifier
+
+    monkeypatch.delenv("SMTP_SPOOL_DIR", raising=False)
+    monkeypatch.delenv("DEEP_READER_PARTITIONS", raising=False)
+    monkeypatch.setenv("DEEP_READER_DB", str(tmp_path / "data" / "deep_reader.db"))
+    monkeypatch.chdir(tmp_path / "..")
+    assert EmailNotifier().outbox.spool_dir == tmp_path / "data" / "mail_spool"
+
+    monkeypatch.setenv("DEEP_READER_PARTITIONS", "year")
+    monkeypatch.setenv("DEEP_READER_PARTITION_DIR", str(tmp_path / "vault"))
+    assert EmailNotifier().outbox.spool_dir == tmp_path / "vault" / "mail_spool"
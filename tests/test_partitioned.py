@@ -0,0 +1,178 @@
+import os
+
+import pytest
+from conftest import make_paper
+
+from deep_reader.models import Subscriber
+from deep_reader.storage.db_manager import DatabaseManager
+from deep_reader.storage.partitioned import MAX_ATTACHED, PartitionedDatabaseManager, migrate_to_partitions
+
+PAPERS = [
+    make_paper("2001", categories=("cs.CV",), year=2020),
+    make_paper("2101", "Diffusion models", categories=("cs.LG",), year=2021),
+    make_paper("2201", categories=("cs.LG",), year=2022, month=3),
+    make_paper("2202", "Diffusion for text", categories=("cs.CL", "cs.LG"), year=2022, month=9, authors=["A", "B"]),
+    make_paper("2301", categories=("cs.LG",), year=2023),
+]
+
+
+@pytest.fixture
+def vault(tmp_path):
+    vault = PartitionedDatabaseManager(str(tmp_path / "vault"))
+    vault.save_papers(PAPERS)
+    return vault
+
+
+@pytest.fixture
+def flat(db):
+    db.save_papers(PAPERS)
+    return db
+
+
+def test_papers_are_routed_to_yearly_files(vault, tmp_path):
+    assert [key for key, _, _ in vault.list_partitions()] == ["2023", "2022", "2021", "2020"]
+    assert (tmp_path / "vault" / "papers-2022.db").exists()
+    assert DatabaseManager(str(tmp_path / "vault" / "papers-2022.db")).count_papers() == 2
+    assert [key for key, _, _ in vault.list_partitions("2021-07-01", "2022-01-31")] == ["2022", "2021"]
+    assert vault.get_paper("2202").authors == ["A", "B"]
+    assert vault.get_paper("missing") is None
+
+
+@pytest.mark.parametrize("filters", [
+    {},
+    {"start_date": "2021-01-01", "end_date": "2022-06-30"},
+    {"topic": "diffusion"},
+    {"category": "cs.LG"},
+    {"topic": "diffusion", "category": "cs.CL"},
+])
+def test_queries_match_single_file_vault(vault, flat, filters):
+    for limit, offset in [(2, 0), (2, 1), (10, 3)]:
+        expected = [p.arxiv_id for p in flat.get_recent_papers(limit=limit, offset=offset, **filters)]
+        assert [p.arxiv_id for p in vault.get_recent_papers(limit=limit, offset=offset, **filters)] == expected
+    assert vault.count_papers_filtered(**filters) == flat.count_papers_filtered(**filters)
+    assert vault.get_facets(**filters) == flat.get_facets(**filters)
+    assert [r["arxiv_id"] for rows in vault.iter_paper_rows(**filters) for r in rows] == \
+           [r["arxiv_id"] for rows in flat.iter_paper_rows(**filters) for r in rows]
+
+
+def test_fan_out_beyond_attach_limit(tmp_path):
+    vault = PartitionedDatabaseManager(str(tmp_path / "monthly"), granularity="month")
+    papers = [make_paper(f"p{y}{m:02d}", year=y, month=m) for y in (2022, 2023) for m in range(1, 13)]
+    vault.save_papers(papers)
+    assert len(vault.list_partitions()) > MAX_ATTACHED
+    assert vault.count_papers() == 24
+    assert [p.arxiv_id for p in vault.get_recent_papers(limit=3, offset=11)] == ["p202301", "p202212", "p202211"]
+
+
+def test_frozen_partitions_are_immutable(vault):
+    assert vault.freeze_before("2022") == ["2021", "2020"]
+    path = dict((k, p) for k, p, _ in vault.list_partitions())["2021"]
+    assert not os.access(path, os.W_OK) or os.geteuid() == 0  # root ignores file modes
+    with pytest.raises(PermissionError):
+        vault.save_paper(make_paper("2102", year=2021))
+    # Still readable, through read-only immutable connections
+    assert vault.get_paper("2101").title == "Diffusion models"
+    assert vault.count_papers_filtered(topic="diffusion") == 2
+    # Frozen partitions are left out of the summary backfill
+    assert {r["arxiv_id"] for r in vault.get_backfill_candidates()} == {"2201", "2202", "2301"}
+
+    vault.thaw_partition("2021")
+    vault.save_paper(make_paper("2102", year=2021))
+    assert vault.count_papers() == 6
+
+
+def test_freeze_and_thaw_from_another_process(vault, tmp_path):
+    # The vault fixture plays the long-running server; `cli` is a second manager on the same files
+    assert vault.get_paper("2101").title == "Diffusion models"
+    cli = PartitionedDatabaseManager(str(tmp_path / "vault"))
+
+    cli.freeze_partition("2021")
+    assert vault.get_paper("2101").title == "Diffusion models"
+    assert vault._manager("2021").read_only
+
+    cli.thaw_partition("2021")
+    vault.save_paper(make_paper("2102", year=2021))
+    assert vault.get_paper("2102") is not None
+    assert not vault._manager("2021").read_only
+
+
+def test_moved_paper_leaves_no_duplicate(vault, flat):
+    vault.update_intelligence([("2201", "Stored summary", None)])
+    for db in (vault, flat):
+        db.save_paper(make_paper("2101", "Republished", year=2023))
+    assert vault.count_papers() == 5
+    assert vault.get_paper("2101").title == "Republished"
+    assert vault.get_facets() == flat.get_facets()
+    assert [p.arxiv_id for p in vault.get_recent_papers(limit=10)] == [p.arxiv_id for p in flat.get_recent_papers(limit=10)]
+
+    # Metadata-only writes carry the stored summary over to the new partition
+    with vault.bulk_load() as session:
+        session.write([make_paper("2201", year=2020)])
+    assert vault.count_papers() == 5
+    assert vault.get_paper("2201").llm_summary == "Stored summary"
+    assert vault.count_papers_filtered(start_date="2022-01-01", end_date="2022-12-31") == 1
+
+
+def test_migrate_from_single_file(flat, tmp_path):
+    flat.save_recommendations("default", [("2301", 0.5)])
+    subscriber = Subscriber(email="ada@example.com", name="Ada", keywords=["diffusion"], categories=["cs.LG"])
+    flat.save_subscriber(subscriber)
+    vault = PartitionedDatabaseManager(str(tmp_path / "migrated"))
+    assert migrate_to_partitions(flat, vault) == 5
+    assert vault.count_papers() == 5
+    assert vault.get_facets() == flat.get_facets()
+    assert vault.get_recommendations("default") == [("2301", 0.5)]
+    assert vault.list_subscribers() == [subscriber]
+
+
+def test_cycle_over_frozen_range(vault):
+    from benchmarks.synthetic import FakeLLMClient, FakeNotifier
+    from deep_reader.core_loop import run_daily_cycle
+
+    class Refetch:
+        def fetch_papers(self, query, max_results):
+            # Unchanged papers of frozen years, one new paper for a frozen year and one for an open year
+            return [PAPERS[0], PAPERS[1], make_paper("2102", year=2021), make_paper("2302", year=2023)]
+
+    vault.freeze_before("2022")
+    notifier = FakeNotifier()
+    run_daily_cycle(start_date_str="2020-01-01", end_date_str="2024-12-31", collector=Refetch(), db=vault,
+                    notifier=notifier, llm=FakeLLMClient())
+
+    assert [p.arxiv_id for p in notifier.sent[0]] == ["2302"]
+    assert vault.get_paper("2302") is not None and vault.get_paper("2102") is None
+    assert vault.count_papers() == 6
+
+
+def test_frozen_partition_rejects_batches_before_writing(vault):
+    vault.freeze_partition("2020")
+    with pytest.raises(PermissionError):
+        vault.save_papers([make_paper("2302", year=2023), make_paper("2002", year=2020)])
+    assert vault._manager("2023").get_paper("2302") is None
+    # Moving a paper out of a frozen partition would have to delete it there
+    with pytest.raises(PermissionError):
+        vault.save_paper(make_paper("2001", categories=("cs.CV",), year=2023))
+
+
+def test_intelligence_update_touching_frozen_partition_writes_nothing(vault):
+    vault.freeze_partition("2020")
+    seq = vault.get_change_seq()
+    with pytest.raises(PermissionError):
+        vault.update_intelligence([("2301", "New summary", None), ("2001", "Old summary", None)])
+    assert vault.get_paper("2301").llm_summary is None
+    assert vault.get_change_seq() == seq
+
+
+def test_migration_skips_rows_without_a_usable_date(flat, tmp_path, capsys):
+    import sqlite3
+
+    with sqlite3.connect(flat.db_path) as conn:
+        conn.execute("INSERT INTO papers (arxiv_id, title, summary, published_date, updated_date, primary_category, "
+                     "categories) VALUES ('nodate', 'T', 'S', NULL, NULL, 'cs.LG', '[\"cs.LG\"]')")
+        conn.execute("INSERT INTO papers (arxiv_id, title, summary, published_date, updated_date, primary_category, "
+                     "categories) VALUES ('baddate', 'T', 'S', 'sometime', 'sometime', 'cs.LG', '[\"cs.LG\"]')")
+
+    vault = PartitionedDatabaseManager(str(tmp_path / "migrated"))
+    assert migrate_to_partitions(flat, vault) == 5
+    assert vault.count_papers() == 5
+    assert "2 papers could not be migrated: baddate, nodate" in capsys.readouterr().out
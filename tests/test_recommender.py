@@ -0,0 +1,159 @@
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+import pytest
+from conftest import make_paper
+from fastapi.testclient import TestClient
+
+from deep_reader.core_loop import run_daily_cycle
+from deep_reader.recommender.embedding import HashingEmbedder
+from deep_reader.recommender.engine import RecommendationEngine
+from deep_reader.server import app as app_module
+
+NOW = datetime(2024, 6, 1, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def db(db):
+    db.save_papers([
+        make_paper("g1", "Graph neural networks for molecules", "Message passing graph networks predict molecule properties."),
+        make_paper("g2", "Scalable graph neural networks", "Sampling neighbours makes graph networks scale to large graphs."),
+        make_paper("g3", "Graph networks for traffic", "Graph neural networks forecast traffic on road graphs.", published=NOW - timedelta(days=2000)),
+        make_paper("v1", "Vision transformers for segmentation", "Image patches and attention segment images."),
+        make_paper("v2", "Self-supervised image pretraining", "Masked image modelling pretrains vision encoders."),
+    ])
+    return db
+
+
+@pytest.fixture
+def engine(db):
+    engine = RecommendationEngine(db, half_life_days=180)
+    assert engine.index_new_papers() == 5
+    return engine
+
+
+def test_embedding_is_normalised_and_similar_for_related_text():
+    embedder = HashingEmbedder(dim=256)
+    a = embedder.embed_text("graph neural networks for molecules")
+    b = embedder.embed_text("molecules with graph neural networks")
+    c = embedder.embed_text("vision transformers segment images")
+    assert a.dtype == np.float32
+    assert np.linalg.norm(a) == pytest.approx(1.0, rel=1e-5)
+    assert a @ b > a @ c
+
+
+def test_interactions_update_profile_and_precomputed_top_k(engine, db):
+    assert engine.record_interaction("alice", "g1", "star")
+    assert not engine.record_interaction("alice", "g1", "star")  # duplicates do not count twice
+    assert db.get_reader_profile("alice")[1] == 1
+
+    ranked = engine.refresh("alice", now=NOW.timestamp())
+    ids = [pid for pid, _ in ranked]
+    assert "g1" not in ids  # already seen
+    assert ids[0] == "g2"
+    # The old graph paper matches, but recency decay ranks it below the fresh one
+    assert ids.index("g3") > ids.index("g2")
+    assert [pid for pid, _ in db.get_recommendations("alice")] == ids
+
+    papers = engine.recommend("alice", k=1)
+    assert [(p.arxiv_id) for p, _ in papers] == ["g2"]
+
+
+def test_new_vectors_are_picked_up_incrementally(engine, db):
+    engine.record_interaction("alice", "v1", "open")
+    new = make_paper("v3", "Vision transformers for detection", "Attention over image patches detects objects.")
+    db.save_paper(new)
+    engine.index_papers([new])
+    engine.refresh_all()
+    assert "v3" in [pid for pid, _ in db.get_recommendations("alice")]
+
+
+def test_reindexed_vectors_replace_loaded_ones(engine, db):
+    engine.record_interaction("alice", "g1", "star")
+    assert engine.refresh("alice", now=NOW.timestamp())[0][0] == "g2"
+
+    # v2 is re-indexed with text close to g1; the engine must score the new vector
+    engine.index_papers([make_paper("v2", "Graph neural networks for molecules",
+                                    "Message passing graph networks predict molecule properties.")])
+    ranked = engine.refresh("alice", now=NOW.timestamp())
+    assert ranked[0][0] == "v2"
+    assert engine._size == 5
+
+
+def test_concurrent_events_for_one_reader_are_all_applied(engine, db):
+    from concurrent.futures import ThreadPoolExecutor
+
+    events = [(pid, event) for pid in ("g1", "g2", "g3", "v1", "v2") for event in ("open", "star")]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(lambda e: engine.record_interaction("alice", *e), events))
+
+    assert all(results)
+    assert db.get_reader_profile("alice")[1] == len(events)
+
+
+def test_unknown_paper_and_event(engine):
+    with pytest.raises(KeyError):
+        engine.record_interaction("alice", "missing", "open")
+    with pytest.raises(ValueError):
+        engine.record_interaction("alice", "g1", "like")
+
+
+def test_cycle_falls_back_to_recommendations(engine, db):
+    from benchmarks.synthetic import FakeNotifier
+
+    class NoNewPapers:
+        def fetch_papers(self, query, max_results):
+            return [db.get_paper("g1")]
+
+    class NoLLM:
+        def generate_summary(self, text):
+            return "summary"
+
+    engine.record_interaction("default", "g1", "open")
+    notifier = FakeNotifier()
+    run_daily_cycle(category="cs.LG", collector=NoNewPapers(), db=db, notifier=notifier, llm=NoLLM(),
+                    recommender=engine)
+    assert notifier.sent == []
+    assert notifier.recommended and notifier.recommended[0][0].arxiv_id == "g2"
+
+
+def test_empty_fetch_falls_back_to_recommendations(engine, db):
+    from benchmarks.synthetic import FakeArxivCollector, FakeLLMClient, FakeNotifier, SyntheticCorpus
+
+    engine.record_interaction("default", "g1", "open")
+    notifier = FakeNotifier()
+    # limit=0: arXiv returned nothing at all for today's window
+    collector = FakeArxivCollector(SyntheticCorpus(10), limit=0)
+    run_daily_cycle(category="cs.LG", collector=collector, db=db, notifier=notifier, llm=FakeLLMClient(),
+                    recommender=engine)
+    assert notifier.sent == []
+    assert notifier.recommended and notifier.recommended[0][0].arxiv_id == "g2"
+
+
+def test_recommendations_api(engine, db, monkeypatch):
+    monkeypatch.setattr(app_module, "db_manager", db)
+    monkeypatch.setattr(app_module, "_recommender", engine)
+    client = TestClient(app_module.app)
+
+    assert client.post("/api/recommendations/events", json={"reader_id": "bob", "paper_id": "v1", "event": "star"}).json() == {"status": "recorded"}
+    assert client.post("/api/recommendations/events", json={"reader_id": "bob", "paper_id": "nope"}).status_code == 404
+
+    body = client.get("/api/recommendations", params={"reader_id": "bob", "k": 2}).json()
+    assert body["reader_id"] == "bob"
+    assert 1 <= len(body["items"]) <= 2
+    assert body["items"][0]["paper"]["arxiv_id"] == "v2"
+
+
+def test_triggered_cycles_reuse_the_api_engine(engine, db, monkeypatch):
+    from benchmarks.synthetic import FakeArxivCollector, FakeLLMClient, FakeNotifier, SyntheticCorpus
+
+    monkeypatch.setattr(app_module, "_recommender", engine)
+    engine.record_interaction("default", "g1", "open")  # loads the vault's vectors once
+    synced = []
+    load = db.load_paper_vectors
+    monkeypatch.setattr(db, "load_paper_vectors", lambda after_version=0: synced.append(after_version) or load(after_version))
+
+    collector = FakeArxivCollector(SyntheticCorpus(10), limit=3)
+    app_module.run_cycle_job(category="cs.LG", collector=collector, db=db, notifier=FakeNotifier(), llm=FakeLLMClient())
+    assert synced and 0 not in synced
+    assert engine._size == 8
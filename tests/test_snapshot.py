@@ -0,0 +1,102 @@
+import json
+import sqlite3
+
+import pytest
+from deep_reader.collector.snapshot import import_snapshot, parse_snapshot_record
+
+
+def make_record(i, categories="cs.CL cs.AI"):
+    return {
+        "id": f"2301.{i:05d}",
+        "submitter": "Someone",
+        "authors": "Ada Lovelace and Alan Turing",
+        "title": f"Paper\n  number {i}",
+        "categories": categories,
+        "abstract": "  We study\nthings.  ",
+        "versions": [
+            {"version": "v1", "created": "Mon, 2 Jan 2023 19:18:42 GMT"},
+            {"version": "v2", "created": "Tue, 10 Jan 2023 08:00:00 GMT"},
+        ],
+        "update_date": "2023-01-10",
+        "authors_parsed": [["Lovelace", "Ada", ""], ["Turing", "Alan", "Jr"]],
+    }
+
+
+@pytest.fixture
+def snapshot(tmp_path):
+    path = tmp_path / "snapshot.json"
+    lines = [json.dumps(make_record(i)) for i in range(10)]
+    lines.insert(3, "{not json")
+    lines.append(json.dumps(make_record(99, categories="hep-ph")))
+    path.write_text("\n".join(lines) + "\n")
+    return path
+
+
+def test_parse_snapshot_record():
+    paper = parse_snapshot_record(make_record(1))
+
+    assert paper.arxiv_id == "2301.00001v2"
+    assert paper.title == "Paper number 1"
+    assert paper.summary == "We study things."
+    assert paper.authors == ["Ada Lovelace", "Alan Turing Jr"]
+    assert paper.primary_category == "cs.CL"
+    assert paper.published_date.day == 2
+    assert paper.updated_date.day == 10
+    assert paper.llm_summary is None
+
+
+def test_import_resumes_from_checkpoint(snapshot, db, tmp_path):
+    checkpoint = tmp_path / "ckpt.json"
+
+    first = import_snapshot(str(snapshot), db=db, batch_size=2, checkpoint_path=str(checkpoint),
+                            limit=4, category_prefixes=["cs."])
+    assert not first["complete"]
+    assert db.count_papers() == 4
+
+    second = import_snapshot(str(snapshot), db=db, batch_size=2, checkpoint_path=str(checkpoint),
+                             category_prefixes=["cs."])
+    assert second["complete"]
+    assert second["imported"] == 10
+    assert second["skipped"] == 1
+    assert second["filtered"] == 1
+    assert second["offset"] == snapshot.stat().st_size
+    assert db.count_papers() == 10
+
+    # Secondary indexes are rebuilt after the bulk load
+    with sqlite3.connect(db.db_path) as conn:
+        names = {r[0] for r in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert "idx_papers_published_date" in names
+
+
+def test_reimport_keeps_llm_summary(snapshot, db):
+    import_snapshot(str(snapshot), db=db, checkpoint_path=str(snapshot) + ".a")
+    paper = db.get_paper("2301.00001v2")
+    db.save_paper(paper.model_copy(update={"llm_summary": "Kept"}))
+
+    import_snapshot(str(snapshot), db=db, restart=True, checkpoint_path=str(snapshot) + ".a")
+
+    assert db.get_paper("2301.00001v2").llm_summary == "Kept"
+    assert db.count_papers() == 11
+
+
+def test_crash_during_index_rebuild_leaves_import_incomplete(snapshot, db, tmp_path, monkeypatch):
+    checkpoint = tmp_path / "ckpt.json"
+
+    def crash(cursor):
+        raise RuntimeError("killed while rebuilding")
+
+    monkeypatch.setattr(db, "_rebuild_facets", crash)
+    with pytest.raises(RuntimeError):
+        import_snapshot(str(snapshot), db=db, checkpoint_path=str(checkpoint))
+    assert not json.loads(checkpoint.read_text())["complete"]
+
+    monkeypatch.undo()
+    state = import_snapshot(str(snapshot), db=db, checkpoint_path=str(checkpoint))
+    assert state["complete"]
+    assert db.get_facets()["total"] == db.count_papers() == 11
+
+
+def test_import_embeds_papers_for_recommendations(snapshot, db, tmp_path):
+    import_snapshot(str(snapshot), db=db, checkpoint_path=str(tmp_path / "ckpt.json"))
+    assert db.count_papers() == 11
+    assert db.get_papers_without_vectors() == []
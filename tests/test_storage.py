@@ -62,3 +62,27 @@ def test_save_duplicate_paper(db):
     assert db.count_papers() == 1
     retrieved = db.get_paper("2301.00002")
     assert retrieved.title == "Updated Title"
+
+def test_save_papers_bulk(db):
+    """Bulk save writes every paper and links authors shared across papers once."""
+    now = datetime.now(timezone.utc)
+    papers = [
+        Paper(
+            arxiv_id=f"2301.1000{i}",
+            title=f"Bulk Paper {i}",
+            authors=["Shared Author", f"Author {i}"],
+            summary="Summary",
+            published_date=now,
+            updated_date=now,
+            primary_category="cs.AI",
+            categories=["cs.AI"],
+        )
+        for i in range(5)
+    ]
+
+    written = db.save_papers(iter(papers), batch_size=2)
+
+    assert written == 5
+    assert db.count_papers() == 5
+    retrieved = db.get_paper("2301.10003")
+    assert sorted(retrieved.authors) == ["Author 3", "Shared Author"]
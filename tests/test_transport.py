@@ -0,0 +1,126 @@
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from deep_reader.collector.arxiv_client import ArxivCollector
+from deep_reader.collector.transport import ArxivTransport, FeedCache, ReplayMissError, cache_key
+
+TOTAL = 5
+
+ENTRY = """<entry>
+  <id>http://arxiv.org/abs/2401.0000{n}v1</id>
+  <updated>2024-01-0{d}T00:00:00Z</updated>
+  <published>2024-01-0{d}T00:00:00Z</published>
+  <title>Paper {n}</title>
+  <summary>Abstract {n}</summary>
+  <author><name>Author {n}</name></author>
+  <link href="http://arxiv.org/pdf/2401.0000{n}v1" rel="related" title="pdf" type="application/pdf"/>
+  <arxiv:primary_category term="cs.AI"/>
+  <category term="cs.AI"/>
+</entry>"""
+
+
+def feed(start: int, size: int) -> bytes:
+    entries = "".join(ENTRY.format(n=n, d=n + 1) for n in range(start, min(start + size, TOTAL)))
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<feed xmlns="http://www.w3.org/2005/Atom" xmlns:opensearch="http://a9.com/-/spec/opensearch/1.1/"
+      xmlns:arxiv="http://arxiv.org/schemas/atom">
+  <opensearch:totalResults>{TOTAL}</opensearch:totalResults>
+  <opensearch:startIndex>{start}</opensearch:startIndex>
+  <opensearch:itemsPerPage>{size}</opensearch:itemsPerPage>
+  {entries}
+</feed>""".encode("utf-8")
+
+
+class FeedServer:
+    """Serves a fixed five-paper Atom feed in pages, like export.arxiv.org/api/query."""
+
+    def __init__(self):
+        self.requests = []
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                params = parse_qs(urlsplit(self.path).query)
+                server.requests.append(int(params["start"][0]))
+                body = feed(int(params["start"][0]), int(params["max_results"][0]))
+                self.send_response(200)
+                self.send_header("Content-Type", "application/atom+xml")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}/api/query?{{}}"
+        threading.Thread(target=self.httpd.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+
+@pytest.fixture
+def server():
+    s = FeedServer()
+    yield s
+    s.close()
+
+
+def make_collector(server: FeedServer, tmp_path, mode: str, ttl: float = 3600) -> ArxivCollector:
+    collector = ArxivCollector(page_size=2, delay_seconds=0, cache_mode=mode,
+                               cache_dir=str(tmp_path / "cache"), cache_ttl=ttl)
+    collector.client.query_url_format = server.url
+    return collector
+
+
+def test_cache_key_normalizes_query_and_keeps_offset():
+    a = cache_key("https://export.arxiv.org/api/query?search_query=cat:cs.AI%20%20AND%20x&start=0&max_results=2")
+    b = cache_key("https://export.arxiv.org/api/query?max_results=2&start=0&search_query=cat:cs.AI+AND+x")
+    c = cache_key("https://export.arxiv.org/api/query?max_results=2&start=2&search_query=cat:cs.AI+AND+x")
+
+    assert a == b
+    assert a != c
+
+
+def test_cache_serves_pages_until_ttl(server, tmp_path):
+    first = make_collector(server, tmp_path, "cache").fetch_papers("cat:cs.AI", max_results=5)
+    assert [p.arxiv_id for p in first] == [f"2401.0000{n}v1" for n in range(5)]
+    assert server.requests == [0, 2, 4]
+
+    collector = make_collector(server, tmp_path, "cache")
+    assert collector.fetch_papers("cat:cs.AI", max_results=5) == first
+    assert server.requests == [0, 2, 4]
+    assert collector.transport.hits == 3
+
+    make_collector(server, tmp_path, "cache", ttl=0).fetch_papers("cat:cs.AI", max_results=5)
+    assert server.requests == [0, 2, 4] * 2
+
+
+def test_replay_never_touches_the_network(server, tmp_path):
+    recorded = make_collector(server, tmp_path, "record").fetch_papers("cat:cs.AI", max_results=5)
+    server.close()
+
+    replay = make_collector(server, tmp_path, "replay", ttl=0)
+    assert replay.fetch_papers("cat:cs.AI", max_results=5) == recorded
+    with pytest.raises(ReplayMissError):
+        replay.fetch_papers("cat:cs.CL", max_results=5)
+
+
+def test_identical_pages_are_stored_once(tmp_path):
+    cache = FeedCache(str(tmp_path))
+    cache.put("a", b"<feed/>")
+    cache.put("b", b"<feed/>")
+
+    assert cache.get("a") == cache.get("b") == b"<feed/>"
+    assert len(list((tmp_path / "pages").rglob("*.gz"))) == 1
+    assert len(list((tmp_path / "keys").glob("*.json"))) == 2
+
+
+def test_transport_rejects_unknown_mode(tmp_path):
+    with pytest.raises(ValueError):
+        ArxivTransport(FeedCache(str(tmp_path)), mode="sometimes")
@@ -1,7 +1,7 @@
 'use client';
 
-import { useEffect, useState, type FormEvent } from 'react';
-import { Paper, PaperListResponse } from '@/types/paper';
+import { useEffect, useRef, useState, type FormEvent } from 'react';
+import { JobEvent, Paper, PaperChangeEvent, PaperListResponse } from '@/types/paper';
 import { PaperCard } from '@/components/PaperCard';
 
 export default function Home() {
@@ -12,6 +12,48 @@ export default function Home() {
   const [startDate, setStartDate] = useState('');
   const [endDate, setEndDate] = useState('');
   const [daysToFetch, setDaysToFetch] = useState('1');
+  const [jobStatus, setJobStatus] = useState('');
+
+  // Filters currently applied to the list, read by the change stream handler
+  const appliedFilters = useRef({ topic: '', startDate: '', endDate: '' });
+
+  const describeJob = (event: JobEvent) => {
+    switch (event.stage) {
+      case 'queued':
+      case 'started':
+        return 'Fetch job running...';
+      case 'fetched':
+        return `Fetched ${event.papers} papers, analyzing...`;
+      case 'saved':
+        return `Saved ${event.done}/${event.total} papers (${event.new} new)...`;
+      case 'complete':
+        return `Fetch complete: ${event.new} new papers.`;
+      case 'failed':
+        return `Fetch failed: ${event.error}`;
+    }
+  };
+
+  const matchesFilters = (paper: Paper) => {
+    const { topic, startDate, endDate } = appliedFilters.current;
+    const day = paper.published_date.slice(0, 10);
+    if (startDate && day < startDate) return false;
+    if (endDate && day > endDate) return false;
+    const haystack = `${paper.title} ${paper.summary} ${paper.categories.join(' ')}`.toLowerCase();
+    return topic.toLowerCase().split(/\s+/).filter(Boolean).every((kw) => haystack.includes(kw));
+  };
+
+  // Apply pushed changes in place instead of re-fetching the page
+  const applyChange = (change: PaperChangeEvent) => {
+    const changed = change.paper;
+    if (!changed) return;
+    setPapers((current) => {
+      const rest = current.filter((p) => p.arxiv_id !== changed.arxiv_id);
+      if (!matchesFilters(changed)) return rest;
+      return [changed, ...rest]
+        .sort((a, b) => b.published_date.localeCompare(a.published_date))
+        .slice(0, Math.max(20, current.length));
+    });
+  };
 
   const buildParams = (overrides?: {
     topic?: string;
@@ -38,6 +80,7 @@ export default function Home() {
     endDate?: string;
   }) => {
     setLoading(true);
+    appliedFilters.current = { topic, startDate, endDate, ...overrides };
     try {
       const apiUrl = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000/api';
       const query = buildParams(overrides);
@@ -76,7 +119,7 @@ export default function Home() {
         body: JSON.stringify(body)
       });
       const data = await res.json();
-      alert(data.message || 'Fetch job started in background.');
+      setJobStatus(data.message || 'Fetch job started in background.');
     } catch (error) {
       alert('Failed to trigger job');
     } finally {
@@ -86,6 +129,20 @@ export default function Home() {
 
   useEffect(() => {
     fetchPapers();
+
+    // New and updated papers, and job progress, arrive over server-sent events.
+    // EventSource reconnects by itself and resumes from the last change it saw.
+    const apiUrl = process.env.NEXT_PUBLIC_API_URL || 'http://localhost:8000/api';
+    const source = new EventSource(`${apiUrl}/changes/stream`);
+    const onChange = (event: MessageEvent) => applyChange(JSON.parse(event.data));
+    source.addEventListener('insert', onChange);
+    source.addEventListener('update', onChange);
+    // Sent once after a bulk import instead of one event per paper
+    source.addEventListener('reload', () => fetchPapers());
+    source.addEventListener('job', (event: MessageEvent) => {
+      setJobStatus(describeJob(JSON.parse(event.data)) || '');
+    });
+    return () => source.close();
   }, []);
 
   const handleApplyFilters = (event: FormEvent) => {
@@ -128,6 +185,10 @@ export default function Home() {
           </div>
         </div>
 
+        {jobStatus && (
+          <p className="mb-4 text-sm text-gray-600" role="status">{jobStatus}</p>
+        )}
+
         <form
           onSubmit={handleApplyFilters}
           className="bg-white border border-gray-200 rounded-lg p-4 mb-6 shadow-sm"
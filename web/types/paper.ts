@@ -18,3 +18,23 @@ export interface PaperListResponse {
   limit: number;
   offset: number;
 }
+
+// Payload of `insert`/`update` events on /api/changes/stream
+export interface PaperChangeEvent {
+  seq: number;
+  op: 'insert' | 'update';
+  paper: Paper | null;
+}
+
+// Payload of `job` events on /api/changes/stream
+export interface JobEvent {
+  id: number;
+  job_id: string;
+  stage: 'queued' | 'started' | 'fetched' | 'saved' | 'complete' | 'failed';
+  papers?: number;
+  done?: number;
+  total?: number;
+  new?: number;
+  saved?: number;
+  error?: string;
+}